@@ -1,14 +1,23 @@
 import logging
+import os
 import discord
 from discord.ext import commands
 from bot.config.messager import Messager, init_messager
 from config.settings import settings
+from config.database import MongoDB
+from data_access import schema
+from data_access.commentator_state_dao import CommentatorStateDAO
 from data_access.fixture_dao import FixtureDAO
 from data_access.game_dao import GameDAO
+from data_access.hardware_history_dao import HardwareHistoryDAO
 from data_access.hardware_monitor_dao import HardwareMonitorDAO
 from data_access.influencer_dao import InfluencerDAO
 from data_access.news_dao import NewsDAO
 from data_access.self_destruct_message_dao import SelfDestructMessageDAO
+from integrations.utils.conditional_fetch import ConditionalFetcher
+from integrations.utils.http_client import HttpClient
+from integrations.utils.parsing_pool import ParsingPool
+from utils.loop_monitor import LoopLagMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +42,23 @@ class DiabloRobot(commands.Bot):
         self.games_dao = GameDAO()
         self.influencer_dao = InfluencerDAO()
         self.fixture_dao = FixtureDAO()
+        self.commentator_state_dao = CommentatorStateDAO()
         self.self_destruct_message_dao = SelfDestructMessageDAO()
         self.hardware_monitor_dao = HardwareMonitorDAO()
+        self.hardware_history_dao = HardwareHistoryDAO()
+        self.http_cache = ConditionalFetcher(os.path.join(settings.CACHE_DIR, "http_validators.json"))
+        self.http_client = HttpClient()
+        self.parsing_pool = ParsingPool(settings.PARSING_POOL_WORKERS, settings.PARSING_POOL_PROCESSES)
+        self.loop_monitor = LoopLagMonitor()
 
     async def setup_hook(self):
+        await self.http_client.start()
+        self.loop_monitor.start()
+        await schema.ensure_collections()
+        await schema.ensure_indexes()
+        if settings.DATABASE_AUDIT_QUERIES:
+            await schema.audit_query_plans()
+        await self.news_dao.warm_cache()
         await self.load_extension('bot.cogs.fixture_event_creator')
         await self.load_extension('bot.cogs.event_lifecycle_manager')
         await self.load_extension('bot.commands.ayuda')
@@ -50,6 +72,7 @@ class DiabloRobot(commands.Bot):
         await self.load_extension('bot.commands.limpiar')
         await self.load_extension('bot.commands.reiniciar')
         await self.load_extension('bot.commands.vpn')
+        await self.load_extension('bot.commands.historial_pc')
         await self.load_extension('bot.scheduled.fixture_check')
         await self.load_extension('bot.cogs.live_match_commentator')
         await self.load_extension('bot.scheduled.commentator_scheduler')
@@ -65,6 +88,15 @@ class DiabloRobot(commands.Bot):
         await self.load_extension('bot.listeners.music_agent')
         logger.info("Extensiones cargadas")
 
+    async def close(self):
+        if self.messager:
+            await self.messager.close()
+        await super().close()
+        self.loop_monitor.stop()
+        await self.http_client.close()
+        self.parsing_pool.shutdown()
+        await MongoDB.close()
+
     async def on_ready(self):
         self.get_cog('FixtureCheckScheduler').start_scheduled_job()
         self.get_cog('CommentatorScheduler').start_scheduled_job()
@@ -16,7 +16,7 @@ class FixtureEventCreator(commands.Cog):
         url, image_url, channel_id = team.value
         guild = self.bot.get_guild(settings.GUILD_ID)
 
-        fixture: Fixture = await scrape_next_match(url)
+        fixture: Fixture = await scrape_next_match(url, self.bot.http_client.session("promiedos"), self.bot.http_cache, self.bot.parsing_pool)
         if not fixture:
             return
 
@@ -28,7 +28,7 @@ class FixtureEventCreator(commands.Cog):
         end_time = start_time + timedelta(hours=2, minutes=15)
         channel_obj = discord.utils.get(guild.voice_channels, id=channel_id)
 
-        existing_fixture = self.bot.fixture_dao.get_by_match_id(fixture.match_id)
+        existing_fixture = await self.bot.fixture_dao.get_by_match_id(fixture.match_id)
         if existing_fixture:
             fixture.id = existing_fixture.id
             fixture.status = existing_fixture.status
@@ -44,7 +44,7 @@ class FixtureEventCreator(commands.Cog):
                 if existing_event:
                     return
             else:
-                self.bot.fixture_dao.upsert(fixture)
+                await self.bot.fixture_dao.upsert(fixture)
                 if existing_event:
                     await existing_event.edit(
                         start_time=start_time,
@@ -56,7 +56,7 @@ class FixtureEventCreator(commands.Cog):
                     await self.bot.messager.announce_interactive(f"Cambios en **{event_name}**:\n{changes}", view)
                     return
 
-        fixture_id = self.bot.fixture_dao.upsert(fixture)
+        fixture_id = await self.bot.fixture_dao.upsert(fixture)
         fixture.id = fixture_id
 
         if existing_event:
@@ -1,5 +1,7 @@
 import asyncio
 import aiohttp
+import io
+from functools import partial
 import json
 import logging
 import discord
@@ -7,12 +9,17 @@ from datetime import datetime, timedelta
 from discord.ext import commands
 from config.settings import settings
 from models.fixture_status import FixtureStatus
-from bot.ui.formation_pitch import render_lineups, lineup_confirmed
+from models.tracker_state import TrackerState
+from bot.ui.formation_pitch import lineup_confirmed
+from bot.commentator.lineup_renderer import LineupRenderer
+from bot.commentator.game_diff import EventAdded, GameDelta, GameDiff, StageTransition, safe_score
+from bot.commentator.poll_policy import PollPolicy
+from bot.commentator.poll_scheduler import PollScheduler
+from bot.commentator.recorder import GameRecorder
 
 logger = logging.getLogger(__name__)
 
 MAX_EMPTY_RESPONSES = 5
-POLL_INTERVAL_SECONDS = 30
 STATUS_FINISHED = 3
 CAI_RED = discord.Color.from_str("#E3131E")
 
@@ -32,10 +39,6 @@ EVENTS = {
 SCORE_CHANGING_EVENTS = {EVENTS["GOAL"], EVENTS["OWN_GOAL"], EVENTS["PENALTY_GOAL"]}
 
 
-def _safe_score(value) -> int:
-    return int(value) if value is not None else 0
-
-
 def _fmt_time(time) -> str:
     return f"{str(time).rstrip(chr(39))}'" if time is not None else "?'"
 
@@ -66,7 +69,7 @@ def _stay_suffix(team_name: str, players_on_field: int | None) -> str:
 def _score_line(game: dict, teams: list) -> str:
     scores = game.get("scores", [0, 0])
     home_name, away_name = _team_names(teams)
-    return f"{home_name} {_safe_score(scores[0])}-{_safe_score(scores[1])} {away_name}"
+    return f"{home_name} {safe_score(scores[0])}-{safe_score(scores[1])} {away_name}"
 
 
 class LiveMatchCommentator(commands.Cog):
@@ -75,16 +78,18 @@ class LiveMatchCommentator(commands.Cog):
         self.active_trackers: dict = {}
         self._tracking_tasks: set = set()
         self.api_url = "https://api.promiedos.com.ar/gamecenter/"
-        self.headers = {
-            'User-Agent': settings.USER_AGENT,
-            'Referer': 'https://www.promiedos.com.ar/',
-            'X-VER': '1.11.7.5',
-        }
+        self.recorder = GameRecorder(settings.COMMENTATOR_RECORDINGS_DIR) if settings.COMMENTATOR_RECORDINGS_DIR else None
+        self.poll_scheduler = PollScheduler(settings.COMMENTATOR_REQUESTS_PER_MINUTE)
+        self.lineup_renderer = LineupRenderer(bot, settings.LINEUP_IMAGE_FORMAT, f"{settings.CACHE_DIR}/lineups")
 
     def cog_unload(self):
         for task in list(self._tracking_tasks):
             task.cancel()
         self._tracking_tasks.clear()
+        for tracker in self.active_trackers.values():
+            if tracker["persist_task"]:
+                tracker["persist_task"].cancel()
+        self.poll_scheduler.stop()
 
     async def start_tracking(self, match_id: str, fixture_id: str, resume: bool = False):
         if match_id in self.active_trackers:
@@ -95,48 +100,81 @@ class LiveMatchCommentator(commands.Cog):
         self._tracking_tasks.add(task)
         task.add_done_callback(self._tracking_tasks.discard)
 
-    def _new_tracker_state(self) -> dict:
+    def _new_tracker_state(self, kickoff: datetime | None = None) -> dict:
         return {
-            "seen_events": set(),
+            "poll_policy": PollPolicy(kickoff),
+            "diff": GameDiff(),
             "start_sent": False,
             "empty_responses": 0,
             "roster": {},
             "on_field": {},
-            "last_scores": None,
             "goal_event_seen": False,
+            "thread": None,
+            "thread_id": None,
+            "confirmed": [],
+            "persist_task": None,
+            "finished": False,
         }
 
     async def _track_match(self, match_id: str, fixture_id: str, resume: bool = False):
-        self.active_trackers[match_id] = self._new_tracker_state()
+        fixture = await self.bot.fixture_dao.get_fixture_by_id(fixture_id)
+        self.active_trackers[match_id] = self._new_tracker_state(fixture.match_date if fixture else None)
         if self.bot.messager:
             if resume:
                 await self.bot.messager.log(f"Retomo el seguimiento del partido {match_id} tras un reinicio.")
             else:
                 await self.bot.messager.log(f"Comenzando el seguimiento del partido {match_id} en vivo.")
         try:
-            async with aiohttp.ClientSession() as session:
-                if resume:
+            session = self.bot.http_client.session("promiedos_api")
+            if resume:
+                saved_state = await self.bot.commentator_state_dao.get(match_id)
+                if saved_state:
+                    self._restore_state(match_id, saved_state)
+                else:
                     primer = await self._fetch_game(session, match_id)
                     if primer:
-                        self._prime_seen_state(match_id, primer)
-
-                while True:
-                    try:
-                        finished = await self._track_cycle(session, match_id, fixture_id)
-                        if finished:
-                            break
-                    except asyncio.CancelledError:
-                        logger.info(f"_track_match: tarea cancelada para {match_id}")
-                        raise
-                    except Exception as e:
-                        logger.exception(f"_track_match: excepción en ciclo para {match_id}: {e}")
-                        if self.bot.messager:
-                            await self.bot.messager.log(f"El relator se escabió en {match_id}: {e}", level="ERROR", exc=e)
-
-                    await asyncio.sleep(POLL_INTERVAL_SECONDS)
+                        await self._prime_seen_state(match_id, primer)
+                        self._update_poll_policy(match_id, primer)
+
+            await self._open_match_thread(match_id, fixture)
+            try:
+                await self.poll_scheduler.run(match_id, partial(self._poll_once, session, match_id, fixture_id))
+            except asyncio.CancelledError:
+                logger.info(f"_track_match: tarea cancelada para {match_id}")
+                raise
         finally:
             logger.info(f"_track_match: finalizando, removiendo {match_id} de active_trackers")
             self.active_trackers.pop(match_id, None)
+            if self.recorder:
+                self.recorder.close(match_id)
+
+    async def _poll_once(self, session: aiohttp.ClientSession, match_id: str, fixture_id: str) -> float | None:
+        """Un poll dentro del PollScheduler: devuelve en cuántos segundos repetir, o None si el partido terminó."""
+        try:
+            if await self._track_cycle(session, match_id, fixture_id):
+                return None
+        except Exception as e:
+            logger.exception(f"_track_match: excepción en ciclo para {match_id}: {e}")
+            if self.bot.messager:
+                await self.bot.messager.log(f"El relator se escabió en {match_id}: {e}", level="ERROR", exc=e)
+        return self.active_trackers[match_id]["poll_policy"].interval
+
+    async def _open_match_thread(self, match_id: str, fixture):
+        """Si ya hay otro partido en vivo, este se relata en su propio hilo del canal del relator
+        para no mezclar los mensajes. Al retomar se reusa el hilo guardado en el checkpoint."""
+        tracker = self.active_trackers[match_id]
+        others_live = any(other != match_id for other in self.active_trackers)
+        if not self.bot.messager or (tracker["thread_id"] is None and not others_live):
+            return
+        name = f"{fixture.home_team} vs {fixture.away_team}" if fixture else f"Partido {match_id}"
+        tracker["thread"] = await self.bot.messager.commentator_thread(name, tracker["thread_id"])
+        tracker["thread_id"] = tracker["thread"].id
+        await self._checkpoint(match_id)
+
+    async def _say(self, match_id: str, msg: str, embed: discord.Embed = None, file: discord.File = None) -> asyncio.Future:
+        """Encola el mensaje sin esperar a Discord; la entrega se confirma en `_on_delivery`."""
+        thread = self.active_trackers[match_id]["thread"]
+        return await self.bot.messager.commentator_update(msg, embed=embed, file=file, thread=thread)
 
     async def _track_cycle(self, session: aiohttp.ClientSession, match_id: str, fixture_id: str) -> bool:
         """Hace un ciclo de fetch + procesamiento. Devuelve True si el partido terminó
@@ -144,16 +182,21 @@ class LiveMatchCommentator(commands.Cog):
         tracker = self.active_trackers[match_id]
 
         game = await self._fetch_game(session, match_id)
+        self._update_poll_policy(match_id, game)
         if game is None:
             return await self._handle_empty_response(match_id, fixture_id)
         tracker["empty_responses"] = 0
 
         status_enum = game.get("status", {}).get("enum", 0)
         scores = game.get("scores", [0, 0])
+        delta = tracker["diff"].diff(game)
 
         await self._announce_start(match_id, game, fixture_id, status_enum)
-        await self._process_events(match_id, game, status_enum)
-        await self._check_score_fallback(match_id, game, status_enum)
+        await self._process_events(match_id, game, delta, status_enum)
+        await self._check_score_fallback(match_id, game, delta, status_enum)
+        tracker["diff"].commit(delta)
+        if delta.changes or delta.score_change:
+            await self._checkpoint(match_id)
 
         if status_enum == STATUS_FINISHED:
             await self._announce_final(match_id, fixture_id, game, scores)
@@ -161,6 +204,13 @@ class LiveMatchCommentator(commands.Cog):
 
         return False
 
+    def _update_poll_policy(self, match_id: str, game: dict | None):
+        policy: PollPolicy = self.active_trackers[match_id]["poll_policy"]
+        previous_phase = policy.phase
+        interval = policy.observe(game)
+        if policy.phase != previous_phase:
+            logger.info(f"_track_match: {match_id} pasó de {previous_phase} a {policy.phase}, consulto cada {interval}s")
+
     async def _handle_empty_response(self, match_id: str, fixture_id: str) -> bool:
         tracker = self.active_trackers[match_id]
         tracker["empty_responses"] += 1
@@ -175,7 +225,9 @@ class LiveMatchCommentator(commands.Cog):
                 f"Abandoné el tracking de {match_id} tras {MAX_EMPTY_RESPONSES} respuestas vacías de la API. "
                 f"El partido puede haber terminado sin que lo detectara.", level="WARNING"
             )
-        self.bot.fixture_dao.update_status(fixture_id, FixtureStatus.FINISHED)
+        await self.bot.fixture_dao.update_status(fixture_id, FixtureStatus.FINISHED)
+        tracker["finished"] = True
+        await self.bot.commentator_state_dao.delete(match_id)
         return True
 
     async def _announce_start(self, match_id: str, game: dict, fixture_id: str, status_enum: int):
@@ -187,7 +239,7 @@ class LiveMatchCommentator(commands.Cog):
         if tracker["start_sent"]:
             return
 
-        fixture = self.bot.fixture_dao.get_fixture_by_id(fixture_id)
+        fixture = await self.bot.fixture_dao.get_fixture_by_id(fixture_id)
         live = status_enum in (1, 2)
         overdue = fixture and datetime.now(settings.TIMEZONE) >= fixture.match_date + timedelta(minutes=2)
         if not live and not overdue:
@@ -196,38 +248,45 @@ class LiveMatchCommentator(commands.Cog):
         lineups_data = game.get("players", {}).get("lineups", {})
         if lineups_data:
             tracker["roster"], tracker["on_field"] = self._build_roster(game)
-            await self._send_lineups(game)
+            await self._send_lineups(match_id, game)
             logger.info(f"_track_match: formaciones enviadas para {match_id}")
 
         home_name, away_name = _team_names(game.get("teams", [{}, {}]))
         venue = fixture.venue if fixture and fixture.venue else "estadio no especificado"
-        await self.bot.messager.commentator_update(f"⚽ {home_name} vs {away_name} 🏟️ {venue}")
+        await self._say(match_id, f"⚽ {home_name} vs {away_name} 🏟️ {venue}")
         tracker["start_sent"] = True
+        await self._checkpoint(match_id)
         logger.info(f"_track_match: arranque anunciado para {match_id} (live={live}, overdue={overdue})")
 
     async def _announce_final(self, match_id: str, fixture_id: str, game: dict, scores: list):
         logger.info(f"_track_match: partido {match_id} finalizado, cerrando loop")
         teams = game.get("teams", [{}, {}])
-        score_home = _safe_score(scores[0])
-        score_away = _safe_score(scores[1])
+        score_home = safe_score(scores[0])
+        score_away = safe_score(scores[1])
         home_name, away_name = _team_names(teams)
         if self.bot.messager:
-            await self.bot.messager.commentator_update(
-                f"🏁 Final: {home_name} {score_home}-{score_away} {away_name}"
+            await self._say(
+                match_id, f"🏁 Final: {home_name} {score_home}-{score_away} {away_name}"
             )
-        self.bot.fixture_dao.update_score(fixture_id, score_home, score_away, FixtureStatus.FINISHED)
+        await self.bot.fixture_dao.update_score(fixture_id, score_home, score_away, FixtureStatus.FINISHED)
+        self.active_trackers[match_id]["finished"] = True
+        await self.bot.commentator_state_dao.delete(match_id)
 
     async def _fetch_game(self, session: aiohttp.ClientSession, match_id: str) -> dict | None:
         url = f"{self.api_url}{match_id}"
         try:
-            async with session.get(url, headers=self.headers) as resp:
+            async with session.get(url) as resp:
                 if resp.status != 200:
+                    if self.recorder:
+                        self.recorder.record(match_id, resp.status, None)
                     if self.bot.messager:
                         await self.bot.messager.log(
                             f"La API de Promiedos devolvió {resp.status} para {match_id}.", level="WARNING"
                         )
                     return None
                 raw = await resp.text()
+                if self.recorder:
+                    self.recorder.record(match_id, resp.status, raw)
                 try:
                     data = json.loads(raw)
                 except Exception as json_err:
@@ -240,7 +299,7 @@ class LiveMatchCommentator(commands.Cog):
                 await self.bot.messager.log(f"Falló la llamada a la API para {match_id}: {e}", level="ERROR", exc=e)
             return None
 
-    def _prime_seen_state(self, match_id: str, game: dict):
+    async def _prime_seen_state(self, match_id: str, game: dict):
         """Al retomar el tracking tras un reinicio, marca como ya vistos los eventos y
         formaciones que la API ya reporta, para no reanunciar todo el partido de nuevo."""
         tracker = self.active_trackers[match_id]
@@ -249,27 +308,85 @@ class LiveMatchCommentator(commands.Cog):
             tracker["roster"], tracker["on_field"] = self._build_roster(game)
         elif game.get("status", {}).get("enum", 0) in (1, 2):
             tracker["start_sent"] = True
-        scores = game.get("scores", [0, 0])
-        tracker["last_scores"] = (_safe_score(scores[0]), _safe_score(scores[1]))
-        for stage in game.get("events", []):
-            scores = stage.get("scores", [0, 0])
-            if stage.get("show_stage_title", False) and scores[0] is not None and float(scores[0]) >= 0:
-                tracker["seen_events"].add(f"stage_{stage.get('name')}")
-            for row in stage.get("rows", []):
-                time = row.get("time")
-                for event in row.get("events", []):
-                    event_texts = event.get("texts", [])
-                    tracker["seen_events"].add(f"{time}_{event.get('type')}_{'-'.join(event_texts)}")
-                    if event.get("type") == EVENTS["SUBSTITUTION"] and len(event_texts) > 1:
-                        team_idx = event.get("team", 1) - 1
-                        if team_idx in tracker["on_field"]:
-                            tracker["on_field"][team_idx].discard(event_texts[1])
-                            tracker["on_field"][team_idx].add(event_texts[0])
+        diff: GameDiff = tracker["diff"]
+        delta = diff.diff(game)
+        for change in delta.changes:
+            diff.ack(change)
+            if isinstance(change, EventAdded) and change.event.get("type") == EVENTS["SUBSTITUTION"]:
+                event_texts = change.event.get("texts", [])
+                team_idx = change.event.get("team", 1) - 1
+                if len(event_texts) > 1 and team_idx in tracker["on_field"]:
+                    tracker["on_field"][team_idx].discard(event_texts[1])
+                    tracker["on_field"][team_idx].add(event_texts[0])
+        diff.commit(delta)
+        await self._checkpoint(match_id)
+        await self.bot.commentator_state_dao.add_seen(match_id, *diff.seen)
         logger.info(
-            f"_prime_seen_state: {match_id} retomado con {len(tracker['seen_events'])} eventos ya vistos, "
+            f"_prime_seen_state: {match_id} retomado con {len(diff.seen)} eventos ya vistos, "
             f"start_sent={tracker['start_sent']}"
         )
 
+    def _restore_state(self, match_id: str, state: TrackerState):
+        """Retoma desde el último checkpoint: no hace falta volver a pedir ni recorrer el partido."""
+        tracker = self.active_trackers[match_id]
+        tracker["diff"] = GameDiff(state.seen_events, state.last_scores)
+        tracker["roster"] = state.roster
+        tracker["on_field"] = state.on_field
+        tracker["start_sent"] = state.start_sent
+        tracker["thread_id"] = state.thread_id
+        logger.info(
+            f"_restore_state: {match_id} retomado desde checkpoint con {len(state.seen_events)} eventos ya vistos, "
+            f"start_sent={state.start_sent}"
+        )
+
+    async def _checkpoint(self, match_id: str):
+        tracker = self.active_trackers[match_id]
+        await self.bot.commentator_state_dao.save(TrackerState(
+            match_id=match_id,
+            last_scores=tracker["diff"].last_scores,
+            roster=tracker["roster"],
+            on_field=tracker["on_field"],
+            start_sent=tracker["start_sent"],
+            thread_id=tracker["thread_id"],
+        ))
+
+    async def _ack(self, match_id: str, change: StageTransition | EventAdded, delivery: asyncio.Future = None):
+        """Marca el cambio como relatado. Si hubo mensaje, queda pendiente hasta que Discord
+        confirme la entrega (ver `_on_delivery`): recién ahí cuenta como visto y se persiste,
+        así un envío que falló se reintenta en el próximo ciclo. No se espera a Discord acá."""
+        tracker = self.active_trackers[match_id]
+        diff: GameDiff = tracker["diff"]
+        if delivery is None:
+            diff.ack(change)
+            await self.bot.commentator_state_dao.add_seen(match_id, change.key)
+        else:
+            diff.hold(change)
+            delivery.add_done_callback(partial(self._on_delivery, match_id, diff, change))
+
+    def _on_delivery(self, match_id: str, diff: GameDiff, change: StageTransition | EventAdded, delivery: asyncio.Future):
+        if delivery.cancelled() or delivery.exception() is not None:
+            diff.release(change)
+            logger.warning(f"_on_delivery: un mensaje de {match_id} no llegó a Discord, se reintenta en el próximo ciclo")
+            return
+        diff.ack(change)
+
+        tracker = self.active_trackers.get(match_id)
+        if tracker is None or tracker["diff"] is not diff or tracker["finished"]:
+            return
+        tracker["confirmed"].append(change.key)
+        if tracker["persist_task"] is None or tracker["persist_task"].done():
+            tracker["persist_task"] = asyncio.create_task(self._persist_seen(match_id, tracker))
+
+    async def _persist_seen(self, match_id: str, tracker: dict):
+        """Guarda de a tandas las claves que Discord ya confirmó, aparte del ciclo de polls."""
+        while tracker["confirmed"] and not tracker["finished"]:
+            keys, tracker["confirmed"] = tracker["confirmed"], []
+            try:
+                await self.bot.commentator_state_dao.add_seen(match_id, *keys)
+            except Exception as e:
+                logger.exception(f"_persist_seen: no pude guardar {len(keys)} eventos vistos de {match_id}: {e}")
+                return
+
     def _build_roster(self, game: dict) -> tuple[dict, dict]:
         """Mapea nombre completo de jugador -> dorsal, para poder mostrar el número
         en eventos (como los cambios) que no lo traen incluido. También junta, por
@@ -285,7 +402,7 @@ class LiveMatchCommentator(commands.Cog):
                     roster[player["name"]] = player["jersey_num"]
         return roster, on_field
 
-    async def _send_lineups(self, game: dict):
+    async def _send_lineups(self, match_id: str, game: dict):
         embed = discord.Embed(title="Formaciones", color=CAI_RED)
         for team in game.get("players", {}).get("lineups", {}).get("teams", []):
             team_data = game["teams"][team["team_num"] - 1]
@@ -298,89 +415,73 @@ class LiveMatchCommentator(commands.Cog):
             )
 
         file = None
-        pitch_image = render_lineups(game)
+        pitch_image = await self.lineup_renderer.render(game)
         if pitch_image:
-            file = discord.File(pitch_image, filename="formacion.png")
-            embed.set_image(url="attachment://formacion.png")
+            filename = self.lineup_renderer.filename
+            file = discord.File(io.BytesIO(pitch_image), filename=filename)
+            embed.set_image(url=f"attachment://{filename}")
 
-        await self.bot.messager.commentator_update("", embed=embed, file=file)
+        await self._say(match_id, "", embed=embed, file=file)
 
-    async def _process_events(self, match_id: str, game: dict, status_enum: int):
+    async def _process_events(self, match_id: str, game: dict, delta: GameDelta, status_enum: int):
         teams = game.get("teams", [{}, {}])
-        for stage in game.get("events", []):
-            await self._announce_stage_title(match_id, stage, teams, status_enum)
-            await self._process_row_events(match_id, game, teams, stage.get("rows", []))
-
-    async def _announce_stage_title(self, match_id: str, stage: dict, teams: list, status_enum: int):
-        stage_name = stage.get("name")
-        stage_key = f"stage_{stage_name}"
-        scores = stage.get("scores", [0, 0])
-        tracker = self.active_trackers[match_id]
-
-        already_seen = stage_key in tracker["seen_events"]
-        has_score = scores[0] is not None and float(scores[0]) >= 0
-        if already_seen or not stage.get("show_stage_title", False) or not has_score:
-            return
+        for change in delta.changes:
+            if isinstance(change, StageTransition):
+                await self._announce_stage_title(match_id, change, teams, status_enum)
+            else:
+                await self._process_event(match_id, game, teams, change)
 
+    async def _announce_stage_title(self, match_id: str, stage: StageTransition, teams: list, status_enum: int):
         if status_enum == STATUS_FINISHED:
             # El partido ya terminó: solo avisamos "Final", no la etapa de cierre (ej. "Fin de los 90 minutos").
-            tracker["seen_events"].add(stage_key)
+            await self._ack(match_id, stage)
             return
 
-        score_home = _safe_score(scores[0])
-        score_away = _safe_score(scores[1])
+        score_home = safe_score(stage.scores[0])
+        score_away = safe_score(stage.scores[1])
         home_name, away_name = _team_names(teams)
-        await self.bot.messager.commentator_update(
-            f"⏱️ {stage_name}: {home_name} {score_home}-{score_away} {away_name}"
+        delivery = await self._say(
+            match_id, f"⏱️ {stage.name}: {home_name} {score_home}-{score_away} {away_name}"
         )
-        tracker["seen_events"].add(stage_key)
+        await self._ack(match_id, stage, delivery)
 
-    async def _process_row_events(self, match_id: str, game: dict, teams: list, rows: list):
+    async def _process_event(self, match_id: str, game: dict, teams: list, change: EventAdded):
         tracker = self.active_trackers[match_id]
-        for row in rows:
-            time = row.get("time")
-            for event in row.get("events", []):
-                event_type = event.get("type")
-                texts = "-".join(event.get("texts", []))
-                event_id = f"{time}_{event_type}_{texts}"
+        event = change.event
+        event_type = event.get("type")
 
-                if event_id in tracker["seen_events"]:
-                    continue
+        if event_type in SCORE_CHANGING_EVENTS:
+            tracker["goal_event_seen"] = True
 
-                if event_type in SCORE_CHANGING_EVENTS:
-                    tracker["goal_event_seen"] = True
+        team_idx = event.get("team", 1) - 1
+        team_name = _team_short_name(teams[team_idx]) if team_idx < len(teams) else "Desconocido"
 
-                team_idx = event.get("team", 1) - 1
-                team_name = _team_short_name(teams[team_idx]) if team_idx < len(teams) else "Desconocido"
+        delivery = None
+        msg = await self._format_event(change.time, event, team_name, teams, team_idx, game, tracker)
+        if msg:
+            logger.info(f"_process_events: {match_id} evento nuevo: {msg}")
+            delivery = await self._say(match_id, msg)
 
-                msg = await self._format_event(time, event, team_name, teams, team_idx, game, tracker)
-                if msg:
-                    logger.info(f"_process_events: {match_id} evento nuevo: {msg}")
-                    await self.bot.messager.commentator_update(msg)
+        await self._ack(match_id, change, delivery)
 
-                tracker["seen_events"].add(event_id)
-
-    async def _check_score_fallback(self, match_id: str, game: dict, status_enum: int):
+    async def _check_score_fallback(self, match_id: str, game: dict, delta: GameDelta, status_enum: int):
         """Algunos partidos (cobertura nula) actualizan el marcador en `scores` sin nunca
         reportar el evento de gol correspondiente. Si el marcador cambió y no vimos un
         evento de gol este ciclo que lo explique, avisamos el cambio sin autor."""
         tracker = self.active_trackers[match_id]
-        scores = game.get("scores", [0, 0])
-        current = (_safe_score(scores[0]), _safe_score(scores[1]))
-        previous = tracker["last_scores"]
         goal_event_seen = tracker["goal_event_seen"]
-
-        tracker["last_scores"] = current
         tracker["goal_event_seen"] = False
 
-        if previous is None or current == previous or goal_event_seen or status_enum == STATUS_FINISHED:
+        change = delta.score_change
+        if change is None or change.previous is None or goal_event_seen or status_enum == STATUS_FINISHED:
             return
+        previous, current = change.previous, change.current
 
         teams = game.get("teams", [{}, {}])
         home_name, away_name = _team_names(teams)
         t = _fmt_time(game.get("game_time"))
-        await self.bot.messager.commentator_update(
-            f"⚽ Se movió el marcador (no tengo quién convirtió): {home_name} {current[0]}-{current[1]} {away_name} {{{t}}}"
+        await self._say(
+            match_id, f"⚽ Se movió el marcador (no tengo quién convirtió): {home_name} {current[0]}-{current[1]} {away_name} {{{t}}}"
         )
         logger.info(f"_track_match: {match_id} marcador cambió sin evento de gol, aviso fallback: {previous} -> {current}")
 
@@ -0,0 +1,32 @@
+import io
+from datetime import datetime, timedelta, timezone
+
+import discord
+from discord.ext import commands
+
+from bot.ui.hardware_chart import render_hardware_chart
+from config.settings import settings
+
+
+class HistorialPcCommand(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name="historial_pc", extras={"admin": True})
+    async def historial_pc(self, ctx, horas: int = 6):
+        """Grafica CPU, RAM, disco y temperaturas de la PC de Minecraft de las últimas N horas (6 por defecto)."""
+        horas = max(1, min(horas, settings.HARDWARE_HISTORY_HOURLY_DAYS * 24))
+        until = datetime.now(timezone.utc)
+        since = until - timedelta(hours=horas)
+
+        points, resolution = await self.bot.hardware_history_dao.get_series(since, until)
+        if not points:
+            await ctx.send(f"No tengo métricas de la PC de Minecraft de las últimas {horas} horas.")
+            return
+
+        chart = await self.bot.parsing_pool.run(render_hardware_chart, points, since, until, resolution)
+        await ctx.send(file=discord.File(io.BytesIO(chart), filename="historial_pc.png"))
+
+
+async def setup(bot):
+    await bot.add_cog(HistorialPcCommand(bot))
@@ -25,7 +25,7 @@ class LimpiarCommand(commands.Cog):
                 deleted = await ctx.channel.purge(limit=limit)
                 await self.bot.messager.log(f"Limpié {len(deleted)} mensajes.")
         except discord.Forbidden:
-            await self.bot.messager.log("No tengo permisos para borrar mensajes acá.", level="ERROR")
+            await self.bot.messager.log("No tengo permisos para borrar mensajes acá.", level="ERROR", immediate=True)
 
 
 async def setup(bot):
@@ -16,7 +16,7 @@ class NuevoInstagram(commands.Cog):
             platform_enum = SocialMedia.INSTAGRAM
             attention_enum = AttentionLevel(attention.lower())
 
-            if self.bot.influencer_dao.exists(username, platform_enum):
+            if await self.bot.influencer_dao.exists(username, platform_enum):
                 await self.bot.messager.log(f'Ya sigo a {description} en Instagram.')
                 return
 
@@ -29,12 +29,12 @@ class NuevoInstagram(commands.Cog):
                 attention=attention_enum,
             )
 
-            self.bot.influencer_dao.insert(account)
+            await self.bot.influencer_dao.insert(account)
             await self.bot.messager.log(f'Suscrito a {description} en Instagram (atención: {attention_enum.value}).')
         except ValueError:
             await self.bot.messager.log(
                 f"Parámetro inválido. Source debe ser un NewsSource válido y attention 'high' o 'low'.",
-                level="WARNING",
+                level="WARNING", immediate=True,
             )
 
 async def setup(bot):
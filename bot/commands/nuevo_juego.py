@@ -23,7 +23,7 @@ class NuevoJuegoCommand(commands.Cog):
 
         await self.bot.messager.log(f"Registrando '{game_name}'.")
 
-        existing_game = self.bot.games_dao.get_game_by_name(game_name)
+        existing_game = await self.bot.games_dao.get_game_by_name(game_name)
         if existing_game is not None:
             await self.bot.messager.log(f"Ya tengo a '{game_name}' en el catálogo (mensaje {existing_game.message_id}).")
             return
@@ -48,10 +48,10 @@ class NuevoJuegoCommand(commands.Cog):
                 )
                 await self.bot.messager.log(f"Rol '{game_name}' creado.")
             except discord.Forbidden:
-                await self.bot.messager.log(f"No tengo permisos para crear el rol '{game_name}'.", level="ERROR")
+                await self.bot.messager.log(f"No tengo permisos para crear el rol '{game_name}'.", level="ERROR", immediate=True)
                 return
             except discord.HTTPException as e:
-                await self.bot.messager.log(f"No pude crear el rol '{game_name}': {e}", level="ERROR", exc=e)
+                await self.bot.messager.log(f"No pude crear el rol '{game_name}': {e}", level="ERROR", immediate=True, exc=e)
                 return
         else:
              await self.bot.messager.log(f"El rol '{game_name}' ya existía, lo uso.")
@@ -81,10 +81,10 @@ class NuevoJuegoCommand(commands.Cog):
                 )
                 await self.bot.messager.log(f"Creé el canal '#{channel_name}' en '{games_category.name}'.")
             except discord.Forbidden:
-                await self.bot.messager.log(f"No tengo permisos para crear el canal '#{channel_name}'.", level="ERROR")
+                await self.bot.messager.log(f"No tengo permisos para crear el canal '#{channel_name}'.", level="ERROR", immediate=True)
                 return
             except discord.HTTPException as e:
-                await self.bot.messager.log(f"No pude crear el canal '#{channel_name}': {e}", level="ERROR", exc=e)
+                await self.bot.messager.log(f"No pude crear el canal '#{channel_name}': {e}", level="ERROR", immediate=True, exc=e)
                 return
         else:
             await self.bot.messager.log(f"El canal '#{channel_name}' ya existía, lo uso.")
@@ -98,12 +98,12 @@ class NuevoJuegoCommand(commands.Cog):
             message_id=message.id,
             text_channel_id=game_channel.id
         )
-        self.bot.games_dao.create_game(game)
+        await self.bot.games_dao.create_game(game)
 
         try:
             await message.add_reaction("🎮")
         except (discord.Forbidden, discord.HTTPException) as e:
-            await self.bot.messager.log(f"No pude añadir la reacción al catálogo: {e}", level="WARNING", exc=e)
+            await self.bot.messager.log(f"No pude añadir la reacción al catálogo: {e}", level="WARNING", immediate=True, exc=e)
 
         announcement_msg = (
             f"Nuevo juego disponible: **{game_name}**\n\n"
@@ -15,7 +15,7 @@ class NuevoTwitter(commands.Cog):
             source_enum = NewsSource(source.lower())
             platform_enum = SocialMedia.TWITTER
 
-            if self.bot.influencer_dao.exists(username, platform_enum):
+            if await self.bot.influencer_dao.exists(username, platform_enum):
                 await self.bot.messager.log(f'Ya sigo a {description} en Twitter.')
                 return
             
@@ -27,11 +27,11 @@ class NuevoTwitter(commands.Cog):
                 platform=platform_enum
             )
             
-            self.bot.influencer_dao.insert(account)
+            await self.bot.influencer_dao.insert(account)
             
             await self.bot.messager.log(f'Siguiendo a {description} en Twitter.')
         except ValueError:
-            await self.bot.messager.log(f"No reconozco la fuente '{source}' para Twitter.", level="WARNING")
+            await self.bot.messager.log(f"No reconozco la fuente '{source}' para Twitter.", level="WARNING", immediate=True)
 
 async def setup(bot):
     await bot.add_cog(NuevoTwitter(bot))
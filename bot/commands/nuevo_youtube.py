@@ -15,7 +15,7 @@ class NuevoYouTube(commands.Cog):
             source_enum = NewsSource(source.lower())
             platform_enum = SocialMedia.YOUTUBE
 
-            if self.bot.influencer_dao.exists(username,platform_enum):
+            if await self.bot.influencer_dao.exists(username,platform_enum):
                 await self.bot.messager.log(f'Ya estoy suscrito a {description} en YouTube.')
                 return
             
@@ -27,11 +27,11 @@ class NuevoYouTube(commands.Cog):
                 platform=platform_enum
             )
             
-            self.bot.influencer_dao.insert(account)
+            await self.bot.influencer_dao.insert(account)
             
             await self.bot.messager.log(f'Suscrito a {description} en YouTube.')
         except ValueError:
-            await self.bot.messager.log(f"No reconozco la fuente '{source}' para YouTube.", level="WARNING")
+            await self.bot.messager.log(f"No reconozco la fuente '{source}' para YouTube.", level="WARNING", immediate=True)
 
 async def setup(bot):
     await bot.add_cog(NuevoYouTube(bot))
\ No newline at end of file
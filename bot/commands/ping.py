@@ -1,4 +1,5 @@
 from discord.ext import commands
+from config.database import MongoDB
 
 class PingCommand(commands.Cog):
     def __init__(self, bot):
@@ -8,7 +9,21 @@ class PingCommand(commands.Cog):
     async def ping(self, ctx):
         """Mide la latencia del bot"""
         latency = round(self.bot.latency * 1000)
-        await self.bot.messager.log(f'Pong! {latency}ms')
+        stalls, blocked, worst = self.bot.loop_monitor.recent_stalls()
+        parsed_off_loop = self.bot.parsing_pool.total_busy_seconds
+        queries = "".join(
+            f'\n  {command} {collection}: {count}× (prom. {avg:.1f}ms, máx {peak:.0f}ms)'
+            for collection, command, count, avg, peak in MongoDB.query_timer.slowest(3)
+        )
+        instagram = self.bot.get_cog('InstagramCheckScheduler')
+        instagram_stats = instagram.instagram.worker.summary() if instagram else ""
+        await self.bot.messager.log(
+            f'Pong! {latency}ms\n'
+            f'Loop trabado {stalls} veces en la última hora ({blocked:.1f}s en total, peor {worst * 1000:.0f}ms). '
+            f'Parseo fuera del loop: {parsed_off_loop:.1f}s\n'
+            f'Consultas a Mongo que más tiempo suman:{queries or " ninguna todavía"}\n'
+            f'Instagram:\n{instagram_stats or "sin lecturas todavía"}'
+        )
 
 async def setup(bot):
     await bot.add_cog(PingCommand(bot))
\ No newline at end of file
@@ -27,7 +27,7 @@ class ReiniciarCommand(commands.Cog):
 
         code, _, stderr = await self._run("git", "fetch")
         if code != 0:
-            await self.bot.messager.log(f"No pude hacer git fetch: {stderr}", level="ERROR")
+            await self.bot.messager.log(f"No pude hacer git fetch: {stderr}", level="ERROR", immediate=True)
             await self._restart()
             return
 
@@ -47,14 +47,14 @@ class ReiniciarCommand(commands.Cog):
                 "Hay cambios en config/settings.py en el remoto, seguramente nuevas env vars. "
                 "No hago el pull para no dejar el bot sin levantar: actualizá el .env y bajá los "
                 "cambios a mano. Reinicio igual con el código actual.",
-                level="WARNING",
+                level="WARNING", immediate=True,
             )
             await self._restart()
             return
 
         code, _, stderr = await self._run("git", "pull")
         if code != 0:
-            await self.bot.messager.log(f"No pude hacer git pull: {stderr}", level="ERROR")
+            await self.bot.messager.log(f"No pude hacer git pull: {stderr}", level="ERROR", immediate=True)
             await self._restart()
             return
 
@@ -66,7 +66,7 @@ class ReiniciarCommand(commands.Cog):
             await self.bot.messager.log("Cambiaron los requirements, instalando dependencias con el venv del proyecto.")
             code, _, stderr = await self._run(sys.executable, "-m", "pip", "install", "-r", "requirements.txt")
             if code != 0:
-                await self.bot.messager.log(f"No pude instalar las dependencias nuevas: {stderr}", level="ERROR")
+                await self.bot.messager.log(f"No pude instalar las dependencias nuevas: {stderr}", level="ERROR", immediate=True)
             else:
                 await self.bot.messager.log("Dependencias instaladas.")
 
@@ -166,28 +166,28 @@ class TransmitirCommand(commands.Cog):
             stderr=subprocess.DEVNULL,
         )
 
-        async with aiohttp.ClientSession() as session:
-            ws_url = None
-            for _ in range(20):
-                await asyncio.sleep(1)
-                try:
-                    async with session.get(
-                        f"http://localhost:{_CDP_PORT}/json",
-                        timeout=aiohttp.ClientTimeout(total=2),
-                    ) as resp:
-                        tabs = await resp.json(content_type=None)
-                        page = next((t for t in tabs if t.get("type") == "page"), None)
-                        if page:
-                            ws_url = page["webSocketDebuggerUrl"]
-                            break
-                except Exception:
-                    pass
-
-            if not ws_url:
-                logger.warning("No pude conectarme al CDP; el browser está abierto pero sin fullscreen del player.")
-            else:
-                async with session.ws_connect(ws_url) as ws:
-                    await self._fullscreen_player(ws)
+        session = self.bot.http_client.session("cdp")
+        ws_url = None
+        for _ in range(20):
+            await asyncio.sleep(1)
+            try:
+                async with session.get(
+                    f"http://localhost:{_CDP_PORT}/json",
+                    timeout=aiohttp.ClientTimeout(total=2),
+                ) as resp:
+                    tabs = await resp.json(content_type=None)
+                    page = next((t for t in tabs if t.get("type") == "page"), None)
+                    if page:
+                        ws_url = page["webSocketDebuggerUrl"]
+                        break
+            except Exception:
+                pass
+
+        if not ws_url:
+            logger.warning("No pude conectarme al CDP; el browser está abierto pero sin fullscreen del player.")
+        else:
+            async with session.ws_connect(ws_url) as ws:
+                await self._fullscreen_player(ws)
 
         await self._start_screenshare()
 
@@ -207,7 +207,7 @@ class TransmitirCommand(commands.Cog):
             await self._start(url)
             await self.bot.messager.log(f"Transmitiendo: {url}")
         except Exception as e:
-            await self.bot.messager.log(f"No pude iniciar la transmisión de '{url}': {e}", level="ERROR", exc=e)
+            await self.bot.messager.log(f"No pude iniciar la transmisión de '{url}': {e}", level="ERROR", immediate=True, exc=e)
 
 
 async def setup(bot):
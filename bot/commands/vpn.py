@@ -28,7 +28,7 @@ class VpnCommand(commands.Cog):
             server_config = await loop.run_in_executor(None, wireguard.get_server_config)
         except Exception as e:
             await ctx.send(f"{ctx.author.mention} no pude conectarme al router, avisale a un admin.")
-            await self.bot.messager.log(f"No pude conectarme al router para armar la VPN de {username}: {e}", level="ERROR", exc=e)
+            await self.bot.messager.log(f"No pude conectarme al router para armar la VPN de {username}: {e}", level="ERROR", immediate=True, exc=e)
             return
 
         existing_index = next((i for i, a in enumerate(accounts) if a.get("username") == username), None)
@@ -38,7 +38,7 @@ class VpnCommand(commands.Cog):
                 await loop.run_in_executor(None, wireguard.delete_account, existing.get("key", ""), existing_index)
             except Exception as e:
                 await ctx.send(f"{ctx.author.mention} no pude renovar tu config, avisale a un admin.")
-                await self.bot.messager.log(f"No pude borrar la config vieja de WireGuard de {username}: {e}", level="ERROR", exc=e)
+                await self.bot.messager.log(f"No pude borrar la config vieja de WireGuard de {username}: {e}", level="ERROR", immediate=True, exc=e)
                 return
             accounts.remove(existing)
 
@@ -47,7 +47,7 @@ class VpnCommand(commands.Cog):
             credentials = await loop.run_in_executor(None, wireguard.create_account, username, client_ip)
         except Exception as e:
             await ctx.send(f"{ctx.author.mention} no pude generar tu config, avisale a un admin.")
-            await self.bot.messager.log(f"No pude crear la cuenta de WireGuard para {username}: {e}", level="ERROR", exc=e)
+            await self.bot.messager.log(f"No pude crear la cuenta de WireGuard para {username}: {e}", level="ERROR", immediate=True, exc=e)
             return
 
         config_text = wireguard.build_client_config(credentials, server_config)
@@ -79,7 +79,7 @@ class VpnCommand(commands.Cog):
         await self.bot.messager.log(f"Generé una config de WireGuard para {username} ({client_ip}).")
 
         delete_at = datetime.now(settings.TIMEZONE) + timedelta(seconds=ttl_seconds)
-        self.bot.self_destruct_message_dao.insert(SelfDestructMessage(
+        await self.bot.self_destruct_message_dao.insert(SelfDestructMessage(
             user_id=ctx.author.id,
             message_id=dm_message.id,
             delete_at=delete_at,
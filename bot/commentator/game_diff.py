@@ -0,0 +1,152 @@
+from dataclasses import dataclass, field
+
+
+def safe_score(value) -> int:
+    return int(value) if value is not None else 0
+
+
+def _fingerprint(obj) -> int:
+    return hash(repr(obj))
+
+
+@dataclass(frozen=True)
+class StageMark:
+    """Lo que se recuerda de una etapa: título con marcador y un hash por fila."""
+    header: tuple
+    rows: tuple[int, ...]
+
+    @classmethod
+    def of(cls, stage: dict) -> "StageMark":
+        header = (stage.get("show_stage_title", False), tuple(stage.get("scores", ())))
+        return cls(header, tuple(_fingerprint(row) for row in stage.get("rows", [])))
+
+    def first_change(self, previous: "StageMark | None") -> int:
+        """Índice de la primera fila que no coincide con `previous` (todas si no hay referencia)."""
+        if previous is None:
+            return 0
+        for idx, (row, known) in enumerate(zip(self.rows, previous.rows)):
+            if row != known:
+                return idx
+        return min(len(self.rows), len(previous.rows))
+
+
+def event_key(time, event: dict) -> str:
+    return f"{time}_{event.get('type')}_{'-'.join(event.get('texts', []))}"
+
+
+def stage_key(stage: dict) -> str:
+    return f"stage_{stage.get('name')}"
+
+
+@dataclass(frozen=True)
+class StageTransition:
+    """Una etapa pasó a mostrar título con marcador (ej. "Fin del primer tiempo")."""
+    key: str
+    name: str
+    scores: tuple
+    stage: str
+
+
+@dataclass(frozen=True)
+class EventAdded:
+    """Un evento que todavía no se relató (nuevo, o uno existente al que le cambió el texto)."""
+    key: str
+    time: str | None
+    event: dict
+    stage: str
+
+
+@dataclass(frozen=True)
+class ScoreChange:
+    previous: tuple[int, int] | None
+    current: tuple[int, int]
+
+
+@dataclass
+class GameDelta:
+    changes: list[StageTransition | EventAdded]
+    score_change: ScoreChange | None
+    scores: tuple[int, int]
+    _marks: dict = field(repr=False)
+
+
+class GameDiff:
+    """Compara cada payload del gamecenter contra el anterior y devuelve solo lo que cambió.
+
+    Por etapa guarda un StageMark con un hash por fila. Si no cambió, la etapa no se recorre;
+    si cambió, se recorre desde la primera fila distinta (nueva, editada o corrida porque la
+    API reordenó). Las claves ya relatadas (`seen`) o en camino a Discord (`pending`) no se
+    vuelven a devolver."""
+
+    def __init__(self, seen: set[str] | None = None, last_scores: tuple[int, int] | None = None):
+        self.seen: set[str] = set(seen or ())
+        self.pending: dict[str, str] = {}
+        self.last_scores = last_scores
+        self._stage_marks: dict[str, StageMark] = {}
+
+    def diff(self, game: dict) -> GameDelta:
+        changes = []
+        marks = {}
+        for idx, stage in enumerate(game.get("events", [])):
+            stage_id = f"{idx}_{stage.get('name')}"
+            mark = StageMark.of(stage)
+            marks[stage_id] = mark
+            previous = self._stage_marks.get(stage_id)
+            if previous == mark:
+                continue
+
+            transition = self._stage_transition(stage, stage_id)
+            if transition:
+                changes.append(transition)
+
+            for row in stage.get("rows", [])[mark.first_change(previous):]:
+                time = row.get("time")
+                for event in row.get("events", []):
+                    key = event_key(time, event)
+                    if self._is_new(key):
+                        changes.append(EventAdded(key, time, event, stage_id))
+
+        scores = game.get("scores", [0, 0])
+        current = (safe_score(scores[0]), safe_score(scores[1]))
+        score_change = ScoreChange(self.last_scores, current) if current != self.last_scores else None
+        return GameDelta(changes, score_change, current, marks)
+
+    def _stage_transition(self, stage: dict, stage_id: str) -> StageTransition | None:
+        key = stage_key(stage)
+        scores = stage.get("scores", [0, 0])
+        has_score = scores[0] is not None and float(scores[0]) >= 0
+        if not self._is_new(key) or not stage.get("show_stage_title", False) or not has_score:
+            return None
+        return StageTransition(key, stage.get("name"), tuple(scores), stage_id)
+
+    def _is_new(self, key: str) -> bool:
+        return key not in self.seen and key not in self.pending
+
+    def hold(self, change: StageTransition | EventAdded):
+        """El cambio salió para Discord pero falta la confirmación: no se vuelve a devolver, y
+        su etapa no adopta la marca nueva hasta que se resuelva."""
+        self.pending[change.key] = change.stage
+
+    def ack(self, change: StageTransition | EventAdded):
+        """Marca un cambio como relatado. Se llama recién cuando Discord confirmó la entrega
+        (o si no había nada que mandar), así un envío fallido no se pierde."""
+        self.pending.pop(change.key, None)
+        self.seen.add(change.key)
+
+    def release(self, change: StageTransition | EventAdded):
+        """La entrega falló: el cambio vuelve a salir en el próximo diff de su etapa."""
+        self.pending.pop(change.key, None)
+
+    def commit(self, delta: GameDelta):
+        """Adopta el payload como referencia para el próximo diff. Solo al final de un ciclo
+        que se procesó entero; las etapas con entregas sin confirmar conservan la marca vieja
+        para volver a recorrerse."""
+        held = set(self.pending.values())
+        marks = {}
+        for stage_id, mark in delta._marks.items():
+            if stage_id in held:
+                mark = self._stage_marks.get(stage_id)
+            if mark is not None:
+                marks[stage_id] = mark
+        self._stage_marks = marks
+        self.last_scores = delta.scores
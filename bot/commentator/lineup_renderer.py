@@ -0,0 +1,78 @@
+import logging
+from collections import OrderedDict
+from pathlib import Path
+
+from bot.ui.formation_pitch import IMAGE_FORMATS, lineup_fingerprint, render_lineups
+
+logger = logging.getLogger(__name__)
+
+MEMORY_CACHE_SIZE = 16
+
+
+def _render_bytes(game: dict, image_format: str) -> bytes | None:
+    buffer = render_lineups(game, image_format)
+    return buffer.getvalue() if buffer else None
+
+
+class LineupRenderer:
+    """Renderiza la imagen de formaciones fuera del event loop y la guarda por contenido:
+    la clave es el hash de lo que se ve (ver `lineup_fingerprint`), así que un reenvío, un
+    resume o un payload que cambió en algo que no se dibuja reusan los bytes ya codificados.
+    Con `directory` la caché además sobrevive a reinicios."""
+
+    def __init__(self, bot, image_format: str = "png", directory: str | None = None):
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Formato de imagen de formaciones desconocido: {image_format}")
+        self.bot = bot
+        self.image_format = image_format
+        self.extension = IMAGE_FORMATS[image_format][0]
+        self.directory = Path(directory) if directory else None
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+
+    @property
+    def filename(self) -> str:
+        return f"formacion.{self.extension}"
+
+    async def render(self, game: dict) -> bytes | None:
+        fingerprint = lineup_fingerprint(game)
+        if fingerprint is None:
+            return None
+        key = f"{fingerprint}-{self.image_format}"
+
+        data = self._memory.get(key) or self._read_disk(key)
+        if data is None:
+            data = await self.bot.parsing_pool.run(_render_bytes, game, self.image_format)
+            if data is None:
+                return None
+            self._write_disk(key, data)
+        else:
+            logger.info(f"LineupRenderer: formaciones {fingerprint[:12]} servidas desde la caché")
+
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        if len(self._memory) > MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+        return data
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.{self.extension}"
+
+    def _read_disk(self, key: str) -> bytes | None:
+        if self.directory is None:
+            return None
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"No pude leer la imagen de formaciones cacheada {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, data: bytes):
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._path(key).write_bytes(data)
+        except OSError as e:
+            logger.warning(f"No pude guardar la imagen de formaciones en caché {key}: {e}")
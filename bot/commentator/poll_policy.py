@@ -0,0 +1,152 @@
+import re
+import time
+from datetime import datetime
+from enum import StrEnum
+
+from config.settings import settings
+
+LIVE_STATUSES = (1, 2)
+STATUS_FINISHED = 3
+
+# Presupuesto por partido: nunca más consultas que consultar cada BASELINE_INTERVAL fijo
+# desde que se empezó a seguir. Las fases tranquilas (previa lejana, entretiempo, pelota en
+# juego sin novedades) consultan más espaciado y juntan crédito; el cierre, los penales y los
+# minutos después de un evento lo gastan. Sin crédito, el intervalo rápido se estira.
+BASELINE_INTERVAL = 30
+
+# Segundos entre consultas según la fase del partido (antes de aplicar el presupuesto).
+PRE_MATCH_FAR_INTERVAL = 120
+PRE_MATCH_NEAR_INTERVAL = 30
+LIVE_INTERVAL = 40
+HOT_INTERVAL = 15
+CLOSING_INTERVAL = 12
+HALF_TIME_INTERVAL = 120
+HALF_TIME_ENDING_INTERVAL = 30
+BREAK_INTERVAL = 30
+PENALTIES_INTERVAL = 10
+
+NEAR_KICKOFF_SECONDS = 10 * 60
+HALF_TIME_ENDING_SECONDS = 10 * 60
+HOT_WINDOW_SECONDS = 3 * 60
+CLOSING_MINUTE = 80
+EXTRA_TIME_CLOSING_MINUTE = 115
+
+_MINUTE_PATTERN = re.compile(r"(\d+)(?:\s*\+\s*(\d+))?")
+_BREAK_WORDS = ("entretiempo", "descanso")
+_EXTRA_TIME_WORDS = ("alargue", "suplementario", "tiempo extra")
+_PENALTY_WORDS = ("penales", "definición por penales")
+
+
+class MatchPhase(StrEnum):
+    PRE_MATCH = "pre_match"
+    LIVE = "live"
+    CLOSING = "closing"
+    HALF_TIME = "half_time"
+    BREAK = "break"
+    PENALTIES = "penalties"
+    FINISHED = "finished"
+
+
+def _minute(game_time) -> int | None:
+    """'45+2' -> 47, 73 -> 73, 'ET' -> None."""
+    if game_time is None:
+        return None
+    match = _MINUTE_PATTERN.search(str(game_time))
+    if not match:
+        return None
+    return int(match.group(1)) + int(match.group(2) or 0)
+
+
+def _stage_names(game: dict) -> list[str]:
+    return [(stage.get("name") or "").lower() for stage in game.get("events", [])]
+
+
+def _event_count(game: dict) -> int:
+    return sum(len(row.get("events", [])) for stage in game.get("events", []) for row in stage.get("rows", []))
+
+
+def detect_phase(game: dict) -> MatchPhase:
+    """Infiere la fase del partido a partir de `status.enum`, `game_time` y los nombres de
+    las etapas que reporta el gamecenter."""
+    status = game.get("status", {})
+    status_enum = status.get("enum", 0)
+    if status_enum == STATUS_FINISHED:
+        return MatchPhase.FINISHED
+    if status_enum not in LIVE_STATUSES:
+        return MatchPhase.PRE_MATCH
+
+    stages = _stage_names(game)
+    if any(word in name for name in stages for word in _PENALTY_WORDS):
+        return MatchPhase.PENALTIES
+
+    extra_time = any(word in name for name in stages for word in _EXTRA_TIME_WORDS)
+    game_time = game.get("game_time")
+    minute = _minute(game_time)
+    texts = (str(status.get("name") or "").lower(), str(game_time or "").lower())
+
+    # El enum no distingue pelota en juego de entretiempo; eso sale del texto del estado / reloj.
+    paused = "et" in texts or any(word in text for text in texts for word in _BREAK_WORDS)
+    if paused:
+        return MatchPhase.HALF_TIME if not extra_time and (minute is None or minute < 90) else MatchPhase.BREAK
+
+    if minute is not None and minute >= (EXTRA_TIME_CLOSING_MINUTE if extra_time else CLOSING_MINUTE):
+        return MatchPhase.CLOSING
+    return MatchPhase.LIVE
+
+
+class PollPolicy:
+    """Decide cada cuánto consultar el gamecenter de un partido. Consulta seguido con la
+    pelota en juego, más todavía en el cierre, en los penales y justo después de una
+    seguidilla de eventos; afloja en la previa lejana y en el entretiempo. En total nunca
+    supera las consultas de un poll fijo cada BASELINE_INTERVAL (ver `requests`)."""
+
+    def __init__(self, kickoff: datetime | None = None, clock=time.monotonic):
+        self.kickoff = kickoff
+        self.phase = MatchPhase.PRE_MATCH
+        self.interval: float = LIVE_INTERVAL
+        self.requests = 0
+        self._clock = clock
+        self._started = clock()
+        self._phase_since = self._started
+        self._last_event_count: int | None = None
+        self._last_activity: float | None = None
+
+    def observe(self, game: dict | None) -> float:
+        """Registra el último payload (o None si la consulta falló) y devuelve cuántos
+        segundos esperar hasta la próxima consulta."""
+        now = self._clock()
+        self.requests += 1
+        if game is not None:
+            phase = detect_phase(game)
+            if phase != self.phase:
+                self.phase = phase
+                self._phase_since = now
+
+            event_count = _event_count(game)
+            if self._last_event_count is not None and event_count > self._last_event_count:
+                self._last_activity = now
+            self._last_event_count = event_count
+
+        # La próxima consulta sale recién cuando el presupuesto la cubre: requests + 1 <= transcurrido / BASELINE_INTERVAL + 1.
+        earliest = self.requests * BASELINE_INTERVAL - (now - self._started)
+        self.interval = max(self._interval(self.phase, now), earliest)
+        return self.interval
+
+    def _interval(self, phase: MatchPhase, now: float) -> float:
+        if phase == MatchPhase.PRE_MATCH:
+            if self.kickoff is None:
+                return PRE_MATCH_NEAR_INTERVAL
+            to_kickoff = (self.kickoff - datetime.now(settings.TIMEZONE)).total_seconds()
+            return PRE_MATCH_FAR_INTERVAL if to_kickoff > NEAR_KICKOFF_SECONDS else PRE_MATCH_NEAR_INTERVAL
+        if phase == MatchPhase.HALF_TIME:
+            in_break = now - self._phase_since
+            return HALF_TIME_INTERVAL if in_break < HALF_TIME_ENDING_SECONDS else HALF_TIME_ENDING_INTERVAL
+        if phase == MatchPhase.BREAK:
+            return BREAK_INTERVAL
+        if phase == MatchPhase.PENALTIES:
+            return PENALTIES_INTERVAL
+        if phase == MatchPhase.CLOSING:
+            return CLOSING_INTERVAL
+        if self._last_activity is not None and now - self._last_activity < HOT_WINDOW_SECONDS:
+            return HOT_INTERVAL
+        return LIVE_INTERVAL
@@ -0,0 +1,143 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Devuelve cuántos segundos esperar hasta el próximo poll, o None si no hay que volver a pollear.
+PollFn = Callable[[], Awaitable[float | None]]
+
+LATE_WARNING_SECONDS = 10
+
+
+@dataclass(order=True)
+class _Entry:
+    deadline: float
+    seq: int
+    key: str = field(compare=False)
+    poll: PollFn = field(compare=False)
+    done: asyncio.Future = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+    task: asyncio.Task | None = field(default=None, compare=False)
+
+
+class PollScheduler:
+    """Un único loop que multiplexa los polls de todos los partidos en seguimiento.
+
+    Cada partido pide su próximo poll con un deadline (ahora + el intervalo que decide su
+    PollPolicy); el scheduler los atiende por deadline más cercano y nunca supera un
+    presupuesto global de requests por minuto contra la API, repartido con un token bucket.
+    Si el presupuesto no alcanza, los polls se atrasan en orden de deadline en vez de
+    amontonarse."""
+
+    def __init__(self, requests_per_minute: float):
+        self.rate = requests_per_minute / 60
+        self.capacity = max(1.0, requests_per_minute / 6)
+        self._tokens = self.capacity
+        self._refilled_at = time.monotonic()
+        self._heap: list[_Entry] = []
+        # Todos los polls vivos, estén en el heap o corriendo (sacados del heap), para que stop() los alcance.
+        self._entries: list[_Entry] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.late_polls = 0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        """Cancela el loop y todos los polls, los que esperan en el heap y los que están corriendo.
+        Cada `run()` pendiente termina con CancelledError."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for entry in self._entries:
+            entry.cancelled = True
+            if entry.task and not entry.task.done():
+                entry.task.cancel()
+            if not entry.done.done():
+                entry.done.cancel()
+        self._entries.clear()
+        self._heap.clear()
+
+    async def run(self, key: str, poll: PollFn, first_delay: float = 0):
+        """Pollea `poll` hasta que devuelva None. Si se cancela quien espera, se cancela el poll."""
+        self.start()
+        entry = _Entry(time.monotonic() + first_delay, next(self._seq), key, poll, asyncio.get_running_loop().create_future())
+        self._entries.append(entry)
+        self._push(entry)
+        try:
+            await entry.done
+        finally:
+            entry.cancelled = True
+            if entry.task and not entry.task.done():
+                entry.task.cancel()
+            if entry in self._entries:
+                self._entries.remove(entry)
+
+    def _push(self, entry: _Entry):
+        heapq.heappush(self._heap, entry)
+        self._wakeup.set()
+
+    def _take_token(self) -> float:
+        """Consume un token si hay; si no, devuelve cuánto falta para el próximo."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    async def _run(self):
+        while True:
+            while self._heap and self._heap[0].cancelled:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            wait = self._heap[0].deadline - time.monotonic()
+            if wait <= 0:
+                wait = self._take_token()
+            if wait > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            entry = heapq.heappop(self._heap)
+            lateness = time.monotonic() - entry.deadline
+            if lateness > LATE_WARNING_SECONDS:
+                self.late_polls += 1
+                logger.warning(f"PollScheduler: el poll de {entry.key} salió {lateness:.0f}s tarde por falta de presupuesto")
+            entry.task = asyncio.create_task(self._poll(entry))
+
+    async def _poll(self, entry: _Entry):
+        try:
+            interval = await entry.poll()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not entry.done.done():
+                entry.done.set_exception(e)
+            return
+
+        if entry.cancelled or entry.done.done():
+            return
+        if interval is None:
+            entry.done.set_result(None)
+            return
+        entry.deadline = time.monotonic() + interval
+        entry.seq = next(self._seq)
+        entry.task = None
+        self._push(entry)
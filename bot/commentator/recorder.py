@@ -0,0 +1,52 @@
+import gzip
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class GameRecorder:
+    """Graba cada respuesta del gamecenter de un partido en un `.jsonl.gz`, una línea por
+    consulta: `{"ts": epoch, "status": http_status, "raw": cuerpo_tal_cual}`. Sirve para
+    reproducir el partido offline con `python -m bot.commentator.replay`."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._paths: dict[str, Path] = {}
+
+    def path_for(self, match_id: str) -> Path:
+        path = self._paths.get(match_id)
+        if path is None:
+            stamp = datetime.now(settings.TIMEZONE).strftime("%Y%m%d-%H%M%S")
+            path = self.directory / f"{match_id}-{stamp}.jsonl.gz"
+            self._paths[match_id] = path
+        return path
+
+    def record(self, match_id: str, status: int, raw: str | None):
+        line = json.dumps({"ts": time.time(), "status": status, "raw": raw}, ensure_ascii=False)
+        try:
+            path = self.path_for(match_id)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Cada append es un miembro gzip nuevo; gzip.open los lee concatenados.
+            with gzip.open(path, "at", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.warning(f"No pude grabar la respuesta del gamecenter para {match_id}: {e}")
+
+    def close(self, match_id: str):
+        path = self._paths.pop(match_id, None)
+        if path:
+            logger.info(f"Grabación del partido {match_id} guardada en {path}")
+
+
+def read_recording(path: str | Path) -> Iterator[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,280 @@
+"""Reproduce offline una grabación del gamecenter (ver GameRecorder) a través del relator.
+
+    python -m bot.commentator.replay grabacion.jsonl.gz [--speed 10] [--transcript salida.txt] [--expect esperado.txt]
+
+Pasa cada respuesta grabada por `LiveMatchCommentator._track_cycle` con un messager, un
+FixtureDAO y un CommentatorStateDAO de mentira, y reporta tiempo de CPU y memoria pico por ciclo y la latencia entre
+que llega la respuesta y sale cada mensaje. También simula PollPolicy sobre los tiempos grabados y
+compara cuántas consultas habría hecho contra un poll fijo cada BASELINE_INTERVAL. Con `--expect` compara los mensajes contra una
+transcripción guardada y sale con código 1 si difieren, para usarlo como test de regresión.
+
+En tests/fixtures/replay hay una grabación chica con su transcripción esperada (misma base de
+nombre, `.txt`); tests/commentator/test_replay.py las corre todas con pytest. A mano:
+
+    python -m bot.commentator.replay tests/fixtures/replay/1ebbhcj-20251018-200000.jsonl.gz \\
+        --expect tests/fixtures/replay/1ebbhcj-20251018-200000.txt
+"""
+import argparse
+import asyncio
+import difflib
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bot.cogs.live_match_commentator import LiveMatchCommentator
+from bot.commentator.lineup_renderer import LineupRenderer
+from bot.commentator.poll_policy import BASELINE_INTERVAL, MatchPhase, PollPolicy
+from bot.commentator.recorder import read_recording
+from integrations.utils.parsing_pool import ParsingPool
+from config.settings import settings
+from models.fixture import Fixture
+from models.fixture_status import FixtureStatus
+from models.tracker_state import TrackerState
+
+
+class _ReplayResponse:
+    def __init__(self, status: int, raw: str | None):
+        self.status = status
+        self._raw = raw or ""
+
+    async def text(self) -> str:
+        return self._raw
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class ReplaySession:
+    """Hace de aiohttp.ClientSession: cada `get` devuelve la próxima respuesta grabada."""
+
+    def __init__(self):
+        self.next_record: dict | None = None
+        self.served_at = 0.0
+
+    def get(self, url, **kwargs) -> _ReplayResponse:
+        record = self.next_record
+        self.served_at = time.perf_counter()
+        return _ReplayResponse(record["status"], record["raw"])
+
+
+class StubMessager:
+    def __init__(self, session: ReplaySession):
+        self.session = session
+        self.messages: list[str] = []
+        self.latencies: list[float] = []
+        self.logs: list[str] = []
+
+    async def commentator_update(self, msg: str, embed=None, file=None, thread=None):
+        self.latencies.append(time.perf_counter() - self.session.served_at)
+        if embed is not None:
+            msg = f"{msg}[embed: {embed.title}, {len(embed.fields)} campos{', con imagen' if file else ''}]"
+        self.messages.append(msg)
+        delivered = asyncio.get_running_loop().create_future()
+        delivered.set_result(None)
+        return delivered
+
+    async def log(self, msg: str, level: str = "INFO", **kwargs):
+        self.logs.append(f"[{level}] {msg}")
+
+
+class StubFixtureDAO:
+    """El kickoff queda un día en el futuro para que el arranque se anuncie por estado en
+    vivo y no por reloj, y el replay sea determinístico."""
+
+    def __init__(self, match_id: str):
+        self.fixture = Fixture(
+            match_id=match_id,
+            home_team="Local",
+            away_team="Visitante",
+            match_date=datetime.now(settings.TIMEZONE) + timedelta(days=1),
+            competition="Replay",
+            venue="Estadio de prueba",
+            status=FixtureStatus.LIVE,
+            id="replay",
+        )
+
+    async def get_fixture_by_id(self, fixture_id: str) -> Fixture:
+        return self.fixture
+
+    async def update_status(self, fixture_id: str, status: FixtureStatus):
+        self.fixture.status = status
+
+    async def update_score(self, fixture_id: str, home_score: int, away_score: int, status: FixtureStatus = FixtureStatus.FINISHED):
+        self.fixture.home_score, self.fixture.away_score, self.fixture.status = home_score, away_score, status
+
+
+class StubCommentatorStateDAO:
+    def __init__(self):
+        self.states: dict[str, TrackerState] = {}
+
+    async def save(self, state: TrackerState):
+        seen_events = self.states[state.match_id].seen_events if state.match_id in self.states else set()
+        state.seen_events = seen_events
+        self.states[state.match_id] = state
+
+    async def add_seen(self, match_id: str, *event_keys: str):
+        self.states.setdefault(match_id, TrackerState(match_id)).seen_events.update(event_keys)
+
+    async def get(self, match_id: str) -> TrackerState | None:
+        return self.states.get(match_id)
+
+    async def delete(self, match_id: str):
+        self.states.pop(match_id, None)
+
+
+@dataclass
+class StubBot:
+    messager: StubMessager
+    fixture_dao: StubFixtureDAO
+    commentator_state_dao: StubCommentatorStateDAO = field(default_factory=StubCommentatorStateDAO)
+    parsing_pool: ParsingPool = field(default_factory=ParsingPool)
+
+
+@dataclass
+class ReplayReport:
+    cycles: int = 0
+    cpu_seconds: list[float] = field(default_factory=list)
+    peak_bytes: list[int] = field(default_factory=list)
+    latencies: list[float] = field(default_factory=list)
+    messages: list[str] = field(default_factory=list)
+    logs: list[str] = field(default_factory=list)
+
+
+def _match_id(path: Path) -> str:
+    return path.name.split("-", 1)[0]
+
+
+async def replay(path: Path, speed: float = 0, trace_allocations: bool = False) -> ReplayReport:
+    """`speed=0` reproduce sin esperas; `speed=N` respeta los tiempos grabados acelerados N veces."""
+    records = list(read_recording(path))
+    match_id = _match_id(path)
+    session = ReplaySession()
+    bot = StubBot(StubMessager(session), StubFixtureDAO(match_id))
+    commentator = LiveMatchCommentator(bot)
+    commentator.recorder = None
+    commentator.lineup_renderer = LineupRenderer(bot, settings.LINEUP_IMAGE_FORMAT)
+    commentator.active_trackers[match_id] = commentator._new_tracker_state(bot.fixture_dao.fixture.match_date)
+
+    report = ReplayReport()
+    if trace_allocations:
+        tracemalloc.start()
+    try:
+        previous_ts = None
+        for record in records:
+            if speed and previous_ts is not None:
+                await asyncio.sleep(max(0.0, record["ts"] - previous_ts) / speed)
+            previous_ts = record["ts"]
+
+            session.next_record = record
+            if trace_allocations:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            cpu_start = time.process_time()
+            finished = await commentator._track_cycle(session, match_id, bot.fixture_dao.fixture.id)
+            report.cpu_seconds.append(time.process_time() - cpu_start)
+            if trace_allocations:
+                report.peak_bytes.append(tracemalloc.get_traced_memory()[1] - baseline)
+            report.cycles += 1
+            if finished:
+                break
+    finally:
+        if trace_allocations:
+            tracemalloc.stop()
+        bot.parsing_pool.shutdown()
+
+    report.latencies = bot.messager.latencies
+    report.messages = bot.messager.messages
+    report.logs = bot.messager.logs
+    return report
+
+
+def simulate_polling(path: Path) -> tuple[int, int]:
+    """Corre PollPolicy sobre el eje de tiempo de la grabación (en cada consulta simulada ve la
+    última respuesta grabada hasta ese momento). Devuelve (consultas de la política, consultas
+    de un poll fijo cada BASELINE_INTERVAL) para el mismo tramo."""
+    records = list(read_recording(path))
+    start, end = records[0]["ts"], records[-1]["ts"]
+    now = start
+    policy = PollPolicy(clock=lambda: now)
+    index = 0
+    while now <= end:
+        while index + 1 < len(records) and records[index + 1]["ts"] <= now:
+            index += 1
+        record = records[index]
+        game = json.loads(record["raw"]).get("game") if record["status"] == 200 and record["raw"] else None
+        now += policy.observe(game)
+        if policy.phase == MatchPhase.FINISHED:
+            break
+    return policy.requests, int((end - start) // BASELINE_INTERVAL) + 1
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _print_report(path: Path, timing: ReplayReport, memory: ReplayReport):
+    cpu_ms = [s * 1000 for s in timing.cpu_seconds]
+    latency_ms = [s * 1000 for s in timing.latencies]
+    peak_kib = [b / 1024 for b in memory.peak_bytes]
+    print(f"{path.name}: {timing.cycles} ciclos, {len(timing.messages)} mensajes, {len(timing.logs)} logs")
+    if cpu_ms:
+        print(
+            f"  CPU por ciclo: media {statistics.mean(cpu_ms):.2f}ms, p50 {_percentile(cpu_ms, 0.5):.2f}ms, "
+            f"p95 {_percentile(cpu_ms, 0.95):.2f}ms, máx {max(cpu_ms):.2f}ms, total {sum(cpu_ms):.1f}ms"
+        )
+    if peak_kib:
+        print(f"  Memoria pico por ciclo: media {statistics.mean(peak_kib):.1f}KiB, máx {max(peak_kib):.1f}KiB")
+    if latency_ms:
+        print(
+            f"  Latencia respuesta -> mensaje: p50 {_percentile(latency_ms, 0.5):.2f}ms, "
+            f"p95 {_percentile(latency_ms, 0.95):.2f}ms, máx {max(latency_ms):.2f}ms"
+        )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Reproduce grabaciones del gamecenter a través del relator.")
+    parser.add_argument("recordings", nargs="+", type=Path)
+    parser.add_argument("--speed", type=float, default=0, help="0 = sin esperas (default); N = N veces más rápido que en vivo")
+    parser.add_argument("--transcript", type=Path, help="guarda los mensajes generados en este archivo")
+    parser.add_argument("--expect", type=Path, help="compara los mensajes contra esta transcripción")
+    args = parser.parse_args()
+    if (args.transcript or args.expect) and len(args.recordings) > 1:
+        parser.error("--transcript y --expect van con una sola grabación")
+
+    failed = False
+    for path in args.recordings:
+        # Dos pasadas: tracemalloc infla el tiempo de CPU, así que la memoria se mide aparte.
+        timing = await replay(path, args.speed)
+        memory = await replay(path, trace_allocations=True)
+        _print_report(path, timing, memory)
+        requests, baseline = simulate_polling(path)
+        print(f"  Consultas con PollPolicy sobre los tiempos grabados: {requests} (poll fijo cada {BASELINE_INTERVAL}s: {baseline})")
+        if timing.messages != memory.messages:
+            print("  ¡Las dos pasadas generaron mensajes distintos! El relator no es determinístico.")
+            failed = True
+
+        transcript = "\n".join(timing.messages) + "\n"
+        if args.transcript:
+            args.transcript.write_text(transcript, encoding="utf-8")
+        if args.expect:
+            expected = args.expect.read_text(encoding="utf-8")
+            if expected != transcript:
+                diff = difflib.unified_diff(expected.splitlines(), transcript.splitlines(), "esperado", "obtenido", lineterm="")
+                print("\n".join(diff))
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,142 @@
+import asyncio
+import io
+import time
+import traceback
+from dataclasses import dataclass, field
+
+import discord
+
+from bot.config.outbound_queue import MESSAGE_LIMIT, OutboundQueue
+
+LEVEL_PREFIXES = {"ERROR": "`[ERROR]`", "WARNING": "`[ADVERTENCIA]`", "INFO": "`[INFO]`"}
+LEVEL_ORDER = ("ERROR", "WARNING", "INFO")
+TRACEBACK_LIMIT = 1900
+
+
+def format_traceback(exc: BaseException) -> str:
+    return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+
+
+@dataclass
+class _Record:
+    level: str
+    msg: str
+    traceback: str | None
+    first_at: float
+    count: int = 1
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+    @property
+    def prefix(self) -> str:
+        return LEVEL_PREFIXES.get(self.level, LEVEL_PREFIXES["INFO"])
+
+    def line(self) -> str:
+        repeated = f" (×{self.count})" if self.count > 1 else ""
+        return f"{self.prefix} {self.msg}{repeated}"
+
+
+class LogSink:
+    """Junta los WARNING/ERROR que van al canal del robot durante `window` segundos y los manda de una.
+
+    Los registros iguales (mismo nivel y texto) se cuentan en vez de repetirse. Un solo registro
+    sale igual que antes, con su traceback; varios salen en un mensaje compacto y, si no entran,
+    en un resumen con el detalle completo adjunto como archivo. Todo mensaje arranca con el
+    prefijo del nivel más grave del lote, así `!limpiar` los sigue encontrando."""
+
+    def __init__(self, outbound: OutboundQueue, channel: discord.abc.Messageable, window: float):
+        self.outbound = outbound
+        self.channel = channel
+        self.window = window
+        self._records: dict[tuple[str, str], _Record] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self.flushes = 0
+        self.received = 0
+
+    def add(self, msg: str, level: str = "INFO", exc: BaseException = None) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.received += 1
+
+        key = (level, msg)
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = _Record(level, msg, format_traceback(exc) if exc else None, time.monotonic())
+        else:
+            record.count += 1
+        record.futures.append(future)
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self.flush)
+        return future
+
+    def send_now(self, msg: str, level: str = "INFO", exc: BaseException = None) -> asyncio.Future:
+        """Manda un registro solo, sin esperar la ventana (respuestas a comandos, avisos INFO)."""
+        record = _Record(level, msg, format_traceback(exc) if exc else None, time.monotonic())
+        return self.outbound.submit(self.channel, _single(record))
+
+    def flush(self):
+        """Manda lo acumulado. Devuelve enseguida; cada future se resuelve con el mensaje enviado."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        records, self._records = list(self._records.values()), {}
+        if not records:
+            return
+
+        content, file = self._render(records)
+        self.flushes += 1
+        delivery = self.outbound.submit(self.channel, content, file=file)
+        delivery.add_done_callback(lambda f: _propagate(f, records))
+
+    def _render(self, records: list[_Record]) -> tuple[str, discord.File | None]:
+        if len(records) == 1 and records[0].count == 1:
+            return _single(records[0]), None
+
+        worst = min(records, key=lambda r: LEVEL_ORDER.index(r.level) if r.level in LEVEL_ORDER else len(LEVEL_ORDER))
+        total = sum(r.count for r in records)
+        header = f"{worst.prefix} {total} registros en {self.window:g}s ({len(records)} distintos):"
+        lines = [header] + [record.line() for record in records]
+        content = "\n".join(lines)
+        has_tracebacks = any(record.traceback for record in records)
+        if len(content) <= MESSAGE_LIMIT and not has_tracebacks:
+            return content, None
+
+        # No entra o hay tracebacks: resumen en el mensaje y el detalle completo como adjunto.
+        summary = header
+        for line in lines[1:]:
+            if len(summary) + len(line) + 40 > MESSAGE_LIMIT:
+                summary += "\n… (sigue en el adjunto)"
+                break
+            summary += f"\n{line}"
+        detail = "\n\n".join(
+            record.line() + (f"\n{record.traceback}" if record.traceback else "") for record in records
+        )
+        return summary, discord.File(io.BytesIO(detail.encode("utf-8")), filename="registros.txt")
+
+
+def _single(record: _Record) -> str:
+    content = record.line()
+    if record.traceback:
+        max_tb = TRACEBACK_LIMIT - len(content)
+        if max_tb > 80:
+            tb_str = record.traceback
+            if len(tb_str) > max_tb:
+                tb_str = "...\n" + tb_str[-max_tb:]
+            content += f"\n```\n{tb_str}```"
+    if len(content) > MESSAGE_LIMIT:
+        content = content[:MESSAGE_LIMIT - 3] + "..."
+    return content
+
+
+def _propagate(delivery: asyncio.Future, records: list[_Record]):
+    for record in records:
+        for future in record.futures:
+            if future.done():
+                continue
+            if delivery.cancelled():
+                future.cancel()
+            elif delivery.exception() is not None:
+                future.set_exception(delivery.exception())
+                future.exception()
+            else:
+                future.set_result(delivery.result())
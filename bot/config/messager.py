@@ -1,15 +1,21 @@
+import asyncio
 import logging
-import traceback
+from functools import partial
 import discord
+from bot.config.log_sink import LogSink
+from bot.config.outbound_queue import OutboundQueue
 from config.settings import settings
 from models.news_source import NewsSource
 
 logger = logging.getLogger(__name__)
 
 class Messager:
+    """Los envíos a canales pasan por `outbound` y devuelven un future con el mensaje, sin
+    esperar a Discord; quien necesita el `discord.Message` hace `await` sobre ese future."""
 
     def __init__(self, bot):
         self.bot = bot
+        self.outbound = OutboundQueue()
         self.guild = self.bot.get_guild(settings.GUILD_ID)
         if not self.guild:
             raise RuntimeError(f"Mensajero invocado antes de conectarse al servidor.")
@@ -43,18 +49,38 @@ class Messager:
         if missing_channels:
             raise RuntimeError(f"Canales no encontrados: {', '.join(str(c) for c in missing_channels)}. Revisá las configuraciones.")
 
-    async def commentator_update(self, msg: str, embed: discord.Embed = None, file: discord.File = None):
-        """Envía una actualización sobre el partido en vivo"""
-        if embed:
-            await self.commentator_channel.send(content=msg, embed=embed, file=file)
-        else:
-            await self.commentator_channel.send(msg)
+        self.log_sink = LogSink(self.outbound, self.devil_robot_channel, settings.LOG_FLUSH_SECONDS)
+
+    async def commentator_update(
+        self, msg: str, embed: discord.Embed = None, file: discord.File = None, thread: discord.Thread = None
+    ) -> asyncio.Future:
+        """Envía una actualización sobre el partido en vivo, al canal del relator o al hilo del partido.
+        Los textos sueltos que se juntan en la cola (ej. gol + tarjeta en el mismo poll) salen en un solo mensaje."""
+        destination = thread or self.commentator_channel
+        return self.outbound.submit(destination, msg, embed=embed, file=file, coalesce=True)
+
+    async def commentator_thread(self, name: str, thread_id: int = None) -> discord.Thread:
+        """Devuelve el hilo del partido en el canal del relator, reusando `thread_id` si todavía existe."""
+        if thread_id:
+            thread = self.guild.get_thread(thread_id)
+            if thread is None:
+                try:
+                    thread = await self.bot.fetch_channel(thread_id)
+                except (discord.NotFound, discord.Forbidden):
+                    thread = None
+            if thread is not None:
+                return thread
+        return await self.commentator_channel.create_thread(
+            name=name[:100],
+            type=discord.ChannelType.public_thread,
+            auto_archive_duration=1440
+        )
 
-    async def chat(self, msg: str):
-        await self.general_channel.send(msg)
+    async def chat(self, msg: str) -> asyncio.Future:
+        return self.outbound.submit(self.general_channel, msg)
     
-    async def announce(self, msg: str):
-        await self.announcements_channel.send(msg)
+    async def announce(self, msg: str) -> asyncio.Future:
+        return self.outbound.submit(self.announcements_channel, msg)
 
     async def news(self, type: NewsSource, title: str, description: str, url: str, image_url: str = None, publisher: str = "", color = "#DDDDDD"):
         try:
@@ -74,14 +100,20 @@ class Messager:
             if isinstance(type, str):
                 type = NewsSource(type)
             
-            if NewsSource.OFFICIAL == type:
-                await self.club_channel.send(embed=embed)
-            else:
-                await self.press_channel.send(embed=embed)
+            channel = self.club_channel if NewsSource.OFFICIAL == type else self.press_channel
+            future = self.outbound.submit(channel, embed=embed, pack=True)
+            future.add_done_callback(partial(self._report_news_failure, url, type))
+            return future
         
         except Exception as e:
             await self.log(f"Error al enviar noticia {url} a canal {type}: {e}", level="ERROR", exc=e)
 
+    def _report_news_failure(self, url: str, type: NewsSource, future: asyncio.Future):
+        if future.cancelled() or future.exception() is None:
+            return
+        e = future.exception()
+        asyncio.create_task(self.log(f"Error al enviar noticia {url} a canal {type}: {e}", level="ERROR", exc=e))
+
     async def minecraft_status(self, embed: discord.Embed, message_id: int = None) -> discord.Message:
         """Edita el banner de estado del server si existe, o crea uno nuevo."""
         if message_id:
@@ -91,7 +123,7 @@ class Messager:
                 return message
             except discord.NotFound:
                 pass
-        return await self.minecraft_channel.send(embed=embed)
+        return await self.outbound.submit(self.minecraft_channel, embed=embed)
 
     async def hardware_monitor_status(self, embed: discord.Embed, message_id: int = None) -> discord.Message:
         """Edita el banner de estado de hardware de la PC de Minecraft si existe, o crea uno nuevo."""
@@ -102,13 +134,13 @@ class Messager:
                 return message
             except discord.NotFound:
                 pass
-        return await self.devil_robot_channel.send(embed=embed)
+        return await self.outbound.submit(self.devil_robot_channel, embed=embed)
 
-    async def hardware_monitor_alert(self, msg: str):
-        await self.devil_robot_channel.send(msg)
+    async def hardware_monitor_alert(self, msg: str) -> asyncio.Future:
+        return self.outbound.submit(self.devil_robot_channel, msg)
 
-    async def announce_interactive(self, msg: str, view):
-        await self.announcements_channel.send(msg, view=view)
+    async def announce_interactive(self, msg: str, view) -> asyncio.Future:
+        return self.outbound.submit(self.announcements_channel, msg, view=view)
 
     async def post_thread(self,title:str,content:str):
         return await self.football_forum.create_thread(
@@ -118,28 +150,21 @@ class Messager:
         )
 
     async def add_to_catalogue(self, title: str, attachment_file: discord.File):
-        message = await self.games_channel.send(content=title, file=attachment_file)
-        return message
+        return await self.outbound.submit(self.games_channel, title, file=attachment_file)
     
-    async def log(self, msg: str, level: str = "INFO", exc: Exception = None):
+    async def log(self, msg: str, level: str = "INFO", exc: Exception = None, immediate: bool = False) -> asyncio.Future:
+        """Loguea local y al canal del robot. Los WARNING/ERROR se juntan unos segundos en
+        `log_sink` (con repetidos contados) para que una racha de errores no sean cientos de
+        mensajes. INFO y `immediate=True` (respuestas a comandos) salen sin esperar la ventana."""
         log_method = {"ERROR": logger.error, "WARNING": logger.warning}.get(level, logger.info)
         log_method(msg, exc_info=exc if exc else False)
+        if immediate or level not in ("ERROR", "WARNING"):
+            return self.log_sink.send_now(msg, level, exc)
+        return self.log_sink.add(msg, level, exc)
 
-        prefix = {"ERROR": "`[ERROR]`", "WARNING": "`[ADVERTENCIA]`"}.get(level, "`[INFO]`")
-        discord_msg = f"{prefix} {msg}"
-
-        if exc:
-            tb_str = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
-            max_tb = 1900 - len(discord_msg)
-            if max_tb > 80:
-                if len(tb_str) > max_tb:
-                    tb_str = "...\n" + tb_str[-max_tb:]
-                discord_msg += f"\n```\n{tb_str}```"
-
-        if len(discord_msg) > 2000:
-            discord_msg = discord_msg[:1997] + "..."
-
-        await self.devil_robot_channel.send(discord_msg)
+    async def close(self):
+        self.log_sink.flush()
+        await self.outbound.close()
 
 def init_messager(bot):
     if not hasattr(bot, 'messager') or bot.messager is None:
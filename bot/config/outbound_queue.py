@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Límites de Discord por mensaje y el bucket típico de envíos por canal (5 cada 5 segundos).
+MESSAGE_LIMIT = 2000
+EMBEDS_PER_MESSAGE = 10
+EMBED_TOTAL_LIMIT = 6000
+CHANNEL_BURST = 5
+CHANNEL_WINDOW_SECONDS = 5.0
+
+
+@dataclass
+class _Outgoing:
+    content: str
+    embeds: list[discord.Embed]
+    file: discord.File | None
+    view: discord.ui.View | None
+    coalesce: bool
+    pack: bool
+    future: asyncio.Future
+
+    def send_kwargs(self) -> dict:
+        kwargs = {"content": self.content or None}
+        if self.embeds:
+            kwargs["embeds"] = self.embeds
+        if self.file:
+            kwargs["file"] = self.file
+        if self.view:
+            kwargs["view"] = self.view
+        return kwargs
+
+
+@dataclass
+class _ChannelQueue:
+    channel: discord.abc.Messageable
+    pending: deque[_Outgoing] = field(default_factory=deque)
+    sent_at: deque[float] = field(default_factory=lambda: deque(maxlen=CHANNEL_BURST))
+    task: asyncio.Task | None = None
+
+
+class OutboundQueue:
+    """Cola de salida por canal para todo lo que manda el Messager.
+
+    Quien encola recibe un future con el `discord.Message` enviado y sigue de largo: un
+    scraper o el relator no se quedan esperando a Discord. Cada canal tiene su worker, que
+    respeta el bucket de envíos del canal antes de que Discord devuelva un 429 y, mientras
+    espera, junta lo acumulado: textos cortos seguidos (`coalesce`) salen como un solo
+    mensaje y embeds sueltos seguidos (`pack`) se empaquetan de a 10."""
+
+    def __init__(self):
+        self._channels: dict[int, _ChannelQueue] = {}
+
+    def submit(
+        self,
+        channel: discord.abc.Messageable,
+        content: str = "",
+        embed: discord.Embed = None,
+        file: discord.File = None,
+        view: discord.ui.View = None,
+        coalesce: bool = False,
+        pack: bool = False,
+    ) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        # Si nadie mira el resultado, que el error no termine en "exception was never retrieved".
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        item = _Outgoing(
+            content=content or "",
+            embeds=[embed] if embed else [],
+            file=file,
+            view=view,
+            coalesce=coalesce and not (embed or file or view),
+            pack=pack and embed is not None and not (content or file or view),
+            future=future,
+        )
+
+        queue = self._channels.get(channel.id)
+        if queue is None:
+            queue = self._channels[channel.id] = _ChannelQueue(channel)
+        queue.pending.append(item)
+        if queue.task is None or queue.task.done():
+            queue.task = asyncio.create_task(self._drain(queue))
+        return future
+
+    def pending(self) -> int:
+        return sum(len(queue.pending) for queue in self._channels.values())
+
+    async def close(self, timeout: float = 10):
+        """Espera a que se vacíen las colas (hasta `timeout`) y corta los workers."""
+        tasks = [queue.task for queue in self._channels.values() if queue.task and not queue.task.done()]
+        if tasks:
+            _, still_running = await asyncio.wait(tasks, timeout=timeout)
+            for task in still_running:
+                task.cancel()
+        for queue in self._channels.values():
+            for item in queue.pending:
+                item.future.cancel()
+            queue.pending.clear()
+
+    async def _drain(self, queue: _ChannelQueue):
+        # Un tick para que lo que se encola en la misma pasada del productor salga junto.
+        await asyncio.sleep(0)
+        while queue.pending:
+            await self._wait_for_bucket(queue)
+            kwargs, batch = self._next_batch(queue.pending)
+            queue.sent_at.append(time.monotonic())
+            try:
+                message = await queue.channel.send(**kwargs)
+            except asyncio.CancelledError:
+                for item in batch:
+                    item.future.cancel()
+                raise
+            except Exception as e:
+                logger.warning(f"OutboundQueue: no pude mandar {len(batch)} mensaje(s) a {queue.channel}: {e}")
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                continue
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_result(message)
+
+    @staticmethod
+    async def _wait_for_bucket(queue: _ChannelQueue):
+        if len(queue.sent_at) < CHANNEL_BURST:
+            return
+        wait = queue.sent_at[0] + CHANNEL_WINDOW_SECONDS - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    @staticmethod
+    def _next_batch(pending: deque[_Outgoing]) -> tuple[dict, list[_Outgoing]]:
+        first = pending.popleft()
+        batch = [first]
+
+        if first.coalesce:
+            content = first.content
+            while pending and pending[0].coalesce and len(content) + 1 + len(pending[0].content) <= MESSAGE_LIMIT:
+                item = pending.popleft()
+                content = f"{content}\n{item.content}"
+                batch.append(item)
+            return {"content": content}, batch
+
+        if first.pack:
+            embeds = list(first.embeds)
+            size = sum(len(embed) for embed in embeds)
+            while (
+                pending and pending[0].pack
+                and len(embeds) + len(pending[0].embeds) <= EMBEDS_PER_MESSAGE
+                and size + sum(len(embed) for embed in pending[0].embeds) <= EMBED_TOTAL_LIMIT
+            ):
+                item = pending.popleft()
+                embeds.extend(item.embeds)
+                size += sum(len(embed) for embed in item.embeds)
+                batch.append(item)
+            return {"embeds": embeds}, batch
+
+        return first.send_kwargs(), batch
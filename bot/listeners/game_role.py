@@ -30,7 +30,7 @@ class GameRoleHandler(commands.Cog):
             if not member or member.bot:
                 return
 
-            game = self.bot.games_dao.get_game_by_message_id(payload.message_id)
+            game = await self.bot.games_dao.get_game_by_message_id(payload.message_id)
             if not game:
                 await self.bot.messager.log(f"No encontré ningún juego para el mensaje {payload.message_id}.", level="WARNING")
                 return
@@ -58,7 +58,7 @@ class GameRoleHandler(commands.Cog):
         guild = self.bot.get_guild(payload.guild_id)
 
         try:
-            game = self.bot.games_dao.get_game_by_message_id(payload.message_id)
+            game = await self.bot.games_dao.get_game_by_message_id(payload.message_id)
             if not game:
                 await self.bot.messager.log(f"No encontré ningún juego para el mensaje {payload.message_id}.", level="WARNING")
                 return
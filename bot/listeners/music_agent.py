@@ -65,12 +65,10 @@ class MusicAgent(commands.Cog):
         self._cleanup_expired.start()
 
     async def cog_load(self):
-        self._session = aiohttp.ClientSession()
+        self._session = self.bot.http_client.session("deepseek")
 
     async def cog_unload(self):
         self._cleanup_expired.cancel()
-        if self._session:
-            await self._session.close()
 
     @tasks.loop(seconds=30)
     async def _cleanup_expired(self):
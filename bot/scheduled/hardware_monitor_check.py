@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from discord.ext import commands, tasks
 
 from config.settings import settings
+from data_access.hardware_history_dao import ROLLUP_MINUTES, bucket_start
 from integrations import hardware_monitor
 from models.hardware_snapshot import HardwareSnapshot, format_duration
 from utils.date_format import format_time
@@ -12,11 +13,16 @@ class HardwareMonitorCheckScheduler(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.banner_message_id = settings.HARDWARE_MONITOR_STATUS_MESSAGE_ID
-
-        state = self.bot.hardware_monitor_dao.get_latest()
-        self.is_online = state["is_online"] if state else True
-        self.last_snapshot = HardwareSnapshot.from_dict(state["snapshot"]) if state and state.get("snapshot") else None
+        self.is_online = True
+        self.last_snapshot = None
         self.went_offline_at = None
+        self.rolled_up_until: dict[int, datetime] = {}
+
+    async def cog_load(self):
+        state = await self.bot.hardware_monitor_dao.get_latest()
+        if state:
+            self.is_online = state["is_online"]
+            self.last_snapshot = HardwareSnapshot.from_dict(state["snapshot"]) if state.get("snapshot") else None
 
     def cog_unload(self):
         self.hardware_monitor_scheduled_job.cancel()
@@ -28,7 +34,7 @@ class HardwareMonitorCheckScheduler(commands.Cog):
     @tasks.loop(minutes=1)
     async def hardware_monitor_scheduled_job(self):
         try:
-            snapshot = await hardware_monitor.get_status()
+            snapshot = await hardware_monitor.get_status(self.bot.http_client.session("hardware_monitor"))
             now = datetime.now(settings.TIMEZONE)
 
             if snapshot is not None:
@@ -38,12 +44,13 @@ class HardwareMonitorCheckScheduler(commands.Cog):
                         if self.went_offline_at else ""
                     )
                     await self.bot.messager.hardware_monitor_alert(f"✅ Volvió la PC de Minecraft{downtime}.")
-                    self.bot.hardware_monitor_dao.log_transition(is_online=True, snapshot=snapshot, timestamp=now)
+                    await self.bot.hardware_monitor_dao.log_transition(is_online=True, snapshot=snapshot, timestamp=now)
                     self.went_offline_at = None
 
                 self.is_online = True
                 self.last_snapshot = snapshot
-                self.bot.hardware_monitor_dao.save_latest(snapshot, is_online=True)
+                await self.bot.hardware_monitor_dao.save_latest(snapshot, is_online=True)
+                await self.bot.hardware_history_dao.record(snapshot, now)
 
                 embed = self._build_embed(snapshot, now)
                 message = await self.bot.messager.hardware_monitor_status(embed, self.banner_message_id)
@@ -57,13 +64,31 @@ class HardwareMonitorCheckScheduler(commands.Cog):
                 if self.is_online:
                     self.went_offline_at = now
                     await self.bot.messager.hardware_monitor_alert(self._crash_message())
-                    self.bot.hardware_monitor_dao.log_transition(is_online=False, snapshot=self.last_snapshot, timestamp=now)
+                    await self.bot.hardware_monitor_dao.log_transition(is_online=False, snapshot=self.last_snapshot, timestamp=now)
 
                 self.is_online = False
-                self.bot.hardware_monitor_dao.save_latest(self.last_snapshot, is_online=False)
+                await self.bot.hardware_monitor_dao.save_latest(self.last_snapshot, is_online=False)
+
+            await self._roll_up(now)
         except Exception as e:
             await self.bot.messager.log(f"No pude chequear el hardware de la PC de Minecraft: {e}", level="ERROR", exc=e)
 
+    async def _roll_up(self, now: datetime):
+        """Agrega los buckets de 15 minutos y de una hora que se cerraron desde la última vez.
+        Al arrancar retoma desde el último agregado guardado (o desde la muestra cruda más vieja que quede)."""
+        for minutes in ROLLUP_MINUTES:
+            closed_until = bucket_start(now, minutes)
+            done_until = self.rolled_up_until.get(minutes)
+            if done_until is None:
+                latest = await self.bot.hardware_history_dao.latest_rollup(minutes)
+                done_until = (
+                    latest + timedelta(minutes=minutes) if latest
+                    else closed_until - timedelta(days=settings.HARDWARE_HISTORY_RAW_DAYS)
+                )
+            if done_until < closed_until:
+                await self.bot.hardware_history_dao.rollup(minutes, done_until, closed_until)
+            self.rolled_up_until[minutes] = closed_until
+
     def _crash_message(self) -> str:
         if self.last_snapshot is None:
             return "🔴 Se cayó la PC de Minecraft y no tengo métricas previas."
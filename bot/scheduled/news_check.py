@@ -1,3 +1,5 @@
+import asyncio
+
 from discord.ext import commands, tasks
 
 from integrations.doble_amarilla import DobleAmarillaScraper
@@ -21,12 +23,16 @@ class NewsCheckScheduler(commands.Cog):
 
     @tasks.loop(hours=1)
     async def news_scheduled_job(self):
-        try:
-            await self.ole_scraper.scrape_news()
-            await self.tyc_scraper.scrape_news()
-            await self.doble_amarilla_scraper.scrape_news()
-        except Exception as e:
-            await self.bot.messager.log(f"No pude completar el ciclo de noticias: {e}", level="ERROR", exc=e)
+        # Cada medio tiene su propio throttle, así que corren a la par y el ciclo dura lo que el más lento.
+        results = await asyncio.gather(
+            self.ole_scraper.scrape_news(),
+            self.tyc_scraper.scrape_news(),
+            self.doble_amarilla_scraper.scrape_news(),
+            return_exceptions=True,
+        )
+        for e in results:
+            if isinstance(e, Exception):
+                await self.bot.messager.log(f"No pude completar el ciclo de noticias: {e}", level="ERROR", exc=e)
 
 
 async def setup(bot):
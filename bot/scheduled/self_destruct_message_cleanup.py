@@ -20,10 +20,10 @@ class SelfDestructMessageCleanupScheduler(commands.Cog):
     @tasks.loop(minutes=1)
     async def cleanup_job(self):
         try:
-            due = self.bot.self_destruct_message_dao.get_due(datetime.now(settings.TIMEZONE))
+            due = await self.bot.self_destruct_message_dao.get_due(datetime.now(settings.TIMEZONE))
             for message in due:
                 await self._delete_message(message.user_id, message.message_id)
-                self.bot.self_destruct_message_dao.delete_by_message_id(message.message_id)
+                await self.bot.self_destruct_message_dao.delete_by_message_id(message.message_id)
         except Exception as e:
             await self.bot.messager.log(f"No pude limpiar mensajes autodestructivos vencidos: {e}", level="ERROR", exc=e)
 
@@ -15,7 +15,8 @@ class TwitterCheckScheduler(commands.Cog):
         if not self.twitter_scheduled_job.is_running():
             self.twitter_scheduled_job.start()
 
-    @tasks.loop(minutes=20)
+    # Cada cuenta tiene su propio próximo poll (ver Twitter.schedule); el loop solo atiende las vencidas.
+    @tasks.loop(minutes=1)
     async def twitter_scheduled_job(self):
         try:
             await self.twitter.check_rss_notifications()
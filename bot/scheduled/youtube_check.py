@@ -15,7 +15,8 @@ class YouTubeCheckScheduler(commands.Cog):
         if not self.youtube_scheduled_job.is_running():
             self.youtube_scheduled_job.start()
 
-    @tasks.loop(minutes=10)
+    # Cada cuenta tiene su propio próximo poll (ver YouTube.schedule); el loop solo atiende las vencidas.
+    @tasks.loop(minutes=1)
     async def youtube_scheduled_job(self):
         try:
             await self.youtube.check_rss_notifications()
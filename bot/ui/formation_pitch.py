@@ -1,5 +1,8 @@
+import hashlib
 import io
+import json
 import os
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 
 CANVAS_W = 1000
@@ -34,6 +37,24 @@ FONT_NAME = _load_font(bold=True, size=20)
 
 UNCONFIRMED_COLOR = (255, 165, 0)
 
+# Formato de salida -> (extensión, función que codifica). "png8" cuantiza a paleta y "webp"
+# comprime con pérdida: los dos pesan bastante menos que el PNG a color completo.
+IMAGE_FORMATS = {
+    "png": ("png", lambda image, buffer: image.save(buffer, format="PNG")),
+    "png8": ("png", lambda image, buffer: image.quantize(
+        colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE
+    ).save(buffer, format="PNG")),
+    "webp": ("webp", lambda image, buffer: image.save(buffer, format="WEBP", quality=80, method=0)),
+}
+
+# Lienzo de 1x1 solo para medir texto: textbbox no depende del contenido del lienzo.
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGB", (1, 1)), "RGBA")
+
+
+@lru_cache(maxsize=2048)
+def _text_bbox(text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int, int, int]:
+    return _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+
 
 def lineup_confirmed(lineup: dict) -> bool:
     return (lineup.get("status") or "").strip().lower() == "confirmado"
@@ -102,6 +123,14 @@ def _draw_pitch(draw: ImageDraw.ImageDraw):
         draw.arc([cx - corner_r, cy - corner_r, cx + corner_r, cy + corner_r], start=start, end=start + 90, fill=LINE_COLOR, width=3)
 
 
+@lru_cache(maxsize=1)
+def _pitch_template() -> Image.Image:
+    """La cancha vacía (pasto, líneas, áreas) se dibuja una sola vez; cada render parte de una copia."""
+    image = Image.new("RGB", (CANVAS_W, CANVAS_H), (30, 30, 30))
+    _draw_pitch(ImageDraw.Draw(image, "RGBA"))
+    return image
+
+
 HALFWAY_GAP = 0.15  # deja un colchón cerca de la línea de mitad de cancha para que las dos líneas de ataque no se pisen
 
 
@@ -122,24 +151,52 @@ def _draw_player(draw: ImageDraw.ImageDraw, player: dict, pos: tuple[float, floa
     draw.ellipse([px - r, py - r, px + r, py + r], fill=fill_color, outline=(255, 255, 255), width=3)
 
     number = str(player.get("jersey_num", "?"))
-    bbox = draw.textbbox((0, 0), number, font=FONT_NUMBER)
+    bbox = _text_bbox(number, FONT_NUMBER)
     draw.text((px - (bbox[2] - bbox[0]) / 2, py - (bbox[3] - bbox[1]) / 2 - bbox[1]), number, font=FONT_NUMBER, fill=number_color)
 
     if player.get("is_captain"):
         badge_x, badge_y = px + r - 8, py - r + 8
         draw.ellipse([badge_x - 12, badge_y - 12, badge_x + 12, badge_y + 12], fill=(255, 205, 0), outline=(0, 0, 0), width=1)
-        cbbox = draw.textbbox((0, 0), "C", font=FONT_FORMATION)
+        cbbox = _text_bbox("C", FONT_FORMATION)
         draw.text((badge_x - (cbbox[2] - cbbox[0]) / 2, badge_y - (cbbox[3] - cbbox[1]) / 2 - cbbox[1] - 2), "C", font=FONT_FORMATION, fill=(0, 0, 0))
 
     name = player.get("player_short_name") or player.get("name") or "?"
-    nbbox = draw.textbbox((0, 0), name, font=FONT_NAME)
+    nbbox = _text_bbox(name, FONT_NAME)
     name_w = nbbox[2] - nbbox[0]
     label_y = py + r + 6
     draw.rectangle([px - name_w / 2 - 8, label_y, px + name_w / 2 + 8, label_y + 26], fill=(0, 0, 0, 160))
     draw.text((px - name_w / 2, label_y + 2), name, font=FONT_NAME, fill=(255, 255, 255))
 
 
-def render_lineups(game: dict) -> io.BytesIO | None:
+def lineup_fingerprint(game: dict) -> str | None:
+    """Hash de solo lo que se ve en la imagen de formaciones: jugadores, posiciones,
+    colores, esquema y si está confirmada. Dos payloads con el mismo hash dan la misma imagen."""
+    lineups = game.get("players", {}).get("lineups", {}).get("teams", [])
+    if len(lineups) < 2:
+        return None
+    teams = game.get("teams", [{}, {}])
+    relevant = {
+        "teams": [
+            {"short_name": team.get("short_name"), "color": team.get("colors", {}).get("color")}
+            for team in teams
+        ],
+        "lineups": [
+            {
+                "team_num": lineup.get("team_num", 1),
+                "formation": lineup.get("formation"),
+                "confirmed": lineup_confirmed(lineup),
+                "starting": [
+                    [p.get("jersey_num"), p.get("is_captain"), p.get("player_short_name") or p.get("name"), p.get("pitch_location")]
+                    for p in lineup.get("starting", [])
+                ],
+            }
+            for lineup in lineups
+        ],
+    }
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+def render_lineups(game: dict, image_format: str = "png") -> io.BytesIO | None:
     """Genera un maquetado visual de la cancha con las formaciones titulares,
     estilo Promiedos: el equipo local abajo atacando hacia arriba, el visitante
     arriba atacando hacia abajo, encontrándose en la línea de mitad de cancha."""
@@ -148,9 +205,8 @@ def render_lineups(game: dict) -> io.BytesIO | None:
         return None
 
     teams = game.get("teams", [{}, {}])
-    image = Image.new("RGB", (CANVAS_W, CANVAS_H), (30, 30, 30))
+    image = _pitch_template().copy()
     draw = ImageDraw.Draw(image, "RGBA")
-    _draw_pitch(draw)
 
     for lineup in lineups:
         team_idx = lineup.get("team_num", 1) - 1
@@ -170,7 +226,7 @@ def render_lineups(game: dict) -> io.BytesIO | None:
             _draw_player(draw, player, pos, fill_color, number_color)
 
         header = f"{team_data.get('short_name', 'Equipo')} ({lineup.get('formation', '?')})"
-        hbbox = draw.textbbox((0, 0), header, font=FONT_TITLE)
+        hbbox = _text_bbox(header, FONT_TITLE)
         header_w = hbbox[2] - hbbox[0]
         header_x = (CANVAS_W - header_w) / 2
         header_y = 10 if team_idx == 1 else CANVAS_H - HEADER_H + 10
@@ -178,13 +234,13 @@ def render_lineups(game: dict) -> io.BytesIO | None:
 
         if not lineup_confirmed(lineup):
             subtitle = "[Formación sin confirmar]"
-            sbbox = draw.textbbox((0, 0), subtitle, font=FONT_SUBTITLE)
+            sbbox = _text_bbox(subtitle, FONT_SUBTITLE)
             subtitle_w = sbbox[2] - sbbox[0]
             subtitle_x = (CANVAS_W - subtitle_w) / 2
             subtitle_y = header_y + 42
             draw.text((subtitle_x, subtitle_y), subtitle, font=FONT_SUBTITLE, fill=UNCONFIRMED_COLOR)
 
     buffer = io.BytesIO()
-    image.save(buffer, format="PNG")
+    IMAGE_FORMATS[image_format][1](image, buffer)
     buffer.seek(0)
     return buffer
@@ -0,0 +1,139 @@
+import io
+import math
+import os
+from datetime import datetime
+
+from PIL import Image, ImageDraw, ImageFont
+
+from config.settings import settings
+from models.hardware_history import HardwarePoint
+
+CANVAS_W = 1200
+CANVAS_H = 760
+LEFT = 80
+RIGHT = CANVAS_W - 30
+TITLE_H = 70
+USAGE_TOP, USAGE_BOTTOM = TITLE_H, 430
+TEMP_TOP, TEMP_BOTTOM = 480, CANVAS_H - 60
+X_TICKS = 6
+
+BACKGROUND = (43, 45, 49)
+GRID_COLOR = (70, 72, 78)
+TEXT_COLOR = (220, 221, 222)
+
+# Métrica -> (etiqueta, color). Las de uso van en el panel de porcentaje y las temperaturas abajo.
+USAGE_SERIES = {
+    "cpu_percent": ("CPU", (237, 66, 69)),
+    "ram_percent": ("RAM", (88, 101, 242)),
+    "disk_percent": ("Disco", (254, 231, 92)),
+}
+TEMP_SERIES = {
+    "cpu_temp_c": ("CPU", (255, 140, 0)),
+    "gpu_temp_c": ("GPU", (87, 242, 135)),
+}
+
+_FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "assets", "fonts")
+FONT_TITLE = ImageFont.truetype(os.path.join(_FONTS_DIR, "DejaVuSans-Bold.ttf"), 26)
+FONT_LABEL = ImageFont.truetype(os.path.join(_FONTS_DIR, "DejaVuSans.ttf"), 16)
+FONT_LEGEND = ImageFont.truetype(os.path.join(_FONTS_DIR, "DejaVuSans-Bold.ttf"), 16)
+
+
+def _resolution_label(resolution_minutes: int) -> str:
+    if resolution_minutes == 1:
+        return "muestras por minuto"
+    if resolution_minutes < 60:
+        return f"mín/prom/máx cada {resolution_minutes} min"
+    return "mín/prom/máx por hora"
+
+
+def _segments(points: list[HardwarePoint], metric: str, max_gap: float):
+    """Parte la serie donde faltan muestras (la PC estuvo caída) para no unir los huecos."""
+    segment = []
+    previous = None
+    for point in points:
+        if metric not in point.values:
+            continue
+        if previous is not None and (point.timestamp - previous).total_seconds() > max_gap:
+            yield segment
+            segment = []
+        segment.append(point)
+        previous = point.timestamp
+    if segment:
+        yield segment
+
+
+def _draw_panel(
+    draw: ImageDraw.ImageDraw, points: list[HardwarePoint], series: dict, top: int, bottom: int,
+    low: float, high: float, unit: str, x_of, max_gap: float,
+):
+    def y_of(value: float) -> float:
+        return bottom - (value - low) / (high - low) * (bottom - top)
+
+    for i in range(5):
+        value = low + (high - low) * i / 4
+        y = y_of(value)
+        draw.line([(LEFT, y), (RIGHT, y)], fill=GRID_COLOR, width=1)
+        draw.text((LEFT - 10, y), f"{value:.0f}{unit}", font=FONT_LABEL, fill=TEXT_COLOR, anchor="rm")
+
+    legend_x = LEFT
+    for metric, (label, color) in series.items():
+        if not any(metric in point.values for point in points):
+            continue
+        for segment in _segments(points, metric, max_gap):
+            xs = [x_of(point.timestamp) for point in segment]
+            if any(point.values[metric][0] != point.values[metric][2] for point in segment):
+                band = [(x, y_of(p.values[metric][2])) for x, p in zip(xs, segment)]
+                band += [(x, y_of(p.values[metric][0])) for x, p in reversed(list(zip(xs, segment)))]
+                draw.polygon(band, fill=(*color, 60))
+            line = [(x, y_of(p.values[metric][1])) for x, p in zip(xs, segment)]
+            if len(line) == 1:
+                x, y = line[0]
+                draw.ellipse([x - 2, y - 2, x + 2, y + 2], fill=color)
+            else:
+                draw.line(line, fill=color, width=2, joint="curve")
+
+        draw.rectangle([legend_x, top - 24, legend_x + 14, top - 10], fill=color)
+        draw.text((legend_x + 20, top - 17), label, font=FONT_LEGEND, fill=TEXT_COLOR, anchor="lm")
+        legend_x += 40 + int(draw.textlength(label, font=FONT_LEGEND))
+
+
+def render_hardware_chart(points: list[HardwarePoint], since: datetime, until: datetime, resolution_minutes: int) -> bytes:
+    """Grafica uso (CPU, RAM, disco) y temperaturas de [since, until). Devuelve el PNG."""
+    image = Image.new("RGB", (CANVAS_W, CANVAS_H), BACKGROUND)
+    draw = ImageDraw.Draw(image, "RGBA")
+
+    hours = (until - since).total_seconds() / 3600
+    draw.text((LEFT, 20), f"PC de Minecraft · últimas {hours:g} horas", font=FONT_TITLE, fill=TEXT_COLOR)
+    draw.text((RIGHT, 32), _resolution_label(resolution_minutes), font=FONT_LABEL, fill=TEXT_COLOR, anchor="rm")
+
+    span = (until - since).total_seconds()
+
+    def x_of(timestamp: datetime) -> float:
+        return LEFT + (timestamp - since).total_seconds() / span * (RIGHT - LEFT)
+
+    time_format = "%H:%M" if hours <= 24 else "%d/%m %H:%M"
+    for i in range(X_TICKS + 1):
+        timestamp = since + (until - since) * i / X_TICKS
+        x = x_of(timestamp)
+        draw.line([(x, USAGE_TOP + 30), (x, USAGE_BOTTOM)], fill=GRID_COLOR, width=1)
+        draw.line([(x, TEMP_TOP + 30), (x, TEMP_BOTTOM)], fill=GRID_COLOR, width=1)
+        draw.text((x, TEMP_BOTTOM + 20), timestamp.astimezone(settings.TIMEZONE).strftime(time_format),
+                  font=FONT_LABEL, fill=TEXT_COLOR, anchor="rm" if i == X_TICKS else "mm")
+
+    max_gap = resolution_minutes * 60 * 2.5
+    _draw_panel(draw, points, USAGE_SERIES, USAGE_TOP + 30, USAGE_BOTTOM, 0, 100, "%", x_of, max_gap)
+
+    temps = [v for p in points for metric, values in p.values.items() if metric in TEMP_SERIES for v in (values[0], values[2])]
+    if temps:
+        # Rango con margen y marcas en múltiplos de 5 grados.
+        low = max(0, (min(temps) // 5) * 5 - 5)
+        step = max(5, math.ceil((max(temps) + 5 - low) / 4 / 5) * 5)
+        high = low + 4 * step
+        _draw_panel(draw, points, TEMP_SERIES, TEMP_TOP + 30, TEMP_BOTTOM, low, high, "°", x_of, max_gap)
+    else:
+        draw.text(((LEFT + RIGHT) / 2, (TEMP_TOP + TEMP_BOTTOM) / 2), "Sin lecturas de temperatura",
+                  font=FONT_LABEL, fill=TEXT_COLOR, anchor="mm")
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
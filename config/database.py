@@ -1,19 +1,75 @@
-from pymongo import MongoClient
+import logging
+from collections import defaultdict
+
+from pymongo import AsyncMongoClient, monitoring
 from config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+class QueryTimer(monitoring.CommandListener):
+    """Mide cada comando que llega a Mongo: acumula cantidad y tiempo por colección y
+    comando, y avisa en el log los que superan DATABASE_SLOW_QUERY_MS."""
+
+    def __init__(self, slow_ms: float):
+        self.slow_ms = slow_ms
+        self.stats: dict[tuple[str, str], list[float]] = defaultdict(lambda: [0, 0.0, 0.0])  # cantidad, total ms, máx ms
+        self.failures = 0
+        self._targets: dict[int, str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        target = event.command.get(event.command_name)
+        self._targets[event.request_id] = target if isinstance(target, str) else ""
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._record(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._record(event, failed=True)
+
+    def _record(self, event, failed: bool):
+        collection = self._targets.pop(event.request_id, "")
+        elapsed_ms = event.duration_micros / 1000
+        entry = self.stats[(collection, event.command_name)]
+        entry[0] += 1
+        entry[1] += elapsed_ms
+        entry[2] = max(entry[2], elapsed_ms)
+        if failed:
+            self.failures += 1
+        if elapsed_ms >= self.slow_ms:
+            logger.warning(f"Mongo: {event.command_name} sobre '{collection}' tardó {elapsed_ms:.0f}ms")
+
+    def slowest(self, limit: int = 5) -> list[tuple[str, str, int, float, float]]:
+        """(colección, comando, cantidad, promedio ms, máx ms), de mayor a menor tiempo total."""
+        rows = [(c, cmd, n, total / n, peak) for (c, cmd), (n, total, peak) in self.stats.items() if n]
+        return sorted(rows, key=lambda r: r[2] * r[3], reverse=True)[:limit]
+
+
 class MongoDB:
     _client = None
+    query_timer = QueryTimer(settings.DATABASE_SLOW_QUERY_MS)
 
     @classmethod
     def get_database(cls):
         if cls._client is None:
-            cls._client = MongoClient(
+            cls._client = AsyncMongoClient(
                 settings.DATABASE_URL,
                 username=settings.DATABASE_USERNAME,
                 password=settings.DATABASE_PASSWORD,
                 authSource="admin",
                 tz_aware=True,
+                maxPoolSize=settings.DATABASE_MAX_POOL_SIZE,
+                minPoolSize=settings.DATABASE_MIN_POOL_SIZE,
+                serverSelectionTimeoutMS=settings.DATABASE_TIMEOUT_MS,
+                timeoutMS=settings.DATABASE_TIMEOUT_MS,
+                event_listeners=[cls.query_timer],
             )
         return cls._client.get_default_database(default='robot_devil')
 
-db = MongoDB.get_database()
\ No newline at end of file
+    @classmethod
+    async def close(cls):
+        if cls._client is not None:
+            await cls._client.close()
+            cls._client = None
+
+db = MongoDB.get_database()
@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     GUILD_ID: int
     IG_USERNAME: str = ""
     IG_PASSWORD: str = ""
+    INSTAGRAM_REQUESTS_PER_HOUR: int = 60
     GENERAL_VOICE_CHANNEL_ID: int
     TERMOS_VOICE_CHANNEL_ID: int
     GENERAL_TEXT_CHANNEL_ID: int
@@ -27,9 +28,35 @@ class Settings(BaseSettings):
     GAMES_CATEGORY_ID: int
     USER_AGENT: str
     TWITTER_RSS_BRIDGE_URL: str = "http://nitter.net"
+    TWITTER_RSS_BRIDGE_URLS: str = ""
+    TWITTER_BRIDGE_REQUESTS_PER_MINUTE: float = 3.0
+    NEWS_DOMAIN_CONCURRENCY: int = 2
+    NEWS_DOMAIN_DELAY_SECONDS: float = 5.0
+    NEWS_SEEN_FILTER_CAPACITY: int = 200_000
+    NEWS_SEEN_FILTER_FALSE_POSITIVE_RATE: float = 0.001
+    NEWS_SEEN_LRU_SIZE: int = 5_000
+    CACHE_DIR: str = "assets/cache"
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 8
+    HTTP_DNS_CACHE_TTL: int = 300
+    HTTP_KEEPALIVE_SECONDS: float = 30.0
+    PARSING_POOL_WORKERS: int = 2
+    PARSING_POOL_PROCESSES: bool = False
+    COMMENTATOR_RECORDINGS_DIR: str = ""
+    COMMENTATOR_REQUESTS_PER_MINUTE: int = 20
+    LINEUP_IMAGE_FORMAT: str = "png"
+    LOG_FLUSH_SECONDS: float = 5.0
+    LOG_FILE: str = "logs/diablo_robot.jsonl"
+    LOG_FILE_MAX_BYTES: int = 5_000_000
+    LOG_FILE_BACKUPS: int = 5
     DATABASE_URL: str = "mongodb://localhost:27017/diablo_robot"
     DATABASE_USERNAME: str
     DATABASE_PASSWORD: str
+    DATABASE_MAX_POOL_SIZE: int = 20
+    DATABASE_MIN_POOL_SIZE: int = 1
+    DATABASE_TIMEOUT_MS: int = 15_000
+    DATABASE_SLOW_QUERY_MS: float = 100
+    DATABASE_AUDIT_QUERIES: bool = False
     DJ_COMMAND_PREFIX: str = "m!"
     NOT_ROBOT_DEVIL_USER_TOKEN: str
     NOT_ROBOT_DEVIL_USER_ID: int
@@ -49,6 +76,9 @@ class Settings(BaseSettings):
     HARDWARE_MONITOR_PORT: int = 8788
     HARDWARE_MONITOR_TOKEN: str = ""
     HARDWARE_MONITOR_STATUS_MESSAGE_ID: int | None = None
+    HARDWARE_HISTORY_RAW_DAYS: int = 3
+    HARDWARE_HISTORY_15M_DAYS: int = 60
+    HARDWARE_HISTORY_HOURLY_DAYS: int = 730
 
     @field_validator("TIMEZONE", mode="before")
     @classmethod
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from config.database import db
+from models.tracker_state import TrackerState
+
+
+class CommentatorStateDAO:
+    """Checkpoint del estado de cada partido que sigue el relator, para retomar tras un
+    reinicio sin volver a recorrer ni reanunciar el partido."""
+
+    def __init__(self):
+        self.collection = db['commentator_state']
+
+    async def save(self, state: TrackerState):
+        """Guarda todo menos los eventos vistos, que se suman de a uno con `add_seen`."""
+        data = state.to_dict()
+        del data["seen_events"]
+        await self.collection.update_one({"match_id": state.match_id}, {"$set": data}, upsert=True)
+
+    async def add_seen(self, match_id: str, *event_keys: str):
+        if not event_keys:
+            return
+        await self.collection.update_one(
+            {"match_id": match_id},
+            {"$addToSet": {"seen_events": {"$each": list(event_keys)}}},
+            upsert=True
+        )
+
+    async def get(self, match_id: str) -> Optional[TrackerState]:
+        result = await self.collection.find_one({"match_id": match_id})
+        return TrackerState.from_dict(result) if result else None
+
+    async def delete(self, match_id: str):
+        await self.collection.delete_one({"match_id": match_id})
@@ -6,21 +6,21 @@ class GameDAO:
     def __init__(self):
         self.collection = db['games']
 
-    def create_game(self, game: GameChannel) -> bool:
-        self.collection.insert_one(game.to_dict())
+    async def create_game(self, game: GameChannel) -> bool:
+        await self.collection.insert_one(game.to_dict())
         return True
 
-    def get_game_by_name(self, game_name: str) -> GameChannel | None:
-        result = self.collection.find_one({"game_name": game_name})
+    async def get_game_by_name(self, game_name: str) -> GameChannel | None:
+        result = await self.collection.find_one({"game_name": game_name})
         return GameChannel.from_dict(result) if result else None
 
-    def get_game_by_message_id(self, message_id: int) -> GameChannel | None:
-        result = self.collection.find_one({"message_id": message_id})
+    async def get_game_by_message_id(self, message_id: int) -> GameChannel | None:
+        result = await self.collection.find_one({"message_id": message_id})
         return GameChannel.from_dict(result) if result else None
 
-    def get_all_games(self) -> List[GameChannel]:
+    async def get_all_games(self) -> List[GameChannel]:
         cursor = self.collection.find()
-        return [GameChannel.from_dict(result) for result in cursor]
+        return [GameChannel.from_dict(result) async for result in cursor]
 
-    def game_exists(self, game_name: str) -> bool:
-        return self.collection.count_documents({"game_name": game_name}, limit=1) > 0
\ No newline at end of file
+    async def game_exists(self, game_name: str) -> bool:
+        return await self.collection.count_documents({"game_name": game_name}, limit=1) > 0
\ No newline at end of file
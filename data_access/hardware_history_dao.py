@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from pymongo import UpdateOne
+
+from config.database import db
+from config.settings import settings
+from models.hardware_history import HISTORY_METRICS, HardwarePoint
+from models.hardware_snapshot import HardwareSnapshot
+
+# Resoluciones de los agregados, en minutos.
+ROLLUP_MINUTES = (15, 60)
+RAW_MAX_SPAN = timedelta(hours=12)
+FIFTEEN_MINUTES_MAX_SPAN = timedelta(days=7)
+
+
+def bucket_start(timestamp: datetime, minutes: int) -> datetime:
+    """Inicio (en UTC) del bucket de `minutes` minutos que contiene a `timestamp`."""
+    size = minutes * 60
+    return datetime.fromtimestamp(timestamp.timestamp() // size * size, timezone.utc)
+
+
+def rollup_retention(minutes: int) -> timedelta:
+    days = settings.HARDWARE_HISTORY_15M_DAYS if minutes == 15 else settings.HARDWARE_HISTORY_HOURLY_DAYS
+    return timedelta(days=days)
+
+
+class HardwareHistoryDAO:
+    """Historial de métricas de la PC de Minecraft.
+
+    Las muestras de cada minuto van a `hardware_samples`, una colección time-series de Mongo
+    que las borra sola a los HARDWARE_HISTORY_RAW_DAYS. `hardware_rollups` guarda mínimo,
+    promedio y máximo por bucket de 15 minutos y de una hora, con su propio vencimiento (TTL
+    sobre `expire_at`). Ver data_access/schema.py."""
+
+    def __init__(self):
+        self.samples = db['hardware_samples']
+        self.rollups = db['hardware_rollups']
+
+    async def record(self, snapshot: HardwareSnapshot, timestamp: datetime):
+        sample = {"timestamp": timestamp, "host": settings.HARDWARE_MONITOR_HOST}
+        sample.update({metric: getattr(snapshot, metric) for metric in HISTORY_METRICS})
+        await self.samples.insert_one(sample)
+
+    async def latest_rollup(self, minutes: int) -> datetime | None:
+        doc = await self.rollups.find_one({"resolution": minutes}, sort=[("timestamp", -1)])
+        return doc["timestamp"] if doc else None
+
+    async def rollup(self, minutes: int, start: datetime, end: datetime) -> int:
+        """Agrega las muestras crudas de [start, end) en buckets de `minutes` y los guarda
+        (pisando los que ya estuvieran). Devuelve cuántos buckets escribió."""
+        group = {
+            "_id": {"$dateTrunc": {"date": "$timestamp", "unit": "minute", "binSize": minutes}},
+            "samples": {"$sum": 1},
+        }
+        for metric in HISTORY_METRICS:
+            group[f"{metric}_min"] = {"$min": f"${metric}"}
+            group[f"{metric}_avg"] = {"$avg": f"${metric}"}
+            group[f"{metric}_max"] = {"$max": f"${metric}"}
+        cursor = await self.samples.aggregate([
+            {"$match": {"timestamp": {"$gte": start, "$lt": end}}},
+            {"$group": group},
+        ])
+
+        retention = rollup_retention(minutes)
+        operations = []
+        async for doc in cursor:
+            rollup = {"samples": doc["samples"], "expire_at": doc["_id"] + retention}
+            for metric in HISTORY_METRICS:
+                if doc[f"{metric}_avg"] is not None:
+                    rollup[metric] = {"min": doc[f"{metric}_min"], "avg": doc[f"{metric}_avg"], "max": doc[f"{metric}_max"]}
+            operations.append(UpdateOne({"resolution": minutes, "timestamp": doc["_id"]}, {"$set": rollup}, upsert=True))
+        if operations:
+            await self.rollups.bulk_write(operations, ordered=False)
+        return len(operations)
+
+    async def get_series(self, since: datetime, until: datetime) -> tuple[List[HardwarePoint], int]:
+        """Devuelve la serie de [since, until) y su resolución en minutos (1 = muestras crudas).
+        La resolución se elige por el largo del rango y lo que todavía queda guardado."""
+        now = datetime.now(timezone.utc)
+        span = until - since
+        if span <= RAW_MAX_SPAN and since >= now - timedelta(days=settings.HARDWARE_HISTORY_RAW_DAYS):
+            cursor = self.samples.find({"timestamp": {"$gte": since, "$lt": until}}).sort("timestamp", 1)
+            return [HardwarePoint.from_sample(doc) async for doc in cursor], 1
+
+        minutes = 15 if span <= FIFTEEN_MINUTES_MAX_SPAN and since >= now - rollup_retention(15) else 60
+        cursor = self.rollups.find({"resolution": minutes, "timestamp": {"$gte": since, "$lt": until}}).sort("timestamp", 1)
+        return [HardwarePoint.from_rollup(doc) async for doc in cursor], minutes
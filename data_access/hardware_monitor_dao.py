@@ -9,8 +9,8 @@ class HardwareMonitorDAO:
     def __init__(self):
         self.collection = db['hardware_monitor']
 
-    def save_latest(self, snapshot: Optional[HardwareSnapshot], is_online: bool):
-        self.collection.update_one(
+    async def save_latest(self, snapshot: Optional[HardwareSnapshot], is_online: bool):
+        await self.collection.update_one(
             {"_id": "latest"},
             {"$set": {
                 "kind": "latest",
@@ -20,17 +20,17 @@ class HardwareMonitorDAO:
             upsert=True
         )
 
-    def get_latest(self) -> Optional[dict]:
-        return self.collection.find_one({"_id": "latest"})
+    async def get_latest(self) -> Optional[dict]:
+        return await self.collection.find_one({"_id": "latest"})
 
-    def log_transition(self, is_online: bool, snapshot: Optional[HardwareSnapshot], timestamp: datetime):
-        self.collection.insert_one({
+    async def log_transition(self, is_online: bool, snapshot: Optional[HardwareSnapshot], timestamp: datetime):
+        await self.collection.insert_one({
             "kind": "event",
             "is_online": is_online,
             "snapshot": snapshot.to_dict() if snapshot else None,
             "timestamp": timestamp,
         })
 
-    def get_recent_events(self, limit: int = 20) -> List[dict]:
+    async def get_recent_events(self, limit: int = 20) -> List[dict]:
         cursor = self.collection.find({"kind": "event"}).sort("timestamp", -1).limit(limit)
-        return list(cursor)
+        return await cursor.to_list()
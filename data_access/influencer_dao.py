@@ -1,4 +1,6 @@
-from models.influencer import AttentionLevel, InfluencerModel
+from datetime import datetime
+
+from models.influencer import InfluencerModel
 from models.news_source import NewsSource
 from models.social_media import SocialMedia
 from config.database import db
@@ -7,11 +9,11 @@ class InfluencerDAO:
     def __init__(self):
         self.collection = db['influencers']
 
-    def insert(self, model: InfluencerModel) -> bool:
-        if self.exists(model.name, model.platform):
+    async def insert(self, model: InfluencerModel) -> bool:
+        if await self.exists(model.name, model.platform):
             return False
             
-        self.collection.insert_one({
+        await self.collection.insert_one({
             'account_id': model.account_id,
             'name': model.name,
             'description': model.description,
@@ -21,18 +23,22 @@ class InfluencerDAO:
         })
         return True
 
-    def exists(self, name: str, platform: SocialMedia) -> bool:
+    async def exists(self, name: str, platform: SocialMedia) -> bool:
         query = {
             "name": name,
             "platform": platform.value
         }
-        return self.collection.count_documents(query, limit=1) > 0
+        return await self.collection.count_documents(query, limit=1) > 0
 
-    def get_by_source(self, source: NewsSource) -> list:
-        return list(self.collection.find({"source": source.value}))
+    async def get_by_source(self, source: NewsSource) -> list:
+        return await self.collection.find({"source": source.value}).to_list()
 
-    def get_by_platform(self, platform: SocialMedia) -> list:
-        return list(self.collection.find({"platform": platform.value}))
+    async def get_by_platform(self, platform: SocialMedia) -> list:
+        return await self.collection.find({"platform": platform.value}).to_list()
 
-    def get_by_platform_and_attention(self, platform: SocialMedia, attention: AttentionLevel) -> list:
-        return list(self.collection.find({"platform": platform.value, "attention": attention.value}))
\ No newline at end of file
+    async def set_last_seen(self, influencer_id, entry_id: str | None, published: datetime | None, **extra):
+        """Guarda la marca de la última entrada vista del feed; el próximo poll procesa solo lo posterior."""
+        await self.collection.update_one(
+            {"_id": influencer_id},
+            {"$set": {"last_seen": {"id": entry_id, "published": published, **extra}}},
+        )
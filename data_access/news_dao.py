@@ -1,20 +1,114 @@
+import logging
+from collections import OrderedDict
+from typing import Iterable
+
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
 from config.database import db
+from config.settings import settings
+from utils.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR = 11000
+
 
 class NewsDAO:
     def __init__(self):
         self.collection = db['news']
 
-    def insert(self, url: str) -> bool:
-        self.collection.insert_one({'url': url})
+        # Caché en proceso de "¿ya publiqué esto?": el Bloom filter descarta sin ir a Mongo
+        # casi todas las URLs nuevas, y el LRU contesta las ya confirmadas más recientes.
+        # Hasta que se precalienta con warm_cache() todo se consulta en Mongo.
+        self._seen_filter = BloomFilter(settings.NEWS_SEEN_FILTER_CAPACITY, settings.NEWS_SEEN_FILTER_FALSE_POSITIVE_RATE)
+        self._seen_filter_ready = False
+        self._confirmed: OrderedDict[str, None] = OrderedDict()
+
+    async def warm_cache(self):
+        """Carga en el Bloom filter todas las URLs ya publicadas. Se llama una vez al arrancar."""
+        async for doc in self.collection.find({}, {"url": 1, "_id": 0}):
+            if doc.get("url"):
+                self._seen_filter.add(doc["url"])
+        self._seen_filter_ready = True
+
+        if self._seen_filter.count > self._seen_filter.capacity:
+            logger.warning(
+                f"news tiene {self._seen_filter.count} URLs y el Bloom filter está dimensionado para "
+                f"{self._seen_filter.capacity}: van a subir los falsos positivos. Subí NEWS_SEEN_FILTER_CAPACITY."
+            )
+        logger.info(
+            f"Caché de noticias precalentada con {self._seen_filter.count} URLs "
+            f"({self._seen_filter.memory_bytes // 1024} KiB, {self._seen_filter.hash_count} hashes)"
+        )
+
+    def _remember(self, url: str):
+        self._seen_filter.add(url)
+        self._confirm(url)
+
+    def _confirm(self, url: str):
+        self._confirmed[url] = None
+        self._confirmed.move_to_end(url)
+        if len(self._confirmed) > settings.NEWS_SEEN_LRU_SIZE:
+            self._confirmed.popitem(last=False)
+
+    async def insert(self, url: str) -> bool:
+        try:
+            await self.collection.insert_one({'url': url})
+        except DuplicateKeyError:
+            self._remember(url)
+            return False
+        self._remember(url)
         return True
 
-    def exists(self, url: str) -> bool:
-        return self.collection.count_documents({"url": url}, limit=1) > 0
-    
+    async def insert_many(self, urls: Iterable[str]) -> int:
+        """Inserta varias URLs en un solo round trip. Las que ya estaban se ignoran. Solo se
+        recuerdan en la caché las que quedaron en Mongo (insertadas o ya existentes)."""
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return 0
+        try:
+            result = await self.collection.insert_many([{'url': url} for url in unique_urls], ordered=False)
+        except BulkWriteError as e:
+            # Con ordered=False Mongo intenta todas: las que no figuran en writeErrors se insertaron.
+            failed = {
+                err.get("index") for err in e.details.get("writeErrors", []) if err.get("code") != DUPLICATE_KEY_ERROR
+            }
+            for index, url in enumerate(unique_urls):
+                if index not in failed:
+                    self._remember(url)
+            if failed:
+                raise
+            return e.details.get("nInserted", 0)
+        for url in unique_urls:
+            self._remember(url)
+        return len(result.inserted_ids)
+
+    async def exists(self, url: str) -> bool:
+        return url in await self.existing_urls([url])
+
+    async def existing_urls(self, urls: Iterable[str]) -> set[str]:
+        """Devuelve cuáles de las URLs ya fueron publicadas. Solo va a Mongo (con una sola
+        consulta `$in`) por las que el Bloom filter marca como posibles y no están en el LRU."""
+        existing = set()
+        maybe_seen = []
+        for url in dict.fromkeys(urls):
+            if url in self._confirmed:
+                self._confirmed.move_to_end(url)
+                existing.add(url)
+            elif not self._seen_filter_ready or url in self._seen_filter:
+                maybe_seen.append(url)
+
+        if maybe_seen:
+            cursor = self.collection.find({"url": {"$in": maybe_seen}}, {"url": 1, "_id": 0})
+            async for doc in cursor:
+                self._confirm(doc["url"])
+                existing.add(doc["url"])
+        return existing
+
     @staticmethod
     def normalize_url(domain, url):
         url = url.strip()
-            
+
         if not url.startswith('http'):
             if url.startswith('//'):
                 url = 'https:' + url
@@ -22,4 +116,4 @@ class NewsDAO:
                 url = f"{domain}{url}"
             else:
                 url = f"{domain}/{url}"
-        return url
\ No newline at end of file
+        return url
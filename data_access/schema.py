@@ -0,0 +1,148 @@
+"""Colecciones time-series, índices que necesita cada colección y auditoría de los planes de las consultas de los DAOs.
+
+    python -m data_access.schema            crea las colecciones e índices que falten
+    python -m data_access.schema --explain  además corre explain() sobre cada consulta y marca los COLLSCAN
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import CollectionInvalid, OperationFailure
+
+from config.database import db
+from config.settings import settings
+from models.fixture_status import FixtureStatus
+from models.news_source import NewsSource
+from models.social_media import SocialMedia
+
+logger = logging.getLogger(__name__)
+
+INDEXES: dict[str, list[IndexModel]] = {
+    "news": [IndexModel("url", unique=True)],
+    "fixtures": [
+        IndexModel("match_id"),
+        IndexModel([("status", ASCENDING), ("match_date", ASCENDING)]),
+        IndexModel([("competition", ASCENDING), ("match_date", ASCENDING)]),
+    ],
+    "games": [IndexModel("message_id"), IndexModel("game_name")],
+    "influencers": [
+        IndexModel([("platform", ASCENDING), ("attention", ASCENDING)]),
+        IndexModel("source"),
+    ],
+    "self_destruct_messages": [IndexModel("delete_at"), IndexModel("message_id")],
+    "hardware_monitor": [IndexModel([("kind", ASCENDING), ("timestamp", DESCENDING)])],
+    "commentator_state": [IndexModel("match_id", unique=True)],
+    "hardware_rollups": [
+        IndexModel([("resolution", ASCENDING), ("timestamp", ASCENDING)], unique=True),
+        IndexModel("expire_at", expireAfterSeconds=0),
+    ],
+}
+
+
+def _timeseries_collections() -> dict[str, dict]:
+    return {
+        "hardware_samples": {
+            "timeseries": {"timeField": "timestamp", "metaField": "host", "granularity": "minutes"},
+            "expireAfterSeconds": settings.HARDWARE_HISTORY_RAW_DAYS * 86400,
+        },
+    }
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """Una consulta de un DAO con valores de ejemplo, para pedirle el plan a Mongo."""
+    dao: str
+    collection: str
+    filter: dict
+    sort: list[tuple[str, int]] | None = None
+
+
+def _query_shapes() -> list[QueryShape]:
+    now = datetime.now(settings.TIMEZONE)
+    return [
+        QueryShape("NewsDAO.existing_urls", "news", {"url": {"$in": ["https://example.com/a", "https://example.com/b"]}}),
+        QueryShape("FixtureDAO.get_trackable_matches", "fixtures", {"$or": [
+            {"status": FixtureStatus.LIVE},
+            {"status": FixtureStatus.SCHEDULED, "match_date": {"$gt": now, "$lte": now}},
+        ]}, [("match_date", ASCENDING)]),
+        QueryShape("FixtureDAO.get_by_match_id", "fixtures", {"match_id": "x"}),
+        QueryShape("FixtureDAO.get_fixtures_by_competition", "fixtures", {"competition": "x"}, [("match_date", ASCENDING)]),
+        QueryShape("GameDAO.get_game_by_name", "games", {"game_name": "x"}),
+        QueryShape("GameDAO.get_game_by_message_id", "games", {"message_id": 0}),
+        QueryShape("InfluencerDAO.exists", "influencers", {"name": "x", "platform": SocialMedia.TWITTER.value}),
+        QueryShape("InfluencerDAO.get_by_source", "influencers", {"source": NewsSource.PRESS.value}),
+        QueryShape("InfluencerDAO.get_by_platform", "influencers", {"platform": SocialMedia.INSTAGRAM.value}),
+        QueryShape("SelfDestructMessageDAO.get_due", "self_destruct_messages", {"delete_at": {"$lte": now}}),
+        QueryShape("SelfDestructMessageDAO.delete_by_message_id", "self_destruct_messages", {"message_id": 0}),
+        QueryShape("HardwareMonitorDAO.get_recent_events", "hardware_monitor", {"kind": "event"}, [("timestamp", DESCENDING)]),
+        QueryShape("CommentatorStateDAO.get", "commentator_state", {"match_id": "x"}),
+        QueryShape("HardwareHistoryDAO.get_series", "hardware_rollups", {"resolution": 15, "timestamp": {"$gte": now}}, [("timestamp", ASCENDING)]),
+    ]
+
+
+async def ensure_collections(database=db):
+    """Crea las colecciones time-series que falten y les actualiza el vencimiento si cambió."""
+    for name, options in _timeseries_collections().items():
+        try:
+            await database.create_collection(name, **options)
+            logger.info(f"Creé la colección time-series {name}")
+        except CollectionInvalid:
+            await database.command("collMod", name, expireAfterSeconds=options["expireAfterSeconds"])
+
+
+async def ensure_indexes(database=db):
+    """Crea los índices que falten. Es idempotente: los que ya existen no se tocan."""
+    for collection, models in INDEXES.items():
+        try:
+            names = await database[collection].create_indexes(models)
+            logger.info(f"Índices de {collection}: {', '.join(names)}")
+        except OperationFailure as e:
+            logger.warning(f"No pude crear los índices de {collection} (¿hay duplicados?): {e}")
+
+
+def _stages(plan: dict):
+    yield plan.get("stage")
+    # Con el motor SBE (Mongo 7+) el árbol viene anidado en "queryPlan".
+    for key in ("queryPlan", "inputStage", "outerStage", "innerStage"):
+        if key in plan:
+            yield from _stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from _stages(child)
+
+
+async def audit_query_plans(database=db) -> list[str]:
+    """Corre explain() sobre cada consulta de los DAOs y devuelve las que terminan en COLLSCAN."""
+    problems = []
+    for shape in _query_shapes():
+        cursor = database[shape.collection].find(shape.filter)
+        if shape.sort:
+            cursor = cursor.sort(shape.sort)
+        plan = (await cursor.explain()).get("queryPlanner", {}).get("winningPlan", {})
+        stages = [stage for stage in _stages(plan) if stage]
+        if "COLLSCAN" in stages:
+            problems.append(f"{shape.dao} recorre toda la colección {shape.collection} ({' <- '.join(stages)})")
+        else:
+            logger.info(f"{shape.dao}: {' <- '.join(stages)}")
+    for problem in problems:
+        logger.warning(f"Plan de consulta: {problem}")
+    return problems
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Crea los índices de Mongo y audita los planes de las consultas.")
+    parser.add_argument("--explain", action="store_true", help="corre explain() sobre cada consulta de los DAOs")
+    args = parser.parse_args()
+    await ensure_collections()
+    await ensure_indexes()
+    if args.explain and await audit_query_plans():
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+    sys.exit(asyncio.run(main()))
@@ -4,14 +4,19 @@ Agente HTTP mínimo para exponer métricas de hardware de una PC Windows
 Diablo Robot lo consulte por la VPN de WireGuard.
 
 Config vía variables de entorno:
-  HWMON_PORT  - puerto donde escuchar (default 8788)
-  HWMON_TOKEN - si se define, se exige el header 'X-Auth-Token' con este valor
+  HWMON_PORT              - puerto donde escuchar (default 8788)
+  HWMON_TOKEN             - si se define, se exige el header 'X-Auth-Token' con este valor
+  HWMON_SAMPLE_SECONDS    - cada cuánto se refrescan CPU, RAM, disco y temperaturas (default 5)
+  HWMON_EVENTLOG_SECONDS  - cada cuánto se leen los eventos nuevos del Event Log (default 60)
+  HWMON_BOOKMARK_FILE     - dónde se guarda hasta qué evento se leyó (default eventlog_bookmark.json al lado del agente)
 
 Ver README.md para instrucciones de instalación y de cómo dejarlo corriendo
 como Tarea Programada de Windows.
 """
 import json
 import os
+import threading
+import time
 import urllib.request
 from datetime import datetime, timedelta
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
@@ -21,9 +26,17 @@ import win32evtlog
 
 PORT = int(os.environ.get("HWMON_PORT", "8788"))
 TOKEN = os.environ.get("HWMON_TOKEN", "")
+SAMPLE_SECONDS = float(os.environ.get("HWMON_SAMPLE_SECONDS", "5"))
+EVENTLOG_SECONDS = float(os.environ.get("HWMON_EVENTLOG_SECONDS", "60"))
+BOOKMARK_FILE = os.environ.get(
+    "HWMON_BOOKMARK_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "eventlog_bookmark.json")
+)
 LIBRE_HARDWARE_MONITOR_URL = "http://localhost:8085/data.json"
 KERNEL_POWER_EVENT_ID = 41
 KERNEL_POWER_SOURCE = "Microsoft-Windows-Kernel-Power"
+UNCLEAN_SHUTDOWN_WINDOW = timedelta(days=30)
+# Muestras perdidas seguidas a partir de las cuales `/metrics` deja de servir la última.
+STALE_AFTER_SAMPLES = 3
 
 
 def _find_lhm_sensor(node: dict, name_fragment: str) -> float | None:
@@ -55,37 +68,115 @@ def get_temperatures() -> tuple[float | None, float | None]:
     return cpu_temp, gpu_temp
 
 
-def get_last_unclean_shutdown() -> datetime | None:
-    """Busca el Kernel-Power Event ID 41 más reciente (apagado no controlado) en el Event Log de Windows."""
-    handle = win32evtlog.OpenEventLog(None, "System")
-    try:
-        flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
-        cutoff = datetime.now() - timedelta(days=30)
-        checked = 0
-        while checked < 5000:
-            events = win32evtlog.ReadEventLog(handle, flags, 0)
+def _is_unclean_shutdown(event) -> bool:
+    return (event.EventID & 0xFFFF) == KERNEL_POWER_EVENT_ID and event.SourceName == KERNEL_POWER_SOURCE
+
+
+def _scan_backwards(handle) -> datetime | None:
+    """Busca el Kernel-Power Event ID 41 más reciente (apagado no controlado) leyendo hacia atrás,
+    hasta 5000 eventos o 30 días. Solo se usa para arrancar sin bookmark o si se vació el log."""
+    flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
+    cutoff = datetime.now() - UNCLEAN_SHUTDOWN_WINDOW
+    checked = 0
+    while checked < 5000:
+        events = win32evtlog.ReadEventLog(handle, flags, 0)
+        if not events:
+            break
+        for event in events:
+            checked += 1
+            if event.TimeGenerated.replace(tzinfo=None) < cutoff:
+                return None
+            if _is_unclean_shutdown(event):
+                return event.TimeGenerated.replace(tzinfo=None)
+    return None
+
+
+class UncleanShutdownTracker:
+    """Sigue el log System de forma incremental: recuerda el último RecordNumber leído y el
+    último apagado no controlado encontrado, y en cada `refresh` lee solo los eventos nuevos.
+    El bookmark se guarda en disco, así un reinicio del agente tampoco vuelve a escanear.
+
+    Si el log se vació (el bookmark queda más adelante que el evento más nuevo) o rotó más
+    allá del bookmark (se perdieron eventos sin leer), se vuelve a escanear hacia atrás."""
+
+    def __init__(self, bookmark_path: str):
+        self.bookmark_path = bookmark_path
+        self.last_record: int | None = None
+        self.last_unclean_shutdown: datetime | None = None
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.bookmark_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.last_record = data.get("last_record")
+        shutdown = data.get("last_unclean_shutdown")
+        self.last_unclean_shutdown = datetime.fromisoformat(shutdown) if shutdown else None
+
+    def _save(self):
+        data = {
+            "last_record": self.last_record,
+            "last_unclean_shutdown": self.last_unclean_shutdown.isoformat() if self.last_unclean_shutdown else None,
+        }
+        tmp_path = f"{self.bookmark_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.bookmark_path)
+
+    def refresh(self) -> datetime | None:
+        """Lee los eventos nuevos y devuelve el último apagado no controlado de los últimos 30 días."""
+        handle = win32evtlog.OpenEventLog(None, "System")
+        try:
+            count = win32evtlog.GetNumberOfEventLogRecords(handle)
+            oldest = win32evtlog.GetOldestEventLogRecord(handle)
+            newest = oldest + count - 1 if count else None
+            previous = (self.last_record, self.last_unclean_shutdown)
+
+            if newest is None:
+                self.last_record = None
+            elif self.last_record is None or self.last_record > newest or self.last_record < oldest - 1:
+                found = _scan_backwards(handle)
+                if found and (self.last_unclean_shutdown is None or found > self.last_unclean_shutdown):
+                    self.last_unclean_shutdown = found
+                self.last_record = newest
+            elif self.last_record < newest:
+                self._read_forward(handle, self.last_record + 1)
+
+            if (self.last_record, self.last_unclean_shutdown) != previous:
+                self._save()
+        finally:
+            win32evtlog.CloseEventLog(handle)
+
+        if self.last_unclean_shutdown and self.last_unclean_shutdown >= datetime.now() - UNCLEAN_SHUTDOWN_WINDOW:
+            return self.last_unclean_shutdown
+        return None
+
+    def _read_forward(self, handle, start_record: int):
+        flags = win32evtlog.EVENTLOG_SEEK_READ | win32evtlog.EVENTLOG_FORWARDS_READ
+        offset = start_record
+        while True:
+            events = win32evtlog.ReadEventLog(handle, flags, offset)
             if not events:
                 break
             for event in events:
-                checked += 1
-                if event.TimeGenerated.replace(tzinfo=None) < cutoff:
-                    return None
-                event_id = event.EventID & 0xFFFF
-                if event_id == KERNEL_POWER_EVENT_ID and event.SourceName == KERNEL_POWER_SOURCE:
-                    return event.TimeGenerated.replace(tzinfo=None)
-    finally:
-        win32evtlog.CloseEventLog(handle)
-    return None
+                if _is_unclean_shutdown(event):
+                    self.last_unclean_shutdown = event.TimeGenerated.replace(tzinfo=None)
+                self.last_record = event.RecordNumber
+            # Después del primer bloque se sigue en orden, sin volver a posicionar.
+            flags = win32evtlog.EVENTLOG_SEQUENTIAL_READ | win32evtlog.EVENTLOG_FORWARDS_READ
+            offset = 0
 
 
-def build_metrics() -> dict:
-    cpu_percent = psutil.cpu_percent(interval=0.5)
+def build_metrics(last_unclean_shutdown: datetime | None) -> dict:
+    # Sin intervalo psutil mide desde la llamada anterior, que es la muestra previa del sampler.
+    cpu_percent = psutil.cpu_percent(interval=None)
     memory = psutil.virtual_memory()
     disk = psutil.disk_usage("C:\\")
     boot_time = datetime.fromtimestamp(psutil.boot_time())
     uptime_seconds = (datetime.now() - boot_time).total_seconds()
     cpu_temp, gpu_temp = get_temperatures()
-    last_unclean_shutdown = get_last_unclean_shutdown()
 
     return {
         "cpu_percent": cpu_percent,
@@ -98,9 +189,63 @@ def build_metrics() -> dict:
         "cpu_temp_c": cpu_temp,
         "gpu_temp_c": gpu_temp,
         "last_unclean_shutdown": last_unclean_shutdown.isoformat() if last_unclean_shutdown else None,
+        "sampled_at": datetime.now().isoformat(),
     }
 
 
+class Sampler(threading.Thread):
+    """Refresca las métricas en segundo plano y deja el JSON ya serializado, así `/metrics`
+    solo devuelve bytes. El Event Log, que es lo más caro, se revisa con otro intervalo."""
+
+    def __init__(self, sample_seconds: float, eventlog_seconds: float, bookmark_path: str):
+        super().__init__(name="sampler", daemon=True)
+        self.sample_seconds = sample_seconds
+        self.eventlog_seconds = eventlog_seconds
+        self.body: bytes | None = None
+        self.sampled_at = float("-inf")
+        self.last_error: str | None = None
+        self._shutdowns = UncleanShutdownTracker(bookmark_path)
+        self._last_unclean_shutdown: datetime | None = None
+        self._eventlog_checked_at = float("-inf")
+
+    def run(self):
+        psutil.cpu_percent(interval=None)  # la primera llamada solo fija el punto de partida
+        while True:
+            started = time.monotonic()
+            self.sample_once()
+            time.sleep(max(0.0, self.sample_seconds - (time.monotonic() - started)))
+
+    def sample_once(self):
+        if time.monotonic() - self._eventlog_checked_at >= self.eventlog_seconds:
+            self.refresh_eventlog()
+        try:
+            # Se reemplaza la referencia entera: los threads del server nunca ven un JSON a medias.
+            self.body = json.dumps(build_metrics(self._last_unclean_shutdown)).encode("utf-8")
+            self.sampled_at = time.monotonic()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"hwmonitor_agent: no pude tomar la muestra: {e}")
+
+    def refresh_eventlog(self):
+        """Si falla se sigue con el último apagado conocido y se reintenta en el próximo
+        intervalo del Event Log, no en cada muestra."""
+        try:
+            self._last_unclean_shutdown = self._shutdowns.refresh()
+        except Exception as e:
+            print(f"hwmonitor_agent: no pude leer el Event Log: {e}")
+        finally:
+            self._eventlog_checked_at = time.monotonic()
+
+    def stale_for(self) -> float | None:
+        """Segundos desde la última muestra si ya es vieja (se perdieron varias seguidas), si no None."""
+        age = time.monotonic() - self.sampled_at
+        return age if age > STALE_AFTER_SAMPLES * self.sample_seconds else None
+
+
+sampler = Sampler(SAMPLE_SECONDS, EVENTLOG_SECONDS, BOOKMARK_FILE)
+
+
 class MetricsHandler(BaseHTTPRequestHandler):
     def do_GET(self):
         if self.path != "/metrics":
@@ -113,12 +258,20 @@ class MetricsHandler(BaseHTTPRequestHandler):
             self.end_headers()
             return
 
-        try:
-            body = json.dumps(build_metrics()).encode("utf-8")
-        except Exception as e:
-            self.send_response(500)
+        body = sampler.body
+        if body is None:
+            self.send_response(503)
+            self.end_headers()
+            self.wfile.write((sampler.last_error or "todavía no hay una muestra").encode("utf-8"))
+            return
+
+        stale_for = sampler.stale_for()
+        if stale_for is not None:
+            self.send_response(503)
             self.end_headers()
-            self.wfile.write(str(e).encode("utf-8"))
+            self.wfile.write(
+                f"la última muestra tiene {stale_for:.0f}s: {sampler.last_error or 'el sampler no responde'}".encode("utf-8")
+            )
             return
 
         self.send_response(200)
@@ -132,6 +285,7 @@ class MetricsHandler(BaseHTTPRequestHandler):
 
 
 if __name__ == "__main__":
+    sampler.start()
     server = ThreadingHTTPServer(("0.0.0.0", PORT), MetricsHandler)
     print(f"hwmonitor_agent escuchando en 0.0.0.0:{PORT} (token {'activado' if TOKEN else 'DESACTIVADO'})")
     server.serve_forever()
@@ -2,93 +2,106 @@ import asyncio
 import aiohttp
 from bs4 import BeautifulSoup
 
+from config.settings import settings
+from data_access.news_dao import NewsDAO
+from integrations.utils.domain_throttle import DomainThrottle
 from models.news_source import NewsSource
 from utils.date_format import parse_date_ddmmyyyy, is_recent
 
+DOMAIN = "https://www.dobleamarilla.com.ar"
+
+
+def parse_section(html: str) -> list[dict]:
+    """Extrae las notas del listado de una sección. Corre en el ParsingPool."""
+    soup = BeautifulSoup(html, "lxml")
+    items = []
+
+    for a in soup.find_all("a", href=True):
+        article = a.find("article", class_="item")
+        if not article:
+            continue
+
+        title_tag = article.find("h2", class_="title")
+        deck_tag = article.find("h3", class_="deck")
+        date_tag = article.find("div", class_="date")
+        if not title_tag:
+            continue
+
+        date_text = date_tag.find("span").get_text(strip=True) if date_tag else None
+        items.append({
+            "url": NewsDAO.normalize_url(DOMAIN, a["href"]),
+            "title": title_tag.get_text(strip=True),
+            "description": deck_tag.get_text(strip=True) if deck_tag else "",
+            "image_url": _extract_image(article),
+            "date": parse_date_ddmmyyyy(date_text) if date_text else None,
+        })
+
+    return items
+
+
+def _extract_image(article):
+    picture = article.find("picture")
+    if not picture:
+        return None
+
+    for mime in ("image/webp", "image/jpeg"):
+        source = picture.find("source", type=mime)
+        if source and source.get("srcset"):
+            last_entry = source["srcset"].rsplit(",", 1)[-1].strip()
+            return last_entry.split()[0]
+
+    return None
+
 
 class DobleAmarillaScraper:
     def __init__(self, bot):
         self.bot = bot
-        self.domain = "https://www.dobleamarilla.com.ar"
+        self.domain = DOMAIN
         self.urls = {
             #"liga-_c58daeec046fa270dcb9eb65a": "Liga",
             "rosca_c5990f5953107d82c75d563f0": "Rosca",
             "search?text=independiente": "Independiente",
         }
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
+        self.throttle = DomainThrottle(settings.NEWS_DOMAIN_CONCURRENCY, settings.NEWS_DOMAIN_DELAY_SECONDS)
 
     async def scrape_news(self):
-        async with aiohttp.ClientSession() as session:
-            for url, label in self.urls.items():
-                try:
-                    await asyncio.sleep(15)
-                    async with session.get(
-                        f"{self.domain}/{url}",
-                        headers=self.headers,
-                        timeout=aiohttp.ClientTimeout(total=10),
-                    ) as response:
-                        response.raise_for_status()
-                        html = await response.text()
-
-                    soup = BeautifulSoup(html, "lxml")
-
-                    for item in self._extract_news(soup):
-                        if item["date"] is None or not is_recent(item["date"]):
-                            continue
-                        news_url = self.bot.news_dao.normalize_url(self.domain, item["url"])
-                        if not news_url or self.bot.news_dao.exists(news_url):
-                            continue
-
-                        await self.bot.messager.news(
-                            type=NewsSource.PRESS,
-                            title=item["title"],
-                            description=item["description"],
-                            url=news_url,
-                            image_url=item["image_url"],
-                            publisher=f"Doble Amarilla • {label}",
-                            color="#F68A3F",
-                        )
-                        self.bot.news_dao.insert(news_url)
-
-                except Exception as e:
-                    await self.bot.messager.log(f"No pude scrapear Doble Amarilla ({label}): {e}", level="ERROR", exc=e)
-
-    def _extract_news(self, soup):
-        items = []
-
-        for a in soup.find_all("a", href=True):
-            article = a.find("article", class_="item")
-            if not article:
-                continue
-
-            title_tag = article.find("h2", class_="title")
-            deck_tag = article.find("h3", class_="deck")
-            date_tag = article.find("div", class_="date")
-            if not title_tag:
-                continue
-
-            date_text = date_tag.find("span").get_text(strip=True) if date_tag else None
-            items.append({
-                "url": a["href"],
-                "title": title_tag.get_text(strip=True),
-                "description": deck_tag.get_text(strip=True) if deck_tag else "",
-                "image_url": self._extract_image(article),
-                "date": parse_date_ddmmyyyy(date_text) if date_text else None,
-            })
-
-        return items
-
-    def _extract_image(self, article):
-        picture = article.find("picture")
-        if not picture:
-            return None
-
-        for mime in ("image/webp", "image/jpeg"):
-            source = picture.find("source", type=mime)
-            if source and source.get("srcset"):
-                last_entry = source["srcset"].rsplit(",", 1)[-1].strip()
-                return last_entry.split()[0]
-
-        return None
\ No newline at end of file
+        claimed = set()
+        session = self.bot.http_client.session("news")
+        await asyncio.gather(*(self._scrape_section(session, url, label, claimed) for url, label in self.urls.items()))
+
+    async def _scrape_section(self, session: aiohttp.ClientSession, url: str, label: str, claimed: set):
+        try:
+            async with self.throttle.slot():
+                page = await self.bot.http_cache.get(session, f"{self.domain}/{url}")
+            page.raise_for_status()
+            if not page.changed:
+                return
+
+            items = await self.bot.parsing_pool.run(parse_section, page.text)
+            news = [item for item in items if item["date"] is not None and is_recent(item["date"])]
+            already_published = await self.bot.news_dao.existing_urls(item["url"] for item in news)
+
+            published = []
+            try:
+                for item in news:
+                    news_url = item["url"]
+                    if not news_url or news_url in claimed or news_url in already_published:
+                        continue
+                    claimed.add(news_url)
+
+                    await self.bot.messager.news(
+                        type=NewsSource.PRESS,
+                        title=item["title"],
+                        description=item["description"],
+                        url=news_url,
+                        image_url=item["image_url"],
+                        publisher=f"Doble Amarilla • {label}",
+                        color="#F68A3F",
+                    )
+                    published.append(news_url)
+            finally:
+                await self.bot.news_dao.insert_many(published)
+            page.commit()
+
+        except Exception as e:
+            await self.bot.messager.log(f"No pude scrapear Doble Amarilla ({label}): {e}", level="ERROR", exc=e)
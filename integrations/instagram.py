@@ -4,51 +4,44 @@ from datetime import datetime, timedelta, timezone
 import instaloader
 
 from config.settings import settings
+from integrations.instagram_worker import InstagramWorker
+from integrations.utils.influencer_schedule import InfluencerSchedule, PollingProfile
+from models.social_media import SocialMedia
+
+# Instagram banea rápido: revisión espaciada y nada de madrugada.
+POLLING = PollingProfile(
+    high=timedelta(hours=1),
+    low=timedelta(hours=8),
+    minimum=timedelta(minutes=45),
+    maximum=timedelta(hours=24),
+    quiet_factor=None,
+)
 
 
 class Instagram:
     def __init__(self, bot):
         self.bot = bot
-        self._loader: instaloader.Instaloader | None = None
-
-    def _get_loader(self) -> instaloader.Instaloader:
-        if self._loader is not None:
-            return self._loader
-
-        loader = instaloader.Instaloader(
-            download_pictures=False,
-            download_videos=False,
-            download_video_thumbnails=False,
-            download_geotags=False,
-            download_comments=False,
-            save_metadata=False,
-            compress_json=False,
-            quiet=True,
-        )
-
-        try:
-            loader.load_session_from_file(settings.IG_USERNAME)
-        except FileNotFoundError:
-            raise RuntimeError(
-                f"No hay sesión de Instagram guardada. "
-                f"Ejecutá 'instaloader --login={settings.IG_USERNAME}' en el servidor para generarla."
-            )
+        self.worker = InstagramWorker(settings.INSTAGRAM_REQUESTS_PER_HOUR)
+        self.schedule = InfluencerSchedule(POLLING)
 
-        self._loader = loader
-        return loader
+    async def check_notifications(self):
+        now = datetime.now(timezone.utc)
+        influencers = self.schedule.due(await self.bot.influencer_dao.get_by_platform(SocialMedia.INSTAGRAM), now)
+        cutoff = now - timedelta(days=7)
 
-    async def check_notifications(self, influencers: list[dict]):
-        cutoff = datetime.now(timezone.utc) - timedelta(days=7)
-
-        for influencer in influencers:
+        for index, influencer in enumerate(influencers):
+            post_dates = None
             try:
-                await self._process_influencer(influencer, cutoff)
+                post_dates = await self._process_influencer(influencer, cutoff)
             except instaloader.exceptions.LoginRequiredException:
                 await self.bot.messager.log(
                     f"La sesión de Instagram expiró. Ejecutá 'instaloader --login={settings.IG_USERNAME}' "
                     f"en el servidor para renovarla.",
                     level="ERROR",
                 )
+                # Sin sesión no tiene sentido seguir: los que faltaban vuelven a la cola con su intervalo base.
+                for pending in influencers[index + 1:]:
+                    self.schedule.reschedule(pending, datetime.now(timezone.utc))
                 return
             except Exception as e:
                 name = influencer.get("name", "unknown")
@@ -57,61 +50,52 @@ class Instagram:
                     level="ERROR",
                     exc=e,
                 )
+            finally:
+                self.schedule.reschedule(influencer, datetime.now(timezone.utc), post_dates)
             await asyncio.sleep(3)
 
-    async def _process_influencer(self, influencer: dict, cutoff: datetime):
+    async def _process_influencer(self, influencer: dict, cutoff: datetime) -> list[datetime] | None:
+        """Publica los posts nuevos y devuelve sus fechas junto con la de la marca anterior (None si no hubo nada nuevo)."""
         username = influencer["name"]
-        loop = asyncio.get_running_loop()
-
+        last_seen = influencer.get("last_seen")
+        posts, media_count = await self.worker.fetch(username, cutoff, last_seen)
+
+        if not posts:
+            last_seen = last_seen or {}
+            if last_seen.get("media_count") != media_count:
+                # Nada nuevo pero cambió el conteo (se borró un post, o es la primera vez): se guarda para la próxima.
+                await self.bot.influencer_dao.set_last_seen(influencer["_id"], last_seen.get("id"), last_seen.get("published"), media_count=media_count)
+            return None
+
+        posts = sorted(posts, key=lambda post: post["date"])
+        for post in posts:
+            post["url"] = f"https://www.instagram.com/p/{post['shortcode']}/"
+        already_published = await self.bot.news_dao.existing_urls(post["url"] for post in posts)
+
+        published = []
         try:
-            posts = await loop.run_in_executor(
-                None, self._fetch_recent_posts, username, cutoff
-            )
-        except instaloader.exceptions.LoginRequiredException:
-            self._loader = None
-            raise
-
-        for post in reversed(posts):
-            url = f"https://www.instagram.com/p/{post['shortcode']}/"
-
-            if self.bot.news_dao.exists(url):
-                continue
-
-            await self.bot.messager.news(
-                type=influencer["source"],
-                title=f"{influencer['description']} en Instagram",
-                description=post["caption"],
-                url=url,
-                image_url=post["image_url"],
-                publisher=f"Instagram • @{username}",
-                color="#E1306C",
-            )
-            self.bot.news_dao.insert(url)
-            await asyncio.sleep(1)
-
-    def _fetch_recent_posts(self, username: str, cutoff: datetime) -> list:
-        loader = self._get_loader()
-        profile = instaloader.Profile.from_username(loader.context, username)
-
-        results = []
-        for post in profile.get_posts():
-            post_dt = post.date_utc.replace(tzinfo=timezone.utc)
-            if post_dt < cutoff:
-                break
-
-            caption = post.caption or ""
-            if len(caption) > 400:
-                caption = caption[:400] + "..."
-
-            image_url = post.url
-
-            results.append({
-                "shortcode": post.shortcode,
-                "caption": caption,
-                "image_url": image_url,
-            })
-
-            if len(results) >= 5:
-                break
-
-        return results
+            for post in posts:
+                url = post["url"]
+                if url in already_published:
+                    continue
+
+                await self.bot.messager.news(
+                    type=influencer["source"],
+                    title=f"{influencer['description']} en Instagram",
+                    description=post["caption"],
+                    url=url,
+                    image_url=post["image_url"],
+                    publisher=f"Instagram • @{username}",
+                    color="#E1306C",
+                )
+                published.append(url)
+                await asyncio.sleep(1)
+        finally:
+            await self.bot.news_dao.insert_many(published)
+
+        newest = posts[-1]
+        await self.bot.influencer_dao.set_last_seen(influencer["_id"], newest["shortcode"], newest["date"], media_count=media_count)
+        dates = [post["date"] for post in posts]
+        if last_seen and last_seen.get("published"):
+            dates.append(last_seen["published"])
+        return dates
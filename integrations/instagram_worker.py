@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import instaloader
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Instagram permite fijar hasta 3 posts arriba del perfil, aunque sean viejos.
+PINNED_SLOTS = 3
+REQUEST_TIMEOUT_SECONDS = 60.0
+
+
+class BudgetRateController(instaloader.RateController):
+    """El RateController de instaloader más un tope global de `requests_per_hour` pedidos por
+    hora, sumando todos los tipos de consulta. Cuenta cuánto se durmió y cuántos 429 hubo para
+    que el worker lo reparta por perfil."""
+
+    def __init__(self, context, requests_per_hour: int):
+        super().__init__(context)
+        self.requests_per_hour = requests_per_hour
+        self._budget: deque[float] = deque()
+        self.slept_seconds = 0.0
+        self.rate_limited = 0
+
+    def query_waittime(self, query_type: str, current_time: float, untracked_queries: bool = False) -> float:
+        waittime = super().query_waittime(query_type, current_time, untracked_queries)
+        while self._budget and self._budget[0] <= current_time - 3600:
+            self._budget.popleft()
+        if len(self._budget) >= self.requests_per_hour:
+            waittime = max(waittime, self._budget[0] + 3600 - current_time)
+        return waittime
+
+    def wait_before_query(self, query_type: str) -> None:
+        super().wait_before_query(query_type)
+        self._budget.append(time.monotonic())
+
+    def handle_429(self, query_type: str) -> None:
+        self.rate_limited += 1
+        super().handle_429(query_type)
+
+    def sleep(self, secs: float):
+        self.slept_seconds += secs
+        super().sleep(secs)
+
+
+@dataclass
+class ProfileStats:
+    fetches: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    last_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+    rate_limited: int = 0
+
+
+def fetch_recent_posts(loader: instaloader.Instaloader, username: str, cutoff: datetime, last_seen: dict | None) -> tuple[list, int]:
+    """Trae los posts posteriores a la marca `last_seen` (a lo sumo 5) y la cantidad de posts
+    del perfil. Corta en el primero ya visto, antes de pedir otra página de GraphQL."""
+    profile = instaloader.Profile.from_username(loader.context, username)
+    media_count = profile.mediacount
+
+    last_seen = last_seen or {}
+    if last_seen.get("media_count") == media_count:
+        # La cantidad de posts no cambió: no hay nada nuevo y ni se pide la primera página.
+        return [], media_count
+
+    results = []
+    for index, post in enumerate(profile.get_posts()):
+        post_dt = post.date_utc.replace(tzinfo=timezone.utc)
+        seen = post.shortcode == last_seen.get("id") or (
+            last_seen.get("published") is not None and post_dt <= last_seen["published"]
+        )
+        if seen or post_dt < cutoff:
+            # Los fijados vienen primero aunque sean viejos, así que esos no cortan la recorrida.
+            if post.is_pinned or index < PINNED_SLOTS:
+                continue
+            break
+
+        caption = post.caption or ""
+        if len(caption) > 400:
+            caption = caption[:400] + "..."
+
+        image_url = post.url
+
+        results.append({
+            "shortcode": post.shortcode,
+            "date": post_dt,
+            "caption": caption,
+            "image_url": image_url,
+        })
+
+        if len(results) >= 5:
+            break
+
+    return results, media_count
+
+
+class InstagramWorker:
+    """Thread dedicado a instaloader, para que un perfil colgado no trabe el executor por defecto
+    que usan web_search, wireguard y el resto.
+
+    Es dueño del Instaloader y su sesión, atiende los pedidos de a uno desde una cola y respeta
+    un presupuesto global de INSTAGRAM_REQUESTS_PER_HOUR (ver BudgetRateController). `fetch()`
+    encola el pedido y espera el resultado en un future del event loop. Lleva latencia, espera
+    por throttling y 429 por perfil."""
+
+    def __init__(self, requests_per_hour: int):
+        self.requests_per_hour = requests_per_hour
+        # Solo el event loop agrega perfiles (en fetch); el thread solo actualiza los contadores.
+        self.stats: dict[str, ProfileStats] = {}
+        self._jobs: queue.Queue = queue.Queue()
+        self._loader: instaloader.Instaloader | None = None
+        self._controller: BudgetRateController | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="instagram", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._jobs.put(None)
+
+    async def fetch(self, username: str, cutoff: datetime, last_seen: dict | None) -> tuple[list, int]:
+        self.start()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        stats = self.stats.setdefault(username, ProfileStats())
+        self._jobs.put((loop, future, stats, username, cutoff, last_seen))
+        return await future
+
+    def pending(self) -> int:
+        return self._jobs.qsize()
+
+    def _get_loader(self) -> instaloader.Instaloader:
+        if self._loader is not None:
+            return self._loader
+
+        def rate_controller(context):
+            self._controller = BudgetRateController(context, self.requests_per_hour)
+            return self._controller
+
+        loader = instaloader.Instaloader(
+            download_pictures=False,
+            download_videos=False,
+            download_video_thumbnails=False,
+            download_geotags=False,
+            download_comments=False,
+            save_metadata=False,
+            compress_json=False,
+            quiet=True,
+            request_timeout=REQUEST_TIMEOUT_SECONDS,
+            rate_controller=rate_controller,
+        )
+
+        try:
+            loader.load_session_from_file(settings.IG_USERNAME)
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"No hay sesión de Instagram guardada. "
+                f"Ejecutá 'instaloader --login={settings.IG_USERNAME}' en el servidor para generarla."
+            )
+
+        self._loader = loader
+        return loader
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            loop, future, stats, username, cutoff, last_seen = job
+            if future.cancelled():
+                continue
+
+            slept = self._controller.slept_seconds if self._controller else 0.0
+            rate_limited = self._controller.rate_limited if self._controller else 0
+            started = time.monotonic()
+            try:
+                result = fetch_recent_posts(self._get_loader(), username, cutoff, last_seen)
+            except Exception as e:
+                if isinstance(e, instaloader.exceptions.LoginRequiredException):
+                    self._loader = None
+                    self._controller = None
+                stats.failures += 1
+                loop.call_soon_threadsafe(_resolve, future, None, e)
+            else:
+                loop.call_soon_threadsafe(_resolve, future, result, None)
+            finally:
+                stats.fetches += 1
+                stats.last_seconds = time.monotonic() - started
+                stats.total_seconds += stats.last_seconds
+                if self._controller:
+                    stats.throttled_seconds += max(0.0, self._controller.slept_seconds - slept)
+                    stats.rate_limited += max(0, self._controller.rate_limited - rate_limited)
+
+    def summary(self) -> str:
+        lines = []
+        for username, stats in sorted(self.stats.items(), key=lambda item: -item[1].total_seconds):
+            average = stats.total_seconds / stats.fetches if stats.fetches else 0
+            lines.append(
+                f"@{username}: {stats.fetches} lecturas (prom. {average:.1f}s, última {stats.last_seconds:.1f}s), "
+                f"{stats.failures} fallidas, {stats.throttled_seconds:.0f}s esperando, {stats.rate_limited}× 429"
+            )
+        return "\n".join(lines)
+
+
+def _resolve(future: asyncio.Future, result, error: Exception | None):
+    if future.cancelled():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -1,32 +1,48 @@
+import dataclasses
 import json
 import aiohttp
 from bs4 import BeautifulSoup
 from datetime import datetime
 import re
 from config.settings import settings
+from integrations.utils.conditional_fetch import ConditionalFetcher
+from integrations.utils.parsing_pool import ParsingPool
 from models.fixture import Fixture
 from utils.date_format import to_local
 
-HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+# Último resultado parseado por URL, para poder saltear el parseo cuando la página no cambió.
+_match_urls: dict[str, tuple[str | None, str | None]] = {}
+_fixtures: dict[str, Fixture | None] = {}
 
-async def scrape_next_match(team_url: str) -> Fixture | None:
-    async with aiohttp.ClientSession(headers=HEADERS) as session:
-        async with session.get(team_url) as response:
-            response.raise_for_status()
-            team_content = await response.read()
 
-        team_soup = BeautifulSoup(team_content, 'html.parser')
+async def scrape_next_match(team_url: str, session: aiohttp.ClientSession, http_cache: ConditionalFetcher, parsing_pool: ParsingPool) -> Fixture | None:
+    team_page = await http_cache.get(session, team_url, force=team_url not in _match_urls)
+    team_page.raise_for_status()
+    if team_page.changed:
+        _match_urls[team_url] = await parsing_pool.run(parse_team_page, team_page.body)
+        team_page.commit()
 
-        match_url, match_id = _extract_match_url(team_soup)
-        if match_url is None or match_id is None:
-            return None
+    match_url, match_id = _match_urls[team_url]
+    if match_url is None or match_id is None:
+        return None
+
+    match_page = await http_cache.get(session, match_url, force=match_url not in _fixtures)
+    match_page.raise_for_status()
+
+    if match_page.changed:
+        _fixtures[match_url] = await parsing_pool.run(parse_match_page, match_page.body, match_id)
+        match_page.commit()
+
+    fixture = _fixtures[match_url]
+    return dataclasses.replace(fixture) if fixture else None
 
-        async with session.get(match_url) as response:
-            response.raise_for_status()
-            match_content = await response.read()
+def parse_team_page(body: bytes) -> tuple[str | None, str | None]:
+    """Corre en el ParsingPool."""
+    return _extract_match_url(BeautifulSoup(body, 'html.parser'))
 
-    match_soup = BeautifulSoup(match_content, 'html.parser')
-    return _parse_match(match_soup, match_id)
+def parse_match_page(body: bytes, match_id: str) -> Fixture | None:
+    """Corre en el ParsingPool."""
+    return _parse_match(BeautifulSoup(body, 'html.parser'), match_id)
 
 def _extract_match_url(team_soup: BeautifulSoup) -> tuple[str | None, str | None]:
     scripts = team_soup.find_all('script')
@@ -1,17 +1,28 @@
 import asyncio
 import re
+import time
 from datetime import datetime, timedelta
 from html.parser import HTMLParser
 from typing import List
 from urllib.parse import unquote
 
 import aiohttp
-import feedparser
 
 from config.settings import settings
+from integrations.utils.bridge_pool import BridgePool, parse_retry_after
+from integrations.utils.feed_parser import FeedEntry, parse_entries
+from integrations.utils.high_water_mark import entries_after
+from integrations.utils.influencer_schedule import InfluencerSchedule, PollingProfile
 from models.influencer import InfluencerModel
 from models.social_media import SocialMedia
 
+POLLING = PollingProfile(
+    high=timedelta(minutes=20),
+    low=timedelta(hours=1),
+    minimum=timedelta(minutes=5),
+    maximum=timedelta(hours=3),
+)
+
 
 def nitter_pic_to_twimg(url: str) -> str:
     match = re.match(r'https?://[^/]+/pic/(.+)', url)
@@ -88,23 +99,23 @@ def nitter_to_x_url(nitter_url: str) -> str | None:
     return f"https://x.com/{match.group(1)}/status/{match.group(2)}"
 
 
-def parse_entry(entry: dict, influencer: dict) -> dict | None:
-    tweet_url = entry.get("link", "")
-    normalized_url = nitter_to_x_url(tweet_url)
+def entry_url(entry: FeedEntry) -> str | None:
+    return nitter_to_x_url(entry.link)
+
+
+def entry_date(entry: FeedEntry) -> datetime:
+    return entry.published.astimezone(settings.TIMEZONE) if entry.published else datetime.now(settings.TIMEZONE)
+
+
+def parse_entry(entry: FeedEntry, influencer: dict) -> dict | None:
+    normalized_url = entry_url(entry)
     if not normalized_url:
         return None
 
-    published_parsed = entry.get("published_parsed")
-    if published_parsed:
-        published_date = datetime(*published_parsed[:6], tzinfo=settings.TIMEZONE)
-    else:
-        published_date = datetime.now(settings.TIMEZONE)
-
-    html_description = entry.get("description", "")
     parser = NitterHTMLParser()
-    parser.feed(html_description)
+    parser.feed(entry.description)
 
-    tweet_text = entry.get("title", "")
+    tweet_text = entry.title
     if len(tweet_text) > 400:
         tweet_text = tweet_text[:400] + "..."
 
@@ -115,7 +126,7 @@ def parse_entry(entry: dict, influencer: dict) -> dict | None:
 
     return {
         "url": normalized_url,
-        "published_date": published_date,
+        "published_date": entry_date(entry),
         "title": f"{influencer['description']} en Twitter",
         "description": "\n".join(description_parts),
         "image_url": parser.main_image or parser.quote_image,
@@ -124,70 +135,140 @@ def parse_entry(entry: dict, influencer: dict) -> dict | None:
     }
 
 
+def parse_tweets(entries: list[FeedEntry], influencer: dict) -> list[dict]:
+    """Interpreta el HTML de las entradas que hay que publicar. Corre en el ParsingPool."""
+    return [parsed for parsed in (parse_entry(entry, influencer) for entry in entries) if parsed]
+
+
+def bridge_urls() -> list[str]:
+    """Instancias de Nitter configuradas: TWITTER_RSS_BRIDGE_URLS separadas por coma, o la única de TWITTER_RSS_BRIDGE_URL."""
+    urls = [url.strip() for url in settings.TWITTER_RSS_BRIDGE_URLS.split(",") if url.strip()]
+    return urls or [settings.TWITTER_RSS_BRIDGE_URL]
+
+
 class Twitter:
     def __init__(self, bot):
         self.bot = bot
-        self.rss_bridge_url = settings.TWITTER_RSS_BRIDGE_URL
+        self.bridges = BridgePool(bridge_urls(), settings.TWITTER_BRIDGE_REQUESTS_PER_MINUTE)
+        self.schedule = InfluencerSchedule(POLLING)
 
     async def check_rss_notifications(self):
-        influencers: List[InfluencerModel] = self.bot.influencer_dao.get_by_platform(SocialMedia.TWITTER)
-        one_week_ago = datetime.now(settings.TIMEZONE) - timedelta(days=7)
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        failures = 0
-
-        async with aiohttp.ClientSession() as session:
-            for influencer in influencers:
-                try:
-                    ok = await self._process_influencer(session, influencer, one_week_ago, headers)
-                    if not ok:
-                        failures += 1
-                except Exception:
-                    failures += 1
-                await asyncio.sleep(25)
-
+        now = datetime.now(settings.TIMEZONE)
+        influencers: List[InfluencerModel] = self.schedule.due(await self.bot.influencer_dao.get_by_platform(SocialMedia.TWITTER), now)
+        if not influencers:
+            return
+        one_week_ago = now - timedelta(days=7)
+        claimed = set()
+
+        # Todos en paralelo: el ritmo lo ponen los token buckets de cada instancia del pool y
+        # los que no consiguen token esperan en su fila, no cuentan como falla.
+        session = self.bot.http_client.session("twitter")
+        results = await asyncio.gather(
+            *(self._poll_influencer(session, influencer, one_week_ago, claimed) for influencer in influencers),
+            return_exceptions=True,
+        )
+
+        failures = sum(1 for result in results if result is not True)
         if failures:
-            await self.bot.messager.log(f"No pude leer {failures} feed(s) de Twitter (rate limit o error de Nitter).", level="WARNING")
-
-    async def _process_influencer(self, session, influencer, one_week_ago, headers) -> bool:
-        name = influencer["name"]
-        feed_url = f"{self.rss_bridge_url}/{name}/rss"
-
-        async with session.get(feed_url, headers=headers, timeout=aiohttp.ClientTimeout(total=60)) as response:
-            if response.status == 429:
-                retry_after = response.headers.get("Retry-After")
-                backoff = int(retry_after) if retry_after and retry_after.isdigit() else 30
-                await asyncio.sleep(backoff)
-                return False
-            if response.status != 200:
-                return False
-
-            content = (await response.read()).decode("utf-8", errors="replace")
-            feed = feedparser.parse(content)
-
-        if not feed.entries:
-            return True
-
-        for entry in reversed(feed.entries):
-            parsed = parse_entry(entry, influencer)
-            if not parsed:
-                continue
+            await self.bot.messager.log(
+                f"No pude leer {failures} feed(s) de Twitter (instancias de Nitter enfriándose o con error).\n{self.bridges.summary()}",
+                level="WARNING",
+            )
 
-            if parsed["published_date"] < one_week_ago:
+    async def _fetch_feed(self, session, name: str):
+        """Pide el RSS a la instancia más sana del pool. Si una contesta 429 o falla, prueba con otra."""
+        tried = set()
+        while len(tried) < len(self.bridges):
+            bridge = await self.bridges.acquire(exclude=tried)
+            if bridge is None:
+                return None
+            tried.add(bridge.url)
+
+            started = time.monotonic()
+            try:
+                page = await self.bot.http_cache.get(session, f"{bridge.url}/{name}/rss")
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self.bridges.report(bridge, time.monotonic() - started, ok=False)
                 continue
+            elapsed = time.monotonic() - started
 
-            if self.bot.news_dao.exists(parsed["url"]):
+            if page.status == 429:
+                self.bridges.report(bridge, elapsed, ok=False, retry_after=parse_retry_after(page.headers.get("Retry-After"), 30))
                 continue
+            if page.status >= 500:
+                self.bridges.report(bridge, elapsed, ok=False)
+                continue
+            # Un 404 es de la cuenta, no de la instancia: no tiene sentido probar con otra.
+            self.bridges.report(bridge, elapsed, ok=True)
+            return page
+        return None
 
-            await self.bot.messager.news(
-                type=parsed["source"],
-                title=parsed["title"],
-                description=parsed["description"],
-                url=parsed["url"],
-                image_url=parsed["image_url"],
-                publisher=parsed["publisher"],
-                color="#00acee",
-            )
-            self.bot.news_dao.insert(parsed["url"])
-            await asyncio.sleep(1)
-
-        return True
\ No newline at end of file
+    async def _poll_influencer(self, session, influencer, one_week_ago, claimed: set) -> bool:
+        post_dates = None
+        try:
+            ok, post_dates = await self._process_influencer(session, influencer, one_week_ago, claimed)
+            return ok
+        finally:
+            self.schedule.reschedule(influencer, datetime.now(settings.TIMEZONE), post_dates)
+
+    async def _process_influencer(self, session, influencer, one_week_ago, claimed: set) -> tuple[bool, list[datetime] | None]:
+        """Devuelve si se pudo leer el feed y las fechas de los tweets que trae (None si no cambió)."""
+        page = await self._fetch_feed(session, influencer["name"])
+        if page is None:
+            return False, None
+        if page.status == 304 or (page.status == 200 and not page.changed):
+            return True, None
+        if page.status != 200:
+            return False, None
+
+        # El feed se lee liviano; el HTML de cada tweet se interpreta recién si hay que publicarlo.
+        entries = await self.bot.parsing_pool.run(parse_entries, page.body)
+        post_dates = [entry_date(entry) for entry in entries if entry.published]
+        fresh = entries_after(entries, influencer.get("last_seen"), entry_url)
+        candidates = {}
+        for entry in fresh:
+            url = entry_url(entry)
+            if url and entry_date(entry) >= one_week_ago:
+                candidates[url] = entry
+        if not candidates:
+            await self._mark_seen(influencer, fresh)
+            page.commit()
+            return True, post_dates
+
+        already_published = await self.bot.news_dao.existing_urls(candidates.keys())
+        new_entries = []
+        for url, entry in candidates.items():
+            # `claimed` evita que dos cuentas que retuitean lo mismo lo publiquen dos veces en el mismo ciclo.
+            if url in already_published or url in claimed:
+                continue
+            claimed.add(url)
+            new_entries.append(entry)
+        tweets = await self.bot.parsing_pool.run(parse_tweets, new_entries, influencer) if new_entries else []
+
+        published = []
+        try:
+            for parsed in tweets:
+                await self.bot.messager.news(
+                    type=parsed["source"],
+                    title=parsed["title"],
+                    description=parsed["description"],
+                    url=parsed["url"],
+                    image_url=parsed["image_url"],
+                    publisher=parsed["publisher"],
+                    color="#00acee",
+                )
+                published.append(parsed["url"])
+                await asyncio.sleep(1)
+        finally:
+            await self.bot.news_dao.insert_many(published)
+        await self._mark_seen(influencer, fresh)
+        page.commit()
+
+        return True, post_dates
+
+    async def _mark_seen(self, influencer, fresh: list[FeedEntry]):
+        for entry in reversed(fresh):
+            url = entry_url(entry)
+            if url:
+                await self.bot.influencer_dao.set_last_seen(influencer["_id"], url, entry_date(entry))
+                return
@@ -0,0 +1,120 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+# Peso de la última medición en los promedios móviles de latencia y errores.
+EWMA_ALPHA = 0.3
+# Enfriamiento tras un error sin Retry-After: se duplica con cada error seguido, hasta el máximo.
+ERROR_COOLDOWN_SECONDS = 15.0
+MAX_ERROR_COOLDOWN_SECONDS = 600.0
+
+
+@dataclass
+class BridgeInstance:
+    url: str
+    rate: float
+    burst: float
+    tokens: float = 0.0
+    refilled_at: float = field(default_factory=time.monotonic)
+    latency: float | None = None
+    error_rate: float = 0.0
+    consecutive_errors: int = 0
+    cooldown_until: float = 0.0
+    in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+
+    def refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+
+    def score(self) -> float:
+        """Menor es mejor: lenta, con errores o ya ocupada pesa más."""
+        return (self.latency or 1.0) * (1 + 4 * self.error_rate) * (1 + self.in_flight)
+
+
+class BridgePool:
+    """Reparte pedidos entre varias instancias espejo (Nitter, RSS-Bridge) del mismo servicio.
+
+    Cada instancia tiene su token bucket (`requests_per_minute`, con ráfaga `burst`) y lleva
+    latencia y tasa de error como promedios móviles. `acquire()` elige la instancia sana con
+    mejor puntaje que tenga un token libre, y si no hay ninguna el pedido espera en la fila.
+    Un 429 con Retry-After o una racha de errores la deja en enfriamiento hasta que se cumpla
+    el plazo."""
+
+    def __init__(self, urls: list[str], requests_per_minute: float, burst: int = 2):
+        if not urls:
+            raise ValueError("El pool necesita al menos una instancia")
+        rate = requests_per_minute / 60
+        now = time.monotonic()
+        self.instances = [BridgeInstance(url.rstrip("/"), rate, burst, tokens=burst, refilled_at=now) for url in urls]
+        self._queue = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+    async def acquire(self, exclude: set[str] = frozenset(), max_wait: float = 120.0) -> BridgeInstance | None:
+        """Devuelve una instancia con su token ya consumido. Los pedidos hacen fila (FIFO) y
+        esperan lo que haga falta a que se libere un token: quedarse sin presupuesto no es un
+        error. Solo devuelve None si todas las instancias que no están en `exclude` siguen
+        enfriándose (429 o errores) más allá de `max_wait` segundos."""
+        async with self._queue:
+            deadline = time.monotonic() + max_wait
+            while True:
+                now = time.monotonic()
+                ready = []
+                token_waits = []
+                cooldown_waits = []
+                for instance in self.instances:
+                    if instance.url in exclude:
+                        continue
+                    instance.refill(now)
+                    if instance.cooldown_until > now:
+                        cooldown_waits.append(instance.cooldown_until - now)
+                    elif instance.tokens >= 1:
+                        ready.append(instance)
+                    else:
+                        token_waits.append((1 - instance.tokens) / instance.rate)
+
+                if ready:
+                    chosen = min(ready, key=BridgeInstance.score)
+                    chosen.tokens -= 1
+                    chosen.in_flight += 1
+                    chosen.requests += 1
+                    return chosen
+
+                if not token_waits and (not cooldown_waits or now + min(cooldown_waits) > deadline):
+                    return None
+                await asyncio.sleep(min(token_waits + cooldown_waits))
+
+    def report(self, instance: BridgeInstance, elapsed: float, ok: bool, retry_after: float | None = None):
+        """Registra cómo le fue al pedido que se hizo con `instance`."""
+        instance.in_flight -= 1
+        instance.latency = elapsed if instance.latency is None else (1 - EWMA_ALPHA) * instance.latency + EWMA_ALPHA * elapsed
+        instance.error_rate = (1 - EWMA_ALPHA) * instance.error_rate + EWMA_ALPHA * (0.0 if ok else 1.0)
+        if ok:
+            instance.consecutive_errors = 0
+            return
+
+        instance.errors += 1
+        instance.consecutive_errors += 1
+        if retry_after is None:
+            retry_after = min(MAX_ERROR_COOLDOWN_SECONDS, ERROR_COOLDOWN_SECONDS * 2 ** (instance.consecutive_errors - 1))
+        instance.cooldown_until = max(instance.cooldown_until, time.monotonic() + retry_after)
+
+    def summary(self) -> str:
+        now = time.monotonic()
+        lines = []
+        for instance in self.instances:
+            latency = f"{instance.latency * 1000:.0f}ms" if instance.latency is not None else "sin datos"
+            state = f", enfriándose {instance.cooldown_until - now:.0f}s" if instance.cooldown_until > now else ""
+            lines.append(f"{instance.url}: {latency}, {instance.error_rate:.0%} errores, "
+                         f"{instance.errors}/{instance.requests} fallidos{state}")
+        return "\n".join(lines)
+
+
+def parse_retry_after(value: str | None, default: float) -> float:
+    """Retry-After en segundos. La variante con fecha HTTP no la usan los espejos, cae en `default`."""
+    if value and value.strip().isdigit():
+        return float(value.strip())
+    return default
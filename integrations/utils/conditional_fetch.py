@@ -0,0 +1,93 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status: int
+    headers: dict = field(default_factory=dict)
+    body: bytes | None = None
+    encoding: str | None = None
+    changed: bool = False
+    _pending: dict | None = field(default=None, repr=False)
+    _fetcher: 'ConditionalFetcher | None' = field(default=None, repr=False)
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace") if self.body is not None else ""
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientError(f"{self.status}, url={self.url}")
+
+    def commit(self):
+        """Guarda los validadores de esta respuesta. Se llama recién cuando el contenido se
+        procesó bien, así un ciclo que falla a la mitad se reintenta entero la próxima vez."""
+        if self._fetcher and self._pending:
+            self._fetcher._store(self.url, self._pending)
+            self._pending = None
+
+
+class ConditionalFetcher:
+    """GET condicional con ETag / Last-Modified y hash del cuerpo, persistido por URL en disco.
+
+    Si el servidor contesta 304, o contesta 200 con exactamente el mismo cuerpo que la última
+    vez, el resultado viene con `changed=False` y el llamador se saltea el parseo."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._entries: dict[str, dict] = {}
+        try:
+            self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"No pude leer la caché HTTP en {self.path}, arranco de cero: {e}")
+
+    async def get(self, session: aiohttp.ClientSession, url: str, force: bool = False, **kwargs) -> FetchResult:
+        """`force=True` ignora lo guardado y siempre trae el cuerpo (para cuando el llamador
+        no tiene en memoria el resultado del último parseo, por ejemplo tras un reinicio)."""
+        entry = {} if force else self._entries.get(url, {})
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        async with session.get(url, headers=headers, **kwargs) as response:
+            if response.status == 304:
+                return FetchResult(url, 304, dict(response.headers))
+            if response.status != 200:
+                return FetchResult(url, response.status, dict(response.headers))
+            body = await response.read()
+            encoding = response.get_encoding()
+            pending = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "hash": hashlib.sha256(body).hexdigest(),
+            }
+
+        changed = force or pending["hash"] != self._entries.get(url, {}).get("hash")
+        result = FetchResult(url, 200, dict(response.headers), body, encoding, changed, pending, self)
+        if not changed:
+            result.commit()
+        return result
+
+    def _store(self, url: str, entry: dict):
+        self._entries[url] = entry
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._entries), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"No pude persistir la caché HTTP en {self.path}: {e}")
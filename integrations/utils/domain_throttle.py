@@ -0,0 +1,25 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+
+class DomainThrottle:
+    """Limita cuántos requests simultáneos se le hacen a un mismo dominio y espacia
+    el arranque de cada uno, para poder scrapear en paralelo sin martillar el sitio."""
+
+    def __init__(self, max_concurrency: int = 2, min_interval: float = 5.0):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._min_interval = min_interval
+        self._next_start = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._semaphore:
+            async with self._lock:
+                now = time.monotonic()
+                wait = self._next_start - now
+                self._next_start = max(now, self._next_start) + self._min_interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+            yield
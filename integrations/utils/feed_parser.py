@@ -0,0 +1,89 @@
+import io
+import logging
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+MEDIA = "{http://search.yahoo.com/mrss/}"
+
+
+@dataclass
+class FeedEntry:
+    """Los pocos campos que leemos de una entrada. `description` queda como vino (en Nitter es
+    HTML): interpretarlo es trabajo del llamador y solo para las entradas nuevas."""
+    link: str
+    title: str
+    published: datetime | None
+    thumbnail: str | None
+    description: str
+
+
+def _rss_date(value: str | None) -> datetime | None:
+    try:
+        return parsedate_to_datetime(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _atom_date(value: str | None) -> datetime | None:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _rss_item(item: ET.Element) -> FeedEntry:
+    thumbnail = item.find(f"{MEDIA}thumbnail")
+    return FeedEntry(
+        link=(item.findtext("link") or "").strip(),
+        title=item.findtext("title") or "",
+        published=_rss_date(item.findtext("pubDate")),
+        thumbnail=thumbnail.get("url") if thumbnail is not None else None,
+        description=item.findtext("description") or "",
+    )
+
+
+def _atom_entry(entry: ET.Element) -> FeedEntry:
+    links = entry.findall(f"{ATOM}link")
+    link = next((l for l in links if l.get("rel", "alternate") == "alternate"), links[0] if links else None)
+    thumbnail = entry.find(f".//{MEDIA}thumbnail")
+    description = entry.findtext(f".//{MEDIA}description")
+    if description is None:
+        description = entry.findtext(f"{ATOM}summary") or entry.findtext(f"{ATOM}content") or ""
+    return FeedEntry(
+        link=link.get("href", "") if link is not None else "",
+        title=entry.findtext(f"{ATOM}title") or "",
+        published=_atom_date(entry.findtext(f"{ATOM}published") or entry.findtext(f"{ATOM}updated")),
+        thumbnail=thumbnail.get("url") if thumbnail is not None else None,
+        description=description,
+    )
+
+
+def iter_entries(content: bytes) -> Iterator[FeedEntry]:
+    """Recorre un feed RSS 2.0 o Atom directo desde los bytes de la respuesta, en el orden del
+    documento, sin armar el árbol entero: cada entrada se libera apenas se leyó."""
+    for _, element in ET.iterparse(io.BytesIO(content), events=("end",)):
+        if element.tag == "item":
+            yield _rss_item(element)
+            element.clear()
+        elif element.tag == f"{ATOM}entry":
+            yield _atom_entry(element)
+            element.clear()
+
+
+def parse_entries(content: bytes) -> list[FeedEntry]:
+    """Las entradas del feed del más viejo al más nuevo (los feeds vienen al revés). Si el XML
+    está roto a la mitad se queda con lo que alcanzó a leer."""
+    entries = []
+    try:
+        for entry in iter_entries(content):
+            entries.append(entry)
+    except ET.ParseError as e:
+        logger.warning(f"Feed mal formado, uso las {len(entries)} entradas que pude leer: {e}")
+    entries.reverse()
+    return entries
@@ -0,0 +1,18 @@
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def entries_after(entries: list[T], last_seen: dict | None, key: Callable[[T], str | None]) -> list[T]:
+    """Devuelve las entradas posteriores a la marca `last_seen` del influencer.
+
+    `entries` va del más viejo al más nuevo y se recorre desde el final hasta la primera cuyo
+    `key` coincide con el id guardado. Si la marca no aparece (primera vez, o la borraron del
+    feed) se devuelven todas y el filtro por fecha y `existing_urls` hacen el resto."""
+    last_id = (last_seen or {}).get("id")
+    if last_id is None:
+        return entries
+    for index in range(len(entries) - 1, -1, -1):
+        if key(entries[index]) == last_id:
+            return entries[index + 1:]
+    return entries
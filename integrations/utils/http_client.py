@@ -0,0 +1,81 @@
+import logging
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+@dataclass(frozen=True)
+class HttpProfile:
+    headers: dict = field(default_factory=dict)
+    timeout: float | None = 30
+
+
+# Headers y timeout por defecto de cada integración. Todas comparten el mismo pool de conexiones.
+PROFILES = {
+    "news": HttpProfile(headers={"User-Agent": BROWSER_USER_AGENT}, timeout=10),
+    "youtube": HttpProfile(timeout=10),
+    "twitter": HttpProfile(headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}, timeout=60),
+    "promiedos": HttpProfile(headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}, timeout=30),
+    "promiedos_api": HttpProfile(
+        headers={
+            "User-Agent": settings.USER_AGENT,
+            "Referer": "https://www.promiedos.com.ar/",
+            "X-VER": "1.11.7.5",
+        },
+        timeout=20,
+    ),
+    "hardware_monitor": HttpProfile(headers={"X-Auth-Token": settings.HARDWARE_MONITOR_TOKEN}, timeout=5),
+    "cdp": HttpProfile(timeout=None),
+    "deepseek": HttpProfile(timeout=120),
+}
+
+
+class HttpClient:
+    """Cliente HTTP del bot: un único TCPConnector con keep-alive, límite por host y caché de
+    DNS, y una ClientSession liviana por integración con sus headers y timeout por defecto.
+    Se arranca en `setup_hook` y se cierra junto con el bot."""
+
+    def __init__(self):
+        self._connector: aiohttp.TCPConnector | None = None
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+
+    async def start(self):
+        if self._connector is not None:
+            return
+        self._connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_POOL_LIMIT,
+            limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_SECONDS,
+            enable_cleanup_closed=True,
+        )
+
+    def session(self, name: str) -> aiohttp.ClientSession:
+        if self._connector is None:
+            raise RuntimeError("HttpClient usado antes de start().")
+        session = self._sessions.get(name)
+        if session is None or session.closed:
+            profile = PROFILES[name]
+            session = aiohttp.ClientSession(
+                connector=self._connector,
+                connector_owner=False,
+                headers=profile.headers,
+                timeout=aiohttp.ClientTimeout(total=profile.timeout),
+            )
+            self._sessions[name] = session
+        return session
+
+    async def close(self):
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+        logger.info("Cliente HTTP cerrado")
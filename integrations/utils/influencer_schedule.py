@@ -0,0 +1,123 @@
+import heapq
+import itertools
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from config.settings import settings
+from models.influencer import AttentionLevel
+
+# Cuántas veces conviene revisar una cuenta entre dos publicaciones suyas.
+POLLS_PER_POST = 3
+# Publicaciones más viejas que esto no cuentan para estimar la frecuencia.
+FREQUENCY_WINDOW = timedelta(days=30)
+JITTER = 0.1
+
+
+@dataclass(frozen=True)
+class PollingProfile:
+    """Cada cuánto revisar las cuentas de una plataforma.
+
+    `high` y `low` son los intervalos base según AttentionLevel; la frecuencia observada de
+    publicación los acerca o aleja, siempre dentro de [`minimum`, `maximum`]. En `quiet_hours`
+    (hora local) el intervalo se multiplica por `quiet_factor`; si es None, directamente no se
+    revisa y la cuenta espera a que terminen."""
+    high: timedelta
+    low: timedelta
+    minimum: timedelta
+    maximum: timedelta
+    quiet_hours: frozenset[int] = frozenset(range(2, 8))
+    quiet_factor: float | None = 3.0
+
+    def base(self, attention: AttentionLevel) -> timedelta:
+        return self.low if attention == AttentionLevel.LOW else self.high
+
+
+def posting_gap(post_dates: list[datetime], now: datetime) -> timedelta | None:
+    """Tiempo promedio entre publicaciones recientes. Si la cuenta lleva callada más que eso,
+    cuenta el silencio: una cuenta que dejó de publicar se revisa cada vez menos."""
+    if not post_dates:
+        return None
+    newest = max(post_dates)
+    recent = sorted(date for date in post_dates if date >= now - FREQUENCY_WINDOW)
+    silence = max(now - newest, timedelta(0))
+    if len(recent) >= 2:
+        return max((recent[-1] - recent[0]) / (len(recent) - 1), silence)
+    # Con una sola publicación reciente (o ninguna) no hay promedio: se asume que publica poco.
+    return max(silence, FREQUENCY_WINDOW / (4 if recent else 2))
+
+
+class InfluencerSchedule:
+    """Cola de prioridad con el próximo poll de cada cuenta de una plataforma.
+
+    `due()` se llama en cada vuelta del loop con la lista de cuentas de la base (así se enteran
+    las altas y bajas) y devuelve las vencidas, la más atrasada primero. Después de revisar una
+    cuenta hay que llamar a `reschedule()` con las fechas de lo que se vio en su feed, aunque
+    haya fallado, para que vuelva a la cola."""
+
+    def __init__(self, profile: PollingProfile):
+        self.profile = profile
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._next: dict[str, datetime] = {}
+        self._gaps: dict[str, timedelta] = {}
+        self._seq = itertools.count()
+
+    def due(self, influencers: list[dict], now: datetime) -> list[dict]:
+        by_name = {influencer["name"]: influencer for influencer in influencers}
+        for name in by_name:
+            if name not in self._next:
+                # Cuenta nueva (o recién arrancado el bot): se reparten a lo largo del intervalo mínimo.
+                self._push(name, now + self.profile.minimum * random.random())
+
+        if self.profile.quiet_factor is None and now.astimezone(settings.TIMEZONE).hour in self.profile.quiet_hours:
+            return []
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            at, _, name = heapq.heappop(self._heap)
+            if self._next.get(name) != at:
+                continue
+            del self._next[name]
+            if name in by_name:
+                due.append(by_name[name])
+        return due
+
+    def reschedule(self, influencer: dict, now: datetime, post_dates: list[datetime] | None = None) -> datetime:
+        """Calcula el próximo poll. `post_dates` son las fechas de las publicaciones que trajo el
+        feed; None si no hubo datos nuevos (sin cambios o error) y vale la estimación anterior."""
+        name = influencer["name"]
+        if post_dates is not None:
+            gap = posting_gap(post_dates, now)
+            if gap is not None:
+                self._gaps[name] = gap
+
+        interval = self.interval(AttentionLevel(influencer.get("attention", AttentionLevel.HIGH)), self._gaps.get(name))
+        interval *= random.uniform(1 - JITTER, 1 + JITTER)
+
+        at = now + interval
+        quiet = self.profile.quiet_hours
+        if self.profile.quiet_factor is not None:
+            if now.astimezone(settings.TIMEZONE).hour in quiet:
+                at = now + min(interval * self.profile.quiet_factor, self.profile.maximum)
+        else:
+            local = at.astimezone(settings.TIMEZONE)
+            while local.hour in quiet:
+                local = local.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            if local != at.astimezone(settings.TIMEZONE):
+                at = local + timedelta(minutes=random.uniform(0, 10))
+
+        self._push(name, at)
+        return at
+
+    def interval(self, attention: AttentionLevel, gap: timedelta | None) -> timedelta:
+        """Media geométrica entre el intervalo base y el que pide la frecuencia observada."""
+        base = self.profile.base(attention)
+        if gap is None:
+            return base
+        wanted = gap / POLLS_PER_POST
+        interval = timedelta(seconds=math.sqrt(base.total_seconds() * wanted.total_seconds()))
+        return min(max(interval, self.profile.minimum), self.profile.maximum)
+
+    def _push(self, name: str, at: datetime):
+        self._next[name] = at
+        heapq.heappush(self._heap, (at, next(self._seq), name))
@@ -0,0 +1,49 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+logger = logging.getLogger(__name__)
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class ParsingPool:
+    """Executor dedicado para parsear HTML/RSS (BeautifulSoup, feeds RSS/Atom, regex sobre páginas
+    enteras) y otros trabajos de CPU, como dibujar las formaciones, fuera del event loop, que es
+    el mismo que usan el heartbeat de Discord y el relator.
+
+    Con `use_processes=True` usa procesos en vez de threads, para páginas pesadas donde el GIL
+    pesa; en ese caso las funciones tienen que ser de módulo y devolver datos planos."""
+
+    def __init__(self, max_workers: int = 2, use_processes: bool = False):
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+            if use_processes else ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parsing")
+        )
+        self.jobs: dict[str, int] = defaultdict(int)
+        self.busy_seconds: dict[str, float] = defaultdict(float)
+
+    async def run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        result, elapsed = await loop.run_in_executor(self._executor, partial(_timed, func, *args))
+        name = f"{func.__module__}.{func.__qualname__}"
+        self.jobs[name] += 1
+        self.busy_seconds[name] += elapsed
+        if elapsed > 1:
+            logger.info(f"Parseo lento fuera del loop: {name} tardó {elapsed:.2f}s")
+        return result
+
+    @property
+    def total_busy_seconds(self) -> float:
+        return sum(self.busy_seconds.values())
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,71 +1,122 @@
 import asyncio
 from typing import List
-import aiohttp
-import feedparser
 from datetime import datetime, timedelta
 
 from config.settings import settings
+from integrations.utils.feed_parser import parse_entries
+from integrations.utils.high_water_mark import entries_after
+from integrations.utils.influencer_schedule import InfluencerSchedule, PollingProfile
 from models.influencer import InfluencerModel
 from utils.date_format import to_local
 from models.social_media import SocialMedia
 
+POLLING = PollingProfile(
+    high=timedelta(minutes=15),
+    low=timedelta(hours=1),
+    minimum=timedelta(minutes=5),
+    maximum=timedelta(hours=6),
+)
+
+
+def parse_feed(content: bytes) -> list[dict]:
+    """Lee el feed de un canal y devuelve los videos del más viejo al más nuevo. Corre en el ParsingPool."""
+    return [
+        {
+            'link': entry.link,
+            'title': entry.title,
+            'published': entry.published,
+            'summary': entry.description,
+            'thumbnail': entry.thumbnail,
+        }
+        for entry in parse_entries(content)
+    ]
+
+
+def published_date(video: dict) -> datetime | None:
+    return to_local(video['published']) if video['published'] else None
+
+
 class YouTube:
     domain = "https://www.youtube.com"
 
     def __init__(self, bot):
         self.bot = bot
+        self.schedule = InfluencerSchedule(POLLING)
 
     async def check_rss_notifications(self):
-        youtube_influencers: List[InfluencerModel] = self.bot.influencer_dao.get_by_platform(SocialMedia.YOUTUBE)
+        now = datetime.now(settings.TIMEZONE)
+        youtube_influencers: List[InfluencerModel] = self.schedule.due(await self.bot.influencer_dao.get_by_platform(SocialMedia.YOUTUBE), now)
         if not youtube_influencers:
             return
 
-        one_week_ago = datetime.now(settings.TIMEZONE) - timedelta(days=7)
-
-        async with aiohttp.ClientSession() as session:
-            for influencer in youtube_influencers:
-                try:
-                    feed_url = f"{YouTube.domain}/feeds/videos.xml?channel_id={influencer['account_id']}"
-                    async with session.get(feed_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                        if response.status != 200:
-                            continue
-                        feed = feedparser.parse(await response.text())
-
-                    for entry in reversed(feed.entries):
-                        video_url = entry.link
-                        normalized_url = self.bot.news_dao.normalize_url(YouTube.domain, video_url)
-
-                        if self.bot.news_dao.exists(normalized_url):
-                            continue
-
-                        try:
-                            published_date = to_local(datetime.strptime(entry.published, '%Y-%m-%dT%H:%M:%S%z'))
-                            if published_date < one_week_ago:
-                                continue
-                        except (ValueError, AttributeError) as e:
-                            await self.bot.messager.log(f"No pude parsear la fecha del video {video_url}: {e}", level="WARNING")
-                            continue
-
-                        is_short = "/shorts/" in video_url
-                        if is_short:
-                            description = f"Nuevo video corto de {influencer['name']}"
-                        else:
-                            description = entry.summary[:400] + "..." if len(entry.summary) > 400 else entry.summary
-                        image_url = entry.media_thumbnail[0]['url'] if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail else None
-
-                        await self.bot.messager.news(
-                            type=influencer['source'],
-                            title=entry.title,
-                            description=description,
-                            url=video_url,
-                            image_url=image_url,
-                            publisher=f"YouTube • {influencer['name']}",
-                            color="#FF0000"
-                        )
-                        self.bot.news_dao.insert(normalized_url)
-                        await asyncio.sleep(1)
-
-                except Exception as e:
-                    await self.bot.messager.log(f"No pude revisar el canal '{influencer['name']}' de YouTube: {e}", level="ERROR", exc=e)
-
-                await asyncio.sleep(2)
+        one_week_ago = now - timedelta(days=7)
+
+        session = self.bot.http_client.session("youtube")
+        for influencer in youtube_influencers:
+            post_dates = None
+            try:
+                post_dates = await self._process_channel(session, influencer, one_week_ago)
+            except Exception as e:
+                await self.bot.messager.log(f"No pude revisar el canal '{influencer['name']}' de YouTube: {e}", level="ERROR", exc=e)
+            finally:
+                self.schedule.reschedule(influencer, datetime.now(settings.TIMEZONE), post_dates)
+
+            await asyncio.sleep(2)
+
+    async def _process_channel(self, session, influencer, one_week_ago) -> list[datetime] | None:
+        """Publica los videos nuevos del canal y devuelve las fechas de los que trae el feed (None si no cambió)."""
+        feed_url = f"{YouTube.domain}/feeds/videos.xml?channel_id={influencer['account_id']}"
+        page = await self.bot.http_cache.get(session, feed_url)
+        if page.status != 200 or not page.changed:
+            return None
+        videos = await self.bot.parsing_pool.run(parse_feed, page.body)
+        for video in videos:
+            video['url'] = self.bot.news_dao.normalize_url(YouTube.domain, video['link'])
+        fresh = entries_after(videos, influencer.get('last_seen'), lambda video: video['url'])
+        post_dates = [date for date in map(published_date, videos) if date is not None]
+        if not fresh:
+            page.commit()
+            return post_dates
+
+        already_published = await self.bot.news_dao.existing_urls(video['url'] for video in fresh)
+
+        published = []
+        try:
+            for video in fresh:
+                video_url = video['link']
+                normalized_url = video['url']
+
+                if normalized_url in already_published or normalized_url in published:
+                    continue
+
+                video_date = published_date(video)
+                if video_date is None:
+                    await self.bot.messager.log(f"El video {video_url} no trae una fecha válida en el feed", level="WARNING")
+                    continue
+                if video_date < one_week_ago:
+                    continue
+
+                is_short = "/shorts/" in video_url
+                if is_short:
+                    description = f"Nuevo video corto de {influencer['name']}"
+                else:
+                    description = video['summary'][:400] + "..." if len(video['summary']) > 400 else video['summary']
+
+                await self.bot.messager.news(
+                    type=influencer['source'],
+                    title=video['title'],
+                    description=description,
+                    url=video_url,
+                    image_url=video['thumbnail'],
+                    publisher=f"YouTube • {influencer['name']}",
+                    color="#FF0000"
+                )
+                published.append(normalized_url)
+                await asyncio.sleep(1)
+        finally:
+            await self.bot.news_dao.insert_many(published)
+        newest = fresh[-1]
+        await self.bot.influencer_dao.set_last_seen(influencer['_id'], newest['url'], published_date(newest))
+        page.commit()
+
+        return post_dates
@@ -2,11 +2,14 @@ import asyncio
 import logging
 from bot.client import DiabloRobot
 from config.settings import settings
+from utils.structured_log import setup_structured_log
 
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
 )
+if settings.LOG_FILE:
+    setup_structured_log(settings.LOG_FILE, settings.LOG_FILE_MAX_BYTES, settings.LOG_FILE_BACKUPS)
 logger = logging.getLogger(__name__)
 
 
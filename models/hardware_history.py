@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+# Métricas de HardwareSnapshot que se guardan en el historial.
+HISTORY_METRICS = ("cpu_percent", "ram_percent", "disk_percent", "cpu_temp_c", "gpu_temp_c")
+
+
+@dataclass
+class HardwarePoint:
+    """Un punto de la serie: una muestra cruda o un bucket agregado. Para las muestras crudas
+    mínimo, promedio y máximo coinciden. Las métricas sin lecturas (ej. sin sensor de GPU) no están."""
+    timestamp: datetime
+    values: dict[str, tuple[float, float, float]]
+
+    @classmethod
+    def from_sample(cls, doc: dict) -> 'HardwarePoint':
+        return cls(
+            timestamp=doc["timestamp"],
+            values={m: (doc[m], doc[m], doc[m]) for m in HISTORY_METRICS if doc.get(m) is not None},
+        )
+
+    @classmethod
+    def from_rollup(cls, doc: dict) -> 'HardwarePoint':
+        return cls(
+            timestamp=doc["timestamp"],
+            values={m: (doc[m]["min"], doc[m]["avg"], doc[m]["max"]) for m in HISTORY_METRICS if doc.get(m)},
+        )
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class TrackerState:
+    match_id: str
+    seen_events: set[str] = field(default_factory=set)
+    last_scores: Optional[tuple[int, int]] = None
+    roster: dict[str, int] = field(default_factory=dict)
+    on_field: dict[int, set[str]] = field(default_factory=dict)
+    start_sent: bool = False
+    thread_id: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        # Los nombres de jugadores pueden tener puntos, así que el plantel va como lista de pares y no como subdocumento.
+        return {
+            "match_id": self.match_id,
+            "seen_events": sorted(self.seen_events),
+            "last_scores": list(self.last_scores) if self.last_scores else None,
+            "roster": [[name, num] for name, num in self.roster.items()],
+            "on_field": {str(team_idx): sorted(players) for team_idx, players in self.on_field.items()},
+            "start_sent": self.start_sent,
+            "thread_id": self.thread_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TrackerState':
+        last_scores = data.get("last_scores")
+        return cls(
+            match_id=data["match_id"],
+            seen_events=set(data.get("seen_events", [])),
+            last_scores=tuple(last_scores) if last_scores else None,
+            roster={name: num for name, num in data.get("roster", [])},
+            on_field={int(team_idx): set(players) for team_idx, players in data.get("on_field", {}).items()},
+            start_sent=data.get("start_sent", False),
+            thread_id=data.get("thread_id"),
+        )
@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from bot.commentator.poll_policy import (
+    BASELINE_INTERVAL,
+    CLOSING_INTERVAL,
+    HALF_TIME_ENDING_INTERVAL,
+    HALF_TIME_INTERVAL,
+    HOT_INTERVAL,
+    LIVE_INTERVAL,
+    PRE_MATCH_FAR_INTERVAL,
+    PRE_MATCH_NEAR_INTERVAL,
+    MatchPhase,
+    PollPolicy,
+    _minute,
+    detect_phase,
+)
+from config.settings import settings
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def game(status: int = 1, game_time=30, status_name: str = "", stages: tuple[str, ...] = ("Primer Tiempo",), events: int = 0) -> dict:
+    rows = [{"time": f"{minute}'", "events": [{"type": 4, "texts": [f"J{minute}"]}]} for minute in range(events)]
+    return {
+        "status": {"enum": status, "name": status_name},
+        "game_time": game_time,
+        "events": [{"name": name, "rows": rows if idx == 0 else []} for idx, name in enumerate(stages)],
+    }
+
+
+@pytest.mark.parametrize("game_time, expected", [("45+2", 47), (73, 73), ("90 + 4'", 94), ("ET", None), (None, None)])
+def test_minute(game_time, expected):
+    assert _minute(game_time) == expected
+
+
+@pytest.mark.parametrize("payload, phase", [
+    (game(status=0), MatchPhase.PRE_MATCH),
+    (game(game_time=30), MatchPhase.LIVE),
+    (game(game_time="45+2"), MatchPhase.LIVE),
+    (game(game_time="ET"), MatchPhase.HALF_TIME),
+    (game(game_time=45, status_name="Entretiempo"), MatchPhase.HALF_TIME),
+    (game(game_time=85), MatchPhase.CLOSING),
+    (game(game_time=100, stages=("Primer Tiempo", "Segundo Tiempo", "Alargue")), MatchPhase.LIVE),
+    (game(game_time=116, stages=("Primer Tiempo", "Segundo Tiempo", "Alargue")), MatchPhase.CLOSING),
+    (game(game_time=90, status_name="Descanso", stages=("Segundo Tiempo", "Alargue")), MatchPhase.BREAK),
+    (game(game_time=120, stages=("Alargue", "Definición por penales")), MatchPhase.PENALTIES),
+    (game(status=3, game_time=90), MatchPhase.FINISHED),
+])
+def test_detect_phase(payload, phase):
+    assert detect_phase(payload) == phase
+
+
+def test_pre_match_interval_depends_on_kickoff():
+    far = datetime.now(settings.TIMEZONE) + timedelta(hours=2)
+    assert PollPolicy(far, clock=FakeClock()).observe(game(status=0)) == PRE_MATCH_FAR_INTERVAL
+    assert PollPolicy(None, clock=FakeClock()).observe(game(status=0)) == PRE_MATCH_NEAR_INTERVAL
+
+
+def _run(policy: PollPolicy, clock: FakeClock, payload: dict, polls: int) -> list[float]:
+    intervals = []
+    for _ in range(polls):
+        interval = policy.observe(payload)
+        intervals.append(interval)
+        clock.now += interval
+    return intervals
+
+
+def test_live_without_news_uses_live_interval():
+    clock = FakeClock()
+    policy = PollPolicy(clock=clock)
+    assert _run(policy, clock, game(game_time=30), 5) == [LIVE_INTERVAL] * 5
+    assert policy.phase == MatchPhase.LIVE
+
+
+def test_new_events_speed_up_polling_while_there_is_credit():
+    clock = FakeClock()
+    policy = PollPolicy(clock=clock)
+    _run(policy, clock, game(game_time=30), 10)  # 10 consultas cada 40s juntan crédito
+
+    assert policy.observe(game(game_time=36, events=1)) == HOT_INTERVAL
+
+
+def test_closing_is_capped_at_the_fixed_poll_volume():
+    clock = FakeClock()
+    policy = PollPolicy(clock=clock)
+    intervals = _run(policy, clock, game(game_time=85), 200)
+
+    assert policy.phase == MatchPhase.CLOSING
+    # Sin crédito juntado, el cierre no puede ir más rápido que el poll fijo.
+    assert all(interval >= CLOSING_INTERVAL for interval in intervals)
+    assert policy.requests <= (clock.now - 1000.0) / BASELINE_INTERVAL + 1
+
+
+def test_credit_from_quiet_phases_is_spent_in_the_closing():
+    clock = FakeClock()
+    policy = PollPolicy(clock=clock)
+    _run(policy, clock, game(game_time="ET"), 5)  # entretiempo: 5 consultas en 10 minutos
+
+    intervals = _run(policy, clock, game(game_time=85), 40)
+    assert intervals[0] == CLOSING_INTERVAL
+    assert policy.requests <= (clock.now - 1000.0) / BASELINE_INTERVAL + 1
+
+
+def test_half_time_polls_faster_when_it_is_about_to_end():
+    clock = FakeClock()
+    policy = PollPolicy(clock=clock)
+    intervals = _run(policy, clock, game(game_time="ET"), 6)
+    assert intervals[:5] == [HALF_TIME_INTERVAL] * 5
+    assert intervals[5] == HALF_TIME_ENDING_INTERVAL
+
+
+def test_failed_requests_count_against_the_budget():
+    clock = FakeClock()
+    policy = PollPolicy(clock=clock)
+    policy.observe(game(game_time=85))
+    policy.observe(None)
+    policy.observe(None)
+
+    assert policy.requests == 3
+    assert policy.interval == 3 * BASELINE_INTERVAL
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from bot.commentator import poll_scheduler
+from bot.commentator.poll_scheduler import PollScheduler
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_polls_run_by_earliest_deadline():
+    async def scenario():
+        scheduler = PollScheduler(requests_per_minute=6000)
+        order = []
+
+        def poll(key):
+            async def run():
+                order.append(key)
+                return None
+            return run
+
+        await asyncio.gather(
+            scheduler.run("c", poll("c"), first_delay=0.06),
+            scheduler.run("a", poll("a"), first_delay=0.02),
+            scheduler.run("b", poll("b"), first_delay=0.04),
+        )
+        scheduler.stop()
+        return order
+
+    assert asyncio.run(scenario()) == ["a", "b", "c"]
+
+
+def test_poll_repeats_until_it_returns_none():
+    async def scenario():
+        scheduler = PollScheduler(requests_per_minute=6000)
+        intervals = iter([0.01, 0.01, None])
+        calls = 0
+
+        async def poll():
+            nonlocal calls
+            calls += 1
+            return next(intervals)
+
+        await asyncio.wait_for(scheduler.run("a", poll), timeout=1)
+        scheduler.stop()
+        return calls
+
+    assert asyncio.run(scenario()) == 3
+
+
+def test_poll_errors_reach_the_caller():
+    async def scenario():
+        scheduler = PollScheduler(requests_per_minute=6000)
+
+        async def poll():
+            raise ValueError("falló")
+
+        try:
+            await scheduler.run("a", poll)
+        finally:
+            scheduler.stop()
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+
+def test_cancelling_the_caller_cancels_the_running_poll():
+    async def scenario():
+        scheduler = PollScheduler(requests_per_minute=6000)
+        started = asyncio.Event()
+        poll_cancelled = asyncio.Event()
+
+        async def poll():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                poll_cancelled.set()
+                raise
+
+        caller = asyncio.create_task(scheduler.run("a", poll))
+        await started.wait()
+        caller.cancel()
+        await asyncio.wait_for(poll_cancelled.wait(), timeout=1)
+        scheduler.stop()
+
+    asyncio.run(scenario())
+
+
+def test_stop_cancels_running_and_queued_polls():
+    async def scenario():
+        scheduler = PollScheduler(requests_per_minute=6000)
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+            return 1
+
+        async def later():
+            return None
+
+        running = asyncio.create_task(scheduler.run("slow", slow))
+        queued = asyncio.create_task(scheduler.run("later", later, first_delay=10))
+        await started.wait()
+        scheduler.stop()
+        results = await asyncio.wait_for(asyncio.gather(running, queued, return_exceptions=True), timeout=1)
+        return scheduler, results
+
+    scheduler, results = asyncio.run(scenario())
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert scheduler._entries == [] and scheduler._heap == []
+
+
+def test_token_bucket_limits_polls_per_minute(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(poll_scheduler.time, "monotonic", clock)
+    scheduler = PollScheduler(requests_per_minute=60)  # ráfaga de 10, después 1 por segundo
+
+    assert [scheduler._take_token() for _ in range(10)] == [0] * 10
+    assert scheduler._take_token() == pytest.approx(1.0)
+
+    clock.now += 0.5
+    assert scheduler._take_token() == pytest.approx(0.5)
+    clock.now += 0.5
+    assert scheduler._take_token() == 0
@@ -0,0 +1,16 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from bot.commentator.replay import replay
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "replay"
+RECORDINGS = sorted(FIXTURES.glob("*.jsonl.gz"))
+
+
+@pytest.mark.parametrize("recording", RECORDINGS, ids=lambda path: path.name)
+def test_transcript_matches_expected(recording: Path):
+    expected = recording.with_name(recording.name.removesuffix(".jsonl.gz") + ".txt")
+    report = asyncio.run(replay(recording))
+    assert "\n".join(report.messages) + "\n" == expected.read_text(encoding="utf-8")
@@ -0,0 +1,29 @@
+import os
+
+# La configuración exige las variables del .env del servidor. Para los tests alcanza con
+# valores de mentira: nada se conecta a Discord ni a Mongo.
+_DUMMY_SETTINGS = {
+    "DISCORD_TOKEN": "test",
+    "USER_AGENT": "test",
+    "DATABASE_USERNAME": "test",
+    "DATABASE_PASSWORD": "test",
+    "NOT_ROBOT_DEVIL_USER_TOKEN": "test",
+    "GUILD_ID": "1",
+    "GENERAL_VOICE_CHANNEL_ID": "1",
+    "TERMOS_VOICE_CHANNEL_ID": "1",
+    "GENERAL_TEXT_CHANNEL_ID": "1",
+    "MUSIC_TEXT_CHANNEL_ID": "1",
+    "ANNOUNCEMENTS_TEXT_CHANNEL_ID": "1",
+    "COMMENTATOR_TEXT_CHANNEL_ID": "1",
+    "CLUB_TEXT_CHANNEL_ID": "1",
+    "PRESS_TEXT_CHANNEL_ID": "1",
+    "GAMES_TEXT_CHANNEL_ID": "1",
+    "ROBOT_DEVIL_TEXT_CHANNEL_ID": "1",
+    "MINECRAFT_TEXT_CHANNEL_ID": "1",
+    "FOOTBALL_FORUM_ID": "1",
+    "GAMES_CATEGORY_ID": "1",
+    "NOT_ROBOT_DEVIL_USER_ID": "1",
+    "IDLE_VOICE_CHANNEL_ID": "1",
+}
+for name, value in _DUMMY_SETTINGS.items():
+    os.environ.setdefault(name, value)
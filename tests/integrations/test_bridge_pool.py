@@ -0,0 +1,111 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from integrations.utils import bridge_pool
+from integrations.utils.bridge_pool import ERROR_COOLDOWN_SECONDS, MAX_ERROR_COOLDOWN_SECONDS, BridgePool, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(bridge_pool, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def acquire(pool: BridgePool, **kwargs):
+    return asyncio.run(pool.acquire(**kwargs))
+
+
+def finish(pool: BridgePool, instance, elapsed: float, ok: bool, retry_after: float | None = None):
+    """Un pedido hecho con `instance` (como si hubiera salido de acquire) que terminó así."""
+    instance.in_flight += 1
+    pool.report(instance, elapsed, ok, retry_after)
+
+
+def test_needs_at_least_one_instance():
+    with pytest.raises(ValueError):
+        BridgePool([], requests_per_minute=3)
+
+
+def test_prefers_the_fastest_healthy_instance(clock):
+    pool = BridgePool(["http://lenta/", "http://rapida"], requests_per_minute=60)
+    slow, fast = pool.instances
+    finish(pool, slow, 2.0, ok=True)
+    finish(pool, fast, 0.2, ok=True)
+
+    assert slow.url == "http://lenta"
+    assert acquire(pool) is fast
+    assert fast.in_flight == 1 and fast.requests == 1
+
+
+def test_excluded_instances_are_skipped(clock):
+    pool = BridgePool(["http://a", "http://b"], requests_per_minute=60)
+    assert acquire(pool, exclude={"http://a"}).url == "http://b"
+
+
+def test_retry_after_puts_the_instance_in_cooldown(clock):
+    pool = BridgePool(["http://a", "http://b"], requests_per_minute=60)
+    a, b = pool.instances
+    finish(pool, a, 0.1, ok=False, retry_after=300)
+
+    assert acquire(pool) is b
+    # Solo queda la que está enfriándose, y más allá de max_wait: no hay instancia.
+    assert acquire(pool, exclude={"http://b"}, max_wait=120) is None
+
+    clock.now += 301
+    assert acquire(pool, exclude={"http://b"}) is a
+
+
+def test_consecutive_errors_double_the_cooldown_up_to_the_maximum(clock):
+    pool = BridgePool(["http://a"], requests_per_minute=60)
+    instance = pool.instances[0]
+    cooldowns = []
+    for _ in range(8):
+        instance.cooldown_until = 0
+        finish(pool, instance, 0.1, ok=False)
+        cooldowns.append(instance.cooldown_until - clock.now)
+
+    assert cooldowns[:3] == [ERROR_COOLDOWN_SECONDS, 2 * ERROR_COOLDOWN_SECONDS, 4 * ERROR_COOLDOWN_SECONDS]
+    assert cooldowns[-1] == MAX_ERROR_COOLDOWN_SECONDS
+
+    finish(pool, instance, 0.1, ok=True)
+    assert instance.consecutive_errors == 0
+    assert instance.errors == 8
+
+
+def test_errors_raise_the_error_rate_and_the_score(clock):
+    pool = BridgePool(["http://a", "http://b"], requests_per_minute=60)
+    a, b = pool.instances
+    finish(pool, a, 0.5, ok=False, retry_after=0)
+    finish(pool, b, 0.5, ok=True)
+
+    assert a.error_rate > b.error_rate
+    assert a.score() > b.score()
+
+
+def test_waiters_queue_for_tokens_instead_of_being_dropped():
+    async def scenario():
+        # Una instancia con ráfaga de 1 y 10 pedidos por segundo: 5 pedidos a la vez tienen que hacer fila.
+        pool = BridgePool(["http://a"], requests_per_minute=600, burst=1)
+        results = await asyncio.wait_for(asyncio.gather(*(pool.acquire(max_wait=0) for _ in range(5))), timeout=2)
+        return pool, results
+
+    pool, results = asyncio.run(scenario())
+    assert all(result is pool.instances[0] for result in results)
+    assert pool.instances[0].requests == 5
+
+
+@pytest.mark.parametrize("value, expected", [("120", 120.0), (" 5 ", 5.0), (None, 30.0), ("", 30.0),
+                                             ("Wed, 21 Oct 2026 07:28:00 GMT", 30.0)])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value, default=30.0) == expected
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from integrations.twitter import entry_date, entry_url, parse_tweets
+from integrations.utils.feed_parser import parse_entries
+from integrations.youtube import parse_feed
+
+FEEDS = Path(__file__).parent.parent / "fixtures" / "feeds"
+NITTER = (FEEDS / "nitter_rss.xml").read_bytes()
+YOUTUBE = (FEEDS / "youtube_atom.xml").read_bytes()
+
+
+def test_rss_entries_come_oldest_first():
+    entries = parse_entries(NITTER)
+    assert [entry.title for entry in entries] == [
+        "Tuit con fecha rota",
+        "Citados para el partido de mañana 📋",
+        "¡Mañana se juega! Todos a la Doble Visera 🔴",
+    ]
+
+
+def test_rss_fields():
+    broken, quoted, newest = parse_entries(NITTER)
+
+    assert newest.link == "https://nitter.net/Independiente/status/1979000000000000002#m"
+    assert newest.published == datetime(2026, 10, 18, 21, 30, tzinfo=timezone.utc)
+    assert newest.thumbnail is None
+    assert newest.description.startswith("<p>¡Mañana se juega!")
+
+    assert quoted.thumbnail == "https://nitter.net/pic/media%2FGa0.jpg"
+    assert "<blockquote>" in quoted.description
+
+    assert broken.published is None
+
+
+def test_nitter_dates_keep_their_gmt_offset():
+    newest = parse_entries(NITTER)[-1]
+    local = entry_date(newest)
+    assert local.utcoffset() == timedelta(hours=-3)
+    assert local.replace(tzinfo=None) == datetime(2026, 10, 18, 18, 30)
+    assert entry_url(newest) == "https://x.com/Independiente/status/1979000000000000002"
+
+
+def test_parse_tweets_reads_the_html_of_each_entry():
+    tweets = parse_tweets(parse_entries(NITTER)[1:], {"name": "Independiente", "description": "El Rojo"})
+
+    quoted, newest = tweets
+    assert quoted["url"] == "https://x.com/Independiente/status/1979000000000000001"
+    assert quoted["description"] == "Citados para el partido de mañana 📋\n\n> **Liga Profesional (@LigaAFA)**\n> Se viene la fecha 14"
+    assert quoted["image_url"] == "https://pbs.twimg.com/media/Qt9.jpg"
+    assert newest["image_url"] == "https://pbs.twimg.com/media/Ga1.jpg"
+    assert newest["title"] == "El Rojo en Twitter"
+
+
+def test_atom_fields():
+    older, newest = parse_entries(YOUTUBE)
+
+    assert newest.link == "https://www.youtube.com/watch?v=vid002"
+    assert newest.title == "Resumen: Independiente 2-1 Racing"
+    assert newest.published == datetime(2026, 10, 18, 23, 10, tzinfo=timezone.utc)
+    assert newest.thumbnail == "https://i2.ytimg.com/vi/vid002/hqdefault.jpg"
+    assert newest.description == "Los goles del clásico."
+
+    # Sin rel explícito el link es el alternate; sin published vale updated; sin media, summary.
+    assert older.link == "https://www.youtube.com/watch?v=vid001"
+    assert older.published == datetime(2026, 10, 17, 18, 0, tzinfo=timezone(timedelta(hours=-3)))
+    assert older.thumbnail is None
+    assert older.description == "Habló el técnico."
+
+
+def test_youtube_parse_feed():
+    videos = parse_feed(YOUTUBE)
+    assert [video["link"] for video in videos] == [
+        "https://www.youtube.com/watch?v=vid001",
+        "https://www.youtube.com/watch?v=vid002",
+    ]
+    assert videos[-1]["thumbnail"] == "https://i2.ytimg.com/vi/vid002/hqdefault.jpg"
+    assert videos[-1]["summary"] == "Los goles del clásico."
+
+
+def test_truncated_feed_keeps_the_entries_read_so_far():
+    cut = NITTER[:NITTER.index(b"<title>Tuit con fecha rota")]
+    assert [entry.title for entry in parse_entries(cut)] == [
+        "Citados para el partido de mañana 📋",
+        "¡Mañana se juega! Todos a la Doble Visera 🔴",
+    ]
+
+
+def test_empty_or_invalid_content():
+    assert parse_entries(b"") == []
+    assert parse_entries(b"<html><body>503 Service Unavailable</body></html>") == []
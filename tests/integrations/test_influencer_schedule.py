@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from config.settings import settings
+from integrations.utils import influencer_schedule
+from integrations.utils.influencer_schedule import FREQUENCY_WINDOW, InfluencerSchedule, PollingProfile, posting_gap
+from models.influencer import AttentionLevel
+
+PROFILE = PollingProfile(
+    high=timedelta(hours=1),
+    low=timedelta(hours=4),
+    minimum=timedelta(minutes=10),
+    maximum=timedelta(hours=6),
+)
+NOON = datetime(2026, 10, 18, 12, 0, tzinfo=settings.TIMEZONE)
+THREE_AM = datetime(2026, 10, 18, 3, 0, tzinfo=settings.TIMEZONE)
+
+
+@pytest.fixture(autouse=True)
+def no_randomness(monkeypatch):
+    # Sin jitter: uniform devuelve el punto medio y las cuentas nuevas arrancan ya vencidas.
+    monkeypatch.setattr(influencer_schedule, "random", SimpleNamespace(random=lambda: 0.0, uniform=lambda a, b: (a + b) / 2))
+
+
+def influencer(name: str, attention: AttentionLevel = AttentionLevel.HIGH) -> dict:
+    return {"name": name, "attention": attention}
+
+
+def test_posting_gap_without_posts():
+    assert posting_gap([], NOON) is None
+
+
+def test_posting_gap_is_the_average_between_recent_posts():
+    posts = [NOON - timedelta(hours=hours) for hours in (1, 3, 5, 7)]
+    assert posting_gap(posts, NOON) == timedelta(hours=2)
+
+
+def test_posting_gap_grows_with_silence():
+    posts = [NOON - timedelta(days=5), NOON - timedelta(days=5, hours=2)]
+    assert posting_gap(posts, NOON) == timedelta(days=5)
+
+
+def test_posting_gap_with_a_single_recent_post_assumes_a_slow_account():
+    assert posting_gap([NOON - timedelta(hours=1)], NOON) == FREQUENCY_WINDOW / 4
+    assert posting_gap([NOON - timedelta(days=60)], NOON) == timedelta(days=60)
+
+
+def test_interval_without_data_is_the_attention_base():
+    schedule = InfluencerSchedule(PROFILE)
+    assert schedule.interval(AttentionLevel.HIGH, None) == PROFILE.high
+    assert schedule.interval(AttentionLevel.LOW, None) == PROFILE.low
+
+
+def test_interval_is_the_geometric_mean_with_the_posting_frequency():
+    schedule = InfluencerSchedule(PROFILE)
+    # Publica cada 12h -> conviene mirar cada 4h; con base 1h la media geométrica es 2h.
+    assert schedule.interval(AttentionLevel.HIGH, timedelta(hours=12)) == timedelta(hours=2)
+
+
+def test_interval_is_clamped_to_the_profile_limits():
+    schedule = InfluencerSchedule(PROFILE)
+    assert schedule.interval(AttentionLevel.HIGH, timedelta(minutes=3)) == PROFILE.minimum
+    assert schedule.interval(AttentionLevel.LOW, timedelta(days=30)) == PROFILE.maximum
+
+
+def test_due_returns_overdue_accounts_most_late_first():
+    schedule = InfluencerSchedule(PROFILE)
+    accounts = [influencer("a"), influencer("b")]
+    assert [account["name"] for account in schedule.due(accounts, NOON)] == ["a", "b"]
+
+    schedule.reschedule(accounts[0], NOON, [NOON - timedelta(hours=12), NOON - timedelta(hours=24)])
+    schedule.reschedule(accounts[1], NOON)
+    assert schedule.due(accounts, NOON + timedelta(minutes=59)) == []
+    assert [account["name"] for account in schedule.due(accounts, NOON + timedelta(hours=3))] == ["b", "a"]
+
+
+def test_due_drops_removed_accounts():
+    schedule = InfluencerSchedule(PROFILE)
+    schedule.due([influencer("a"), influencer("b")], NOON)
+    schedule.reschedule(influencer("a"), NOON)
+    schedule.reschedule(influencer("b"), NOON)
+
+    assert [account["name"] for account in schedule.due([influencer("b")], NOON + timedelta(hours=2))] == ["b"]
+
+
+def test_reschedule_keeps_the_previous_estimate_when_there_is_no_new_data():
+    schedule = InfluencerSchedule(PROFILE)
+    account = influencer("a")
+    first = schedule.reschedule(account, NOON, [NOON - timedelta(hours=12), NOON - timedelta(hours=24)])
+    second = schedule.reschedule(account, NOON, None)
+    assert first == second == NOON + timedelta(hours=2)
+
+
+def test_quiet_hours_stretch_the_interval():
+    schedule = InfluencerSchedule(PROFILE)
+    assert schedule.reschedule(influencer("a"), THREE_AM) == THREE_AM + 3 * PROFILE.high
+    # Nunca más allá del máximo del perfil.
+    assert schedule.reschedule(influencer("b", AttentionLevel.LOW), THREE_AM) == THREE_AM + PROFILE.maximum
+
+
+def test_without_quiet_factor_accounts_wait_until_quiet_hours_end():
+    profile = PollingProfile(high=timedelta(hours=1), low=timedelta(hours=8), minimum=timedelta(minutes=45),
+                             maximum=timedelta(hours=24), quiet_factor=None)
+    schedule = InfluencerSchedule(profile)
+    account = influencer("a")
+    assert schedule.due([account], THREE_AM) == []
+
+    at = schedule.reschedule(account, datetime(2026, 10, 18, 1, 30, tzinfo=settings.TIMEZONE))
+    assert at == datetime(2026, 10, 18, 8, 5, tzinfo=settings.TIMEZONE)
@@ -0,0 +1,35 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Conjunto probabilístico de tamaño fijo. Nunca da falsos negativos, y mientras no se
+    pase de `capacity` elementos los falsos positivos quedan por debajo de `false_positive_rate`."""
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        if capacity <= 0 or not 0 < false_positive_rate < 1:
+            raise ValueError(f"Parámetros inválidos para el Bloom filter: capacity={capacity}, fp={false_positive_rate}")
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        # Double hashing (Kirsch-Mitzenmacher): k posiciones a partir de un solo digest.
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
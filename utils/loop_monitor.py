@@ -0,0 +1,53 @@
+import asyncio
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Mide cuánto tiempo queda trabado el event loop: duerme `interval` segundos y lo que
+    tarde de más en despertarse es tiempo en que algo bloqueó el loop (parseos, queries
+    sincrónicas, render de imágenes...). Guarda las trabas de la última `window` segundos."""
+
+    def __init__(self, interval: float = 0.25, stall_threshold: float = 0.1, window: float = 3600):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.window = window
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self._stalls: deque[tuple[float, float]] = deque()
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = loop.time() - expected
+            if lag < self.stall_threshold:
+                continue
+            now = time.monotonic()
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+            self._stalls.append((now, lag))
+            while self._stalls and self._stalls[0][0] < now - self.window:
+                self._stalls.popleft()
+            if lag >= 1:
+                logger.warning(f"El event loop estuvo bloqueado {lag:.2f}s")
+
+    def recent_stalls(self) -> tuple[int, float, float]:
+        """Cantidad de trabas, tiempo total bloqueado y peor traba dentro de la ventana."""
+        cutoff = time.monotonic() - self.window
+        recent = [lag for ts, lag in self._stalls if ts >= cutoff]
+        return len(recent), sum(recent), max(recent, default=0.0)
@@ -0,0 +1,29 @@
+import json
+import logging
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Un objeto JSON por línea: fácil de filtrar con jq o de cargar en cualquier lado."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_structured_log(path: str, max_bytes: int, backups: int, level: int = logging.INFO):
+    """Espeja todo el logging del proceso en un archivo JSON lines que rota por tamaño."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+    handler.setFormatter(JsonLinesFormatter())
+    handler.setLevel(level)
+    logging.getLogger().addHandler(handler)